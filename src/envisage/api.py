@@ -15,6 +15,7 @@ Interfaces
 ----------
 
 - :class:`~.IApplication`
+- :class:`~.IExtensionEventDispatcher`
 - :class:`~.IExtensionPoint`
 - :class:`~.IExtensionPointUser`
 - :class:`~.IExtensionProvider`
@@ -23,6 +24,8 @@ Interfaces
 - :class:`~.IPlugin`
 - :class:`~.IPluginActivator`
 - :class:`~.IPluginManager`
+- :class:`~.IProfiler`
+- :class:`~.IServiceMetrics`
 - :class:`~.IServiceRegistry`
 
 Constants
@@ -39,27 +42,46 @@ Constants
 Application, plugin and related classes
 ---------------------------------------
 - :class:`~.Application`
+- :class:`~.CallLaterEventDispatcher`
 - :class:`~.CorePlugin`
+- :class:`~.DeferredPluginActivator`
 - :class:`~.ExtensionPoint`
 - :class:`~.ExtensionPointBinding`
 - :func:`~.bind_extension_point`
+- :func:`~.get_extension_by_key`
 - :func:`~.unbind_extension_point`
+- :class:`~.EntryPointPluginManager`
 - :class:`~.ExtensionProvider`
 - :class:`~.ExtensionPointChangedEvent`
 - :class:`~.ImportManager`
+- :class:`~.LazyContribution`
+- :func:`~.materialize`
 - :class:`~.Plugin`
 - :class:`~.PluginActivator`
 - :class:`~.PluginExtensionRegistry`
 - :class:`~.PluginManager`
+- :class:`~.PluginManifest`
+- :class:`~.PluginFailure`
+- :class:`~.PluginReport`
+- :class:`~.PluginSupervisor`
+- :class:`~.ManifestPlugin`
+- :class:`~.Profiler`
+- :class:`~.NullProfiler`
 - :class:`~.ProviderExtensionRegistry`
 - :class:`~.Service`
+- :class:`~.SynchronousEventDispatcher`
+- :class:`~.ThreadEventDispatcher`
+- :class:`~.ServiceMetrics`
+- :class:`~.NullServiceMetrics`
 - :class:`~.ServiceOffer`
 - :class:`~.ServiceRegistry`
+- :class:`~.ServiceScope`
 
 Exceptions
 ----------
 
 - :class:`~.NoSuchServiceError`
+- :class:`~.PluginTimeoutError`
 - :class:`~.UnknownExtension`
 - :class:`~.UnknownExtensionPoint`
 
@@ -67,7 +89,14 @@ Exceptions
 
 from .application import Application
 from .core_plugin import CorePlugin
-from .extension_point import ExtensionPoint
+from .deferred_plugin_activator import DeferredPluginActivator
+from .entry_point_plugin_manager import EntryPointPluginManager
+from .extension_event_dispatcher import (
+    CallLaterEventDispatcher,
+    SynchronousEventDispatcher,
+    ThreadEventDispatcher,
+)
+from .extension_point import ExtensionPoint, get_extension_by_key
 from .extension_point_binding import (
     bind_extension_point,
     ExtensionPointBinding,
@@ -77,6 +106,7 @@ from .extension_point_changed_event import ExtensionPointChangedEvent
 from .extension_provider import ExtensionProvider
 from .extension_registry import ExtensionRegistry
 from .i_application import IApplication
+from .i_extension_event_dispatcher import IExtensionEventDispatcher
 from .i_extension_point import IExtensionPoint
 from .i_extension_point_user import IExtensionPointUser
 from .i_extension_provider import IExtensionProvider
@@ -85,6 +115,8 @@ from .i_import_manager import IImportManager
 from .i_plugin import IPlugin
 from .i_plugin_activator import IPluginActivator
 from .i_plugin_manager import IPluginManager
+from .i_profiler import IProfiler
+from .i_service_metrics import IServiceMetrics
 from .i_service_registry import IServiceRegistry
 from .ids import (
     BINDINGS,
@@ -97,13 +129,20 @@ from .ids import (
     TASKS,
 )
 from .import_manager import ImportManager
+from .lazy_contribution import LazyContribution, materialize
 from .plugin import Plugin
 from .plugin_activator import PluginActivator
 from .plugin_extension_registry import PluginExtensionRegistry
 from .plugin_manager import PluginManager
+from .plugin_manifest import ManifestPlugin, PluginManifest
+from .plugin_report import PluginFailure, PluginReport
+from .plugin_supervisor import PluginSupervisor, PluginTimeoutError
+from .profiler import NullProfiler, Profiler
 from .provider_extension_registry import ProviderExtensionRegistry
 from .service import Service
+from .service_metrics import NullServiceMetrics, ServiceMetrics
 from .service_offer import ServiceOffer
 from .service_registry import NoSuchServiceError, ServiceRegistry
+from .service_scope import ServiceScope
 from .unknown_extension import UnknownExtension
 from .unknown_extension_point import UnknownExtensionPoint
@@ -38,8 +38,11 @@ from .i_application import IApplication
 from .i_extension_registry import IExtensionRegistry
 from .i_import_manager import IImportManager
 from .i_plugin_manager import IPluginManager
+from .i_profiler import IProfiler
 from .i_service_registry import IServiceRegistry
 from .import_manager import ImportManager
+from .plugin_report import PluginReport
+from .profiler import NullProfiler
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -111,6 +114,14 @@ class Application(HasTraits):
     #: The service registry.
     service_registry = Instance(IServiceRegistry)
 
+    #: The profiler that records how long the application takes to start and
+    #: stop. It is shared with the extension registry, plugin manager and
+    #: service registry (if they have a 'profiler' trait) so that starting
+    #: plugins, reading extension points for the first time, creating
+    #: services and loading preferences are recorded too. By default nothing
+    #: is recorded.
+    profiler = Instance(IProfiler, factory=NullProfiler)
+
     #### Private interface ####################################################
 
     # The import manager.
@@ -234,6 +245,23 @@ class Application(HasTraits):
 
         self.extension_registry.set_extensions(extension_point_id, extensions)
 
+    ###########################################################################
+    # 'ExtensionRegistry' interface.
+    ###########################################################################
+
+    def get_generation(self, extension_point_id):
+        """Return the generation of the extensions to an extension point.
+
+        Return None if the extension registry doesn't keep track of them.
+
+        """
+
+        get_generation = getattr(self.extension_registry, "get_generation", None)
+        if get_generation is None:
+            return None
+
+        return get_generation(extension_point_id)
+
     ###########################################################################
     # 'IImportManager' interface.
     ###########################################################################
@@ -270,7 +298,10 @@ class Application(HasTraits):
     def start(self):
         """Start the plugin manager.
 
-        Returns True unless the start was vetoed.
+        Returns a 'PluginReport', which is true unless the start was vetoed,
+        of the plugins that failed to start (plugins only fail to start
+        without the start being aborted if the plugin manager's supervisor
+        says so).
 
         """
 
@@ -279,22 +310,25 @@ class Application(HasTraits):
         # hence doesn't have a return value.
         logger.debug("---------- application starting ----------")
 
-        # Lifecycle event.
-        self.starting = event = self._create_application_event()
-        if not event.veto:
-            # Start the plugin manager (this starts all of the manager's
-            # plugins).
-            self.plugin_manager.start()
-
+        with self.profiler.span("application.start"):
             # Lifecycle event.
-            self.started = self._create_application_event()
+            self.starting = event = self._create_application_event()
+            if not event.veto:
+                # Start the plugin manager (this starts all of the manager's
+                # plugins).
+                report = self._get_report(self.plugin_manager.start())
+
+                # Lifecycle event.
+                self.started = self._create_application_event()
+
+                logger.debug("---------- application started ----------")
 
-            logger.debug("---------- application started ----------")
+            else:
+                report = PluginReport(vetoed=True)
 
-        else:
-            logger.debug("---------- application start vetoed ----------")
+                logger.debug("---------- application start vetoed ----------")
 
-        return not event.veto
+        return report
 
     def start_plugin(self, plugin=None, plugin_id=None):
         """Start the specified plugin."""
@@ -304,7 +338,8 @@ class Application(HasTraits):
     def stop(self):
         """Stop the plugin manager.
 
-        Returns True unless the stop was vetoed.
+        Returns a 'PluginReport', which is true unless the stop was vetoed,
+        of the plugins that failed to stop.
 
         """
 
@@ -313,25 +348,28 @@ class Application(HasTraits):
         # hence doesn't have a return value.
         logger.debug("---------- application stopping ----------")
 
-        # Lifecycle event.
-        self.stopping = event = self._create_application_event()
-        if not event.veto:
-            # Stop the plugin manager (this stops all of the manager's
-            # plugins).
-            self.plugin_manager.stop()
+        with self.profiler.span("application.stop"):
+            # Lifecycle event.
+            self.stopping = event = self._create_application_event()
+            if not event.veto:
+                # Stop the plugin manager (this stops all of the manager's
+                # plugins).
+                report = self._get_report(self.plugin_manager.stop())
 
-            # Save all preferences.
-            self.preferences.save()
+                # Save all preferences.
+                self.preferences.save()
 
-            # Lifecycle event.
-            self.stopped = self._create_application_event()
+                # Lifecycle event.
+                self.stopped = self._create_application_event()
 
-            logger.debug("---------- application stopped ----------")
+                logger.debug("---------- application stopped ----------")
 
-        else:
-            logger.debug("---------- application stop vetoed ----------")
+            else:
+                report = PluginReport(vetoed=True)
 
-        return not event.veto
+                logger.debug("---------- application stop vetoed ----------")
+
+        return report
 
     def stop_plugin(self, plugin=None, plugin_id=None):
         """Stop the specified plugin."""
@@ -342,6 +380,29 @@ class Application(HasTraits):
     # 'IServiceRegistry' interface.
     ###########################################################################
 
+    async def aget_service(self, protocol, query="", minimize="", maximize=""):
+        """Return at most one service that matches the specified query."""
+
+        service = await self.service_registry.aget_service(
+            protocol, query, minimize, maximize
+        )
+
+        return service
+
+    async def aget_services(self, protocol, query="", minimize="", maximize=""):
+        """Return all services that match the specified query."""
+
+        services = await self.service_registry.aget_services(
+            protocol, query, minimize, maximize
+        )
+
+        return services
+
+    def create_scope(self):
+        """Create a scope for the services with a 'scoped' lifetime."""
+
+        return self.service_registry.create_scope()
+
     def get_required_service(self, protocol, query="", minimize="", maximize=""):
         """Return the service that matches the specified query.
 
@@ -381,13 +442,22 @@ class Application(HasTraits):
 
         return services
 
-    def register_service(self, protocol, obj, properties=None):
+    def register_service(
+        self, protocol, obj, properties=None, lifetime="singleton", dispose=None
+    ):
         """Register a service."""
 
-        service_id = self.service_registry.register_service(protocol, obj, properties)
+        service_id = self.service_registry.register_service(
+            protocol, obj, properties, lifetime, dispose
+        )
 
         return service_id
 
+    def resolve_service(self, service_id):
+        """Return the service with the specified id, creating it if need be."""
+
+        return self.service_registry.resolve_service(service_id)
+
     def set_service_properties(self, service_id, properties):
         """Set the dictionary of properties associated with a service."""
 
@@ -412,7 +482,7 @@ class Application(HasTraits):
         # to override it!
         from .plugin_extension_registry import PluginExtensionRegistry
 
-        return PluginExtensionRegistry(plugin_manager=self)
+        return PluginExtensionRegistry(plugin_manager=self, profiler=self.profiler)
 
     def _plugin_manager_default(self):
         """Trait initializer."""
@@ -422,7 +492,7 @@ class Application(HasTraits):
         # to override it!
         from .plugin_manager import PluginManager
 
-        return PluginManager(application=self)
+        return PluginManager(application=self, profiler=self.profiler)
 
     def _service_registry_default(self):
         """Trait initializer."""
@@ -432,7 +502,9 @@ class Application(HasTraits):
         # to override it!
         from .service_registry import ServiceRegistry
 
-        return ServiceRegistry()
+        return ServiceRegistry(
+            import_manager=self._import_manager, profiler=self.profiler
+        )
 
     ###########################################################################
     # Private interface.
@@ -468,6 +540,22 @@ class Application(HasTraits):
         if new is not None:
             new.application = self
 
+    @observe("profiler")
+    def _update_component_profilers(self, event):
+        """Static trait change handler."""
+
+        for name in ("extension_registry", "plugin_manager", "service_registry"):
+            self._share_profiler(getattr(self, name))
+
+    @observe("extension_registry,plugin_manager,service_registry")
+    def _update_component_profiler(self, event):
+        """Static trait change handler."""
+
+        # Components that were given a profiler of their own keep it unless
+        # the application has one too.
+        if not isinstance(self.profiler, NullProfiler):
+            self._share_profiler(event.new)
+
     #### Methods ##############################################################
 
     def _create_application_event(self):
@@ -475,8 +563,35 @@ class Application(HasTraits):
 
         return ApplicationEvent(application=self)
 
+    def _get_report(self, report):
+        """Return the report returned by the plugin manager's start or stop.
+
+        Plugin managers that don't implement 'PluginManager' may not return a
+        report.
+
+        """
+
+        if not isinstance(report, PluginReport):
+            report = PluginReport()
+
+        for failure in report.failures:
+            logger.error(
+                "plugin %s failed to %s",
+                failure.plugin.id,
+                failure.action,
+                exc_info=failure.error,
+            )
+
+        return report
+
     def _initialize_application_home(self):
         """Initialize the application directories."""
 
         os.makedirs(self.home, mode=0o700, exist_ok=True)
         os.makedirs(self.user_data, exist_ok=True)
+
+    def _share_profiler(self, component):
+        """Share the application's profiler with a component (if it has one)."""
+
+        if component is not None and component.trait("profiler") is not None:
+            component.profiler = self.profiler
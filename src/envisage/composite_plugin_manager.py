@@ -14,21 +14,29 @@ import logging
 
 # Enthought library imports.
 from traits.api import (
+    Any,
     Event,
     HasTraits,
     Instance,
+    Int,
     List,
     observe,
     on_trait_change,
     provides,
+    Set,
 )
 
 # Local imports.
 from .i_application import IApplication
 from .i_plugin import IPlugin
 from .i_plugin_manager import IPluginManager
+from .i_profiler import IProfiler
+from .plugin_dependencies import sort_plugins
 from .plugin_event import PluginEvent
 from .plugin_manager import PluginManager
+from .plugin_report import PluginReport
+from .plugin_supervisor import PluginSupervisor, PluginTimeoutError
+from .profiler import NullProfiler
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -70,6 +78,22 @@ class CompositePluginManager(HasTraits):
         for plugin_manager in self.plugin_managers:
             plugin_manager.application = new
 
+    # The maximum number of plugins that are started at the same time (by a
+    # pool of threads). Plugins are only started once the plugins that they
+    # require have been, even if they are in different plugin managers. By
+    # default plugins are started one at a time.
+    max_workers = Int(1)
+
+    # The profiler that records how long each plugin takes to start and stop
+    # (the application's, if the plugin manager is the application's). By
+    # default nothing is recorded.
+    profiler = Instance(IProfiler, factory=NullProfiler)
+
+    # Supervises starting and stopping the plugins (timeouts and what to do if
+    # a plugin fails). By default the first exception raised by a plugin
+    # aborts the start (or stop).
+    supervisor = Instance(PluginSupervisor, factory=PluginSupervisor)
+
     # The plugin managers that make up this plugin manager!
     #
     # This is currently a list of 'PluginManager's as opposed to, the more
@@ -86,12 +110,16 @@ class CompositePluginManager(HasTraits):
         for plugin_manager in added:
             plugin_manager.application = self.application
 
+        self._plugins_by_id = None
+
     @on_trait_change("plugin_managers:plugin_added")
     def _plugin_added(self, obj, trait_name, old, new):
+        self._plugins_by_id = None
         self.plugin_added = new
 
     @on_trait_change("plugin_managers:plugin_removed")
     def _plugin_removed(self, obj, trait_name, old, new):
+        self._plugins_by_id = None
         self.plugin_removed = new
 
     #### Private protocol #####################################################
@@ -107,6 +135,34 @@ class CompositePluginManager(HasTraits):
 
         return plugins
 
+    # The plugins of all of the plugin managers indexed by Id (built when it
+    # is first needed, by merging the plugin managers' indexes).
+    #
+    # { plugin_id : plugin }
+    _plugins_by_id = Any
+
+    # The plugins that failed to start (other than by timing out), or weren't
+    # started because a plugin they require failed, when the manager was last
+    # started.
+    _failed_plugins = Set
+
+    def _get_plugins_by_id(self):
+        """Return the plugins indexed by Id."""
+
+        plugins_by_id = self._plugins_by_id
+        if plugins_by_id is None:
+            plugins_by_id = {}
+            for plugin_manager in self.plugin_managers:
+                for plugin_id, plugin in plugin_manager._get_plugins_by_id().items():
+                    if plugins_by_id.setdefault(plugin_id, plugin) is not plugin:
+                        logger.warning(
+                            "more than one plugin has the Id <%s>", plugin_id
+                        )
+
+            self._plugins_by_id = plugins_by_id
+
+        return plugins_by_id
+
     #### 'object' protocol ####################################################
 
     def __iter__(self):
@@ -127,16 +183,13 @@ class CompositePluginManager(HasTraits):
         raise NotImplementedError
 
     def get_plugin(self, plugin_id):
-        """Return the plugin with the specified Id."""
+        """Return the plugin with the specified Id.
 
-        for plugin in self:
-            if plugin_id == plugin.id:
-                break
+        If more than one plugin has the Id then the first one is returned.
 
-        else:
-            plugin = None
+        """
 
-        return plugin
+        return self._get_plugins_by_id().get(plugin_id)
 
     def remove_plugin(self, plugin):
         """Remove a plugin from the manager."""
@@ -144,10 +197,25 @@ class CompositePluginManager(HasTraits):
         raise NotImplementedError
 
     def start(self):
-        """Start the plugin manager."""
+        """Start the plugin manager.
+
+        Plugins are started after the plugins that they require, and
+        otherwise in the order of their plugin managers.
+
+        Return a 'PluginReport' of the plugins that failed to start.
+
+        """
 
-        for plugin in self:
-            self.start_plugin(plugin)
+        failures = self.supervisor.start_plugins(
+            self.start_plugin, self, self.max_workers, self.stop_plugin
+        )
+        self._failed_plugins = {
+            failure.plugin
+            for failure in failures
+            if not isinstance(failure.error, PluginTimeoutError)
+        }
+
+        return PluginReport(failures=failures)
 
     def start_plugin(self, plugin=None, plugin_id=None):
         """Start the specified plugin."""
@@ -155,21 +223,34 @@ class CompositePluginManager(HasTraits):
         plugin = plugin or self.get_plugin(plugin_id)
         if plugin is not None:
             logger.debug("plugin %s starting", plugin.id)
-            plugin.activator.start_plugin(plugin)
+            with self.profiler.span("plugin.start", plugin=plugin.id):
+                plugin.activator.start_plugin(plugin)
             logger.debug("plugin %s started", plugin.id)
 
         else:
             raise ValueError("no such plugin %s" % plugin_id)
 
     def stop(self):
-        """Stop the plugin manager."""
+        """Stop the plugin manager.
+
+        Return a 'PluginReport' of the plugins that failed to stop.
+
+        """
+
+        # We stop the plugins in the reverse order that they were started,
+        # except for those that failed to start (or weren't started because a
+        # plugin they require failed). Plugins that timed out are stopped, as
+        # they may have finished starting since.
+        stop_order = [
+            plugin
+            for plugin in reversed(sort_plugins(self))
+            if plugin not in self._failed_plugins
+        ]
+        self._failed_plugins = set()
 
-        # We stop the plugins in the reverse order that they were started.
-        stop_order = list(iter(self))
-        stop_order.reverse()
+        failures = self.supervisor.stop_plugins(self.stop_plugin, stop_order)
 
-        for plugin in stop_order:
-            self.stop_plugin(plugin)
+        return PluginReport(failures=failures)
 
     def stop_plugin(self, plugin=None, plugin_id=None):
         """Stop the specified plugin."""
@@ -177,7 +258,8 @@ class CompositePluginManager(HasTraits):
         plugin = plugin or self.get_plugin(plugin_id)
         if plugin is not None:
             logger.debug("plugin %s stopping", plugin.id)
-            plugin.activator.stop_plugin(plugin)
+            with self.profiler.span("plugin.stop", plugin=plugin.id):
+                plugin.activator.stop_plugin(plugin)
             logger.debug("plugin %s stopped", plugin.id)
 
         else:
@@ -9,15 +9,23 @@
 # Thanks for using Enthought open source!
 """The Envisage core plugin."""
 
+# Standard library imports.
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 
-from traits.api import List, on_trait_change, Str
-
 # Enthought library imports.
+from traits.api import Any, Bool, List, on_trait_change, Str
+
 from envisage.extension_point import ExtensionPoint
 from envisage.plugin import Plugin
+from envisage.profiler import NullProfiler
 from envisage.service_offer import ServiceOffer
 
+# Logging.
+logger = logging.getLogger(__name__)
+
 
 class CorePlugin(Plugin):
     """The Envisage core plugin.
@@ -124,7 +132,16 @@ class CorePlugin(Plugin):
 
         """
         for service in event.added:
-            self._register_service_offer(service)
+            service_id = self._register_service_offer(service)
+
+            # If the application has already started then pre-warm the service
+            # straight away, otherwise wait until it has.
+            if self._is_warm(service):
+                if self._application_started:
+                    self._warm_services([service_id])
+
+                else:
+                    self._warm_service_ids.append(service_id)
 
     #### Contributions to extension points made by this plugin ################
 
@@ -135,6 +152,18 @@ class CorePlugin(Plugin):
     # The Ids of the services that were registered when the plugin started.
     _service_ids = List
 
+    # Whether the application has started (and so services are pre-warmed as
+    # soon as they are offered).
+    _application_started = Bool(False)
+
+    # The Ids of the services that are to be pre-warmed once the application
+    # has started.
+    _warm_service_ids = List
+
+    # The thread pool that pre-warms services (created when the application
+    # has started, if there are any services to pre-warm).
+    _warm_executor = Any
+
     ###########################################################################
     # 'IPlugin' interface.
     ###########################################################################
@@ -147,21 +176,54 @@ class CorePlugin(Plugin):
 
         # Register all service offers. These services are unregistered again
         # when the plugin is stopped.
-        self._service_ids = self._register_service_offers(self.service_offers)
+        service_offers = self.service_offers
+        self._service_ids = self._register_service_offers(service_offers)
+
+        # Remember the services that are to be pre-warmed once the application
+        # has started.
+        self._warm_service_ids = [
+            service_id
+            for service_id, service_offer in zip(self._service_ids, service_offers)
+            if self._is_warm(service_offer)
+        ]
 
     def stop(self):
         """Stop the plugin."""
 
+        # Stop pre-warming services (waiting for any that are being created,
+        # so that they are disposed of when they are unregistered).
+        if self._warm_executor is not None:
+            self._warm_executor.shutdown(wait=True, cancel_futures=True)
+            self._warm_executor = None
+
         # Unregister all service offers.
         self._unregister_service_offers(self._service_ids)
 
         # Just in case the plugin is started again!
         self._service_ids = []
+        self._warm_service_ids = []
+        self._application_started = False
 
     ###########################################################################
     # Private interface.
     ###########################################################################
 
+    #### Trait change handlers ################################################
+
+    @on_trait_change("application:started")
+    def _warm_service_offers(self):
+        """Dynamic trait change handler."""
+
+        self._application_started = True
+        self._warm_services(self._warm_service_ids)
+
+    #### Methods ##############################################################
+
+    def _is_warm(self, service_offer):
+        """Is a service offer's service to be pre-warmed?"""
+
+        return service_offer.warm and service_offer.lifetime == "singleton"
+
     def _load_preferences(self, preferences):
         """Load all contributed preferences into a preferences node."""
 
@@ -175,11 +237,16 @@ class CorePlugin(Plugin):
         # is exactly what happens in the preferences UI.
         default = self.application.preferences.node("default/")
 
+        # Applications that don't implement 'Application' may not have a
+        # profiler.
+        profiler = getattr(self.application, "profiler", None) or NullProfiler()
+
         # The resource manager is used to find the preferences files.
         resource_manager = ResourceManager()
         for resource_name in preferences:
-            with closing(resource_manager.file(resource_name)) as f:
-                default.load(f)
+            with profiler.span("preferences.load", resource=resource_name):
+                with closing(resource_manager.file(resource_name)) as f:
+                    default.load(f)
 
     def _register_service_offers(self, service_offers):
         """Register a list of service offers."""
@@ -193,6 +260,8 @@ class CorePlugin(Plugin):
             protocol=service_offer.protocol,
             obj=service_offer.factory,
             properties=service_offer.properties,
+            lifetime=service_offer.lifetime,
+            dispose=service_offer.dispose,
         )
 
         return service_id
@@ -210,3 +279,46 @@ class CorePlugin(Plugin):
                 pass
             else:
                 self.application.unregister_service(service_id)
+
+    def _warm_service(self, service_id):
+        """Create a service ahead of the first lookup that needs it."""
+
+        start = time.perf_counter()
+        try:
+            service = self.application.resolve_service(service_id)
+
+        except ValueError:
+            # The service was unregistered before we got to it.
+            return
+
+        except Exception:
+            logger.exception("error pre-warming service <%d>", service_id)
+            return
+
+        if service is not None:
+            logger.info(
+                "service <%d> pre-warmed in %.3fs",
+                service_id,
+                time.perf_counter() - start,
+            )
+
+    def _warm_services(self, service_ids):
+        """Create services in the background.
+
+        The services are submitted to the thread pool in the order in which
+        they were registered. A service factory that looks up another service
+        creates it (or waits for the thread that is already creating it), so
+        the services that others depend on are always created first.
+
+        """
+
+        if len(service_ids) == 0:
+            return
+
+        if self._warm_executor is None:
+            self._warm_executor = ThreadPoolExecutor(
+                thread_name_prefix="envisage-service-warmer"
+            )
+
+        for service_id in service_ids:
+            self._warm_executor.submit(self._warm_service, service_id)
@@ -0,0 +1,160 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""A plugin activator that can start plugins when they are first used."""
+
+# Standard library imports.
+import functools
+import logging
+import threading
+import weakref
+
+# Enthought library imports.
+from traits.api import Any
+
+# Local imports.
+from .plugin_activator import PluginActivator
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+class DeferredPluginActivator(PluginActivator):
+    """A plugin activator that can start plugins when they are first used.
+
+    Plugins are started according to their 'activation' policy:
+
+    'eager'
+        The plugin is started straight away.
+
+    'lazy_on_service'
+        The plugin is started the first time that any of the protocols that
+        it 'provides' is looked up in the service registry (before the
+        lookup, so the lookup finds the services that the plugin registers
+        when it starts).
+
+    'lazy_on_extension_point'
+        The plugin is started the first time that the extensions to any of
+        the extension points that it offers are got from the extension
+        registry.
+
+    A plugin that hasn't been started when it is stopped isn't stopped
+    either.
+
+    """
+
+    #### Private interface ####################################################
+
+    # The lock that guards the plugins waiting to be started.
+    _lock = Any
+
+    # The plugins that are waiting to be started.
+    _waiting = Any
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._lock = threading.Lock()
+        self._waiting = weakref.WeakSet()
+
+    ###########################################################################
+    # 'IPluginActivator' interface.
+    ###########################################################################
+
+    def start_plugin(self, plugin):
+        """Start the specified plugin."""
+
+        triggers = self._get_triggers(plugin)
+        if len(triggers) == 0:
+            super().start_plugin(plugin)
+            return
+
+        with self._lock:
+            self._waiting.add(plugin)
+
+        for registry, key in triggers:
+            registry.call_on_lookup(key, functools.partial(self._activate, plugin))
+
+        logger.debug("plugin %s will be started when it is first used", plugin.id)
+
+    def stop_plugin(self, plugin):
+        """Stop the specified plugin."""
+
+        with self._lock:
+            waiting = plugin in self._waiting
+            self._waiting.discard(plugin)
+
+        if not waiting:
+            super().stop_plugin(plugin)
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _activate(self, plugin):
+        """Start a plugin that is waiting to be used (if it still is)."""
+
+        with self._lock:
+            if plugin not in self._waiting:
+                return
+
+            self._waiting.discard(plugin)
+
+        logger.debug("plugin %s first used", plugin.id)
+        super().start_plugin(plugin)
+
+    def _get_triggers(self, plugin):
+        """Return the lookups that should start a plugin.
+
+        Return a list of (registry, key) tuples, which is empty if the plugin
+        should be started straight away.
+
+        """
+
+        application = plugin.application
+        if plugin.activation == "eager" or application is None:
+            return []
+
+        if plugin.activation == "lazy_on_service":
+            registry = application.service_registry
+            keys = plugin.provides
+
+        else:
+            registry = application.extension_registry
+            keys = [
+                extension_point.id for extension_point in plugin.get_extension_points()
+            ]
+
+        # Registries that aren't the standard ones may not be able to tell us
+        # when they are used.
+        if getattr(registry, "call_on_lookup", None) is None:
+            logger.warning(
+                "plugin %s can't be started on first use (%s), as %r doesn't "
+                "support it - starting it now",
+                plugin.id,
+                plugin.activation,
+                registry,
+            )
+            return []
+
+        if len(keys) == 0:
+            logger.warning(
+                "plugin %s can't be started on first use (%s), as it has "
+                "nothing to use - starting it now",
+                plugin.id,
+                plugin.activation,
+            )
+
+        return [(registry, key) for key in keys]
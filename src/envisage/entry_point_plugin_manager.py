@@ -0,0 +1,289 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""A plugin manager that finds plugins via entry points."""
+
+# Standard library imports.
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import re
+import sys
+
+# Enthought library imports.
+from traits.api import List, Str
+
+# Local imports.
+from .plugin_manager import PluginManager
+from .plugin_manifest import ManifestPlugin, PluginManifest
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+#: The entry point group that plugins are registered in.
+PLUGINS_GROUP = "envisage.plugins"
+
+# The suffixes of the directories that contain the metadata of installed
+# distributions.
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+class EntryPointPluginManager(PluginManager):
+    """A plugin manager that finds plugins via entry points.
+
+    Distributions register plugins under the 'envisage.plugins' entry point
+    group, using the plugin Id as the entry point name, e.g. in
+    'pyproject.toml'::
+
+        [project.entry-points.'envisage.plugins']
+        'acme.foo' = 'acme.foo.foo_plugin:FooPlugin'
+
+    Each plugin is represented by a 'ManifestPlugin', so the actual plugin is
+    only imported when one of its contributions is requested (or when it is
+    started, if it does its own work in 'start').
+
+    Without a cache, each plugin class is imported to generate its manifest
+    when the manifest is first needed. In an 'Application' that is when it
+    starts (the plugins are ordered by their requirements, and asked which
+    extension points they offer), so this only defers the imports from the
+    creation of the plugin manager to the start of the application.
+
+    If a 'cache_filename' is given, then the manifests are generated up front
+    and saved to it along with the entry points. Later launches use the
+    cache without importing any plugins or reading any distribution
+    metadata, until a distribution is installed, removed or upgraded (which
+    is noticed from the modification times of the 'sys.path' entries and of
+    the distribution metadata directories in them), or the module of a
+    cached plugin is edited.
+
+    """
+
+    #### 'EntryPointPluginManager' interface ##################################
+
+    #: The entry point group that plugins are registered in.
+    group = Str(PLUGINS_GROUP)
+
+    #: Regular expressions matched against plugin Ids (entry point names). If
+    #: any are given, then only plugins that match at least one of them are
+    #: included.
+    include = List(Str)
+
+    #: Regular expressions matched against plugin Ids (entry point names).
+    #: Plugins that match any of them are excluded.
+    exclude = List(Str)
+
+    #: The name of the file that discovered plugins are cached in (no cache is
+    #: used if this is empty).
+    cache_filename = Str
+
+    ###########################################################################
+    # Protected 'PluginManager' interface.
+    ###########################################################################
+
+    def __plugins_default(self):
+        """Trait initializer."""
+
+        if not self.cache_filename:
+            return [
+                ManifestPlugin(id=entry_point.name, plugin_class=entry_point.value)
+                for entry_point in importlib.metadata.entry_points(group=self.group)
+                if self._is_included(entry_point.name)
+            ]
+
+        fingerprint = self._get_fingerprint()
+        cache = self._load_cache(fingerprint)
+        if cache is None:
+            cache = {
+                "fingerprint": fingerprint,
+                "entry_points": [
+                    {"name": entry_point.name, "value": entry_point.value}
+                    for entry_point in importlib.metadata.entry_points(group=self.group)
+                ],
+            }
+            changed = True
+
+        else:
+            changed = False
+
+        plugins = []
+        for entry in cache["entry_points"]:
+            if not self._is_included(entry["name"]):
+                continue
+
+            if "manifest" not in entry or not _is_source_current(entry):
+                manifest, source = self._create_manifest(entry["name"], entry["value"])
+                if manifest is None:
+                    continue
+
+                entry["manifest"] = manifest.trait_get()
+                entry["source"] = source
+                changed = True
+
+            plugins.append(PluginManifest(**entry["manifest"]).create_plugin())
+
+        if changed:
+            self._save_cache(cache)
+
+        return plugins
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _create_manifest(self, name, value):
+        """Create the manifest of the plugin registered by an entry point.
+
+        Return a tuple containing the manifest and the source of the plugin
+        (see '_get_source'), or (None, None) if the plugin can't be imported.
+
+        """
+
+        entry_point = importlib.metadata.EntryPoint(
+            name=name, value=value, group=self.group
+        )
+        try:
+            klass = entry_point.load()
+
+            # If the plugin computes any of the traits in its manifest, then
+            # it is created to find out what they are (except for its Id,
+            # which is the entry point name).
+            manifest = PluginManifest.from_plugin_class(
+                klass, instantiate=True, id=name
+            )
+
+        except Exception:
+            logger.exception("error loading plugin %s", name)
+            return None, None
+
+        return manifest, _get_source(klass)
+
+    def _get_fingerprint(self):
+        """Return a fingerprint of the installed distributions.
+
+        The fingerprint changes whenever a distribution is installed,
+        removed or upgraded. Reading the metadata of every distribution would
+        take as long as finding the plugins without a cache, so only the
+        modification times of the 'sys.path' entries, and of the
+        distribution metadata directories in them, are used.
+
+        """
+
+        digest = hashlib.sha1(self.group.encode("utf-8"))
+        for path in sys.path:
+            for name, mtime in _get_mtimes(path):
+                digest.update(("%s\0%s\0" % (name, mtime)).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def _is_included(self, plugin_id):
+        """Return True if a plugin is included by the filters."""
+
+        if self.include and not any(
+            re.match(pattern, plugin_id) for pattern in self.include
+        ):
+            return False
+
+        return not any(re.match(pattern, plugin_id) for pattern in self.exclude)
+
+    def _load_cache(self, fingerprint):
+        """Return the cache, or None if it is missing or out of date."""
+
+        if not self.cache_filename:
+            return None
+
+        try:
+            with open(self.cache_filename, encoding="utf-8") as f:
+                cache = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("fingerprint") != fingerprint:
+            logger.debug("plugin cache %s is out of date", self.cache_filename)
+            return None
+
+        return cache
+
+    def _save_cache(self, cache):
+        """Save the cache (if there is one)."""
+
+        if not self.cache_filename:
+            return
+
+        try:
+            with open(self.cache_filename, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=4)
+
+        except OSError:
+            logger.exception("error saving plugin cache %s", self.cache_filename)
+
+
+def _get_mtimes(path):
+    """Return the modification times of a 'sys.path' entry and its metadata.
+
+    Return a list of (name, mtime) tuples for the entry itself and for each
+    distribution metadata directory in it (the mtime is None if the entry
+    doesn't exist).
+
+    """
+
+    directory = path or os.curdir
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+
+    except OSError:
+        return [(path, None)]
+
+    metadata = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(_METADATA_SUFFIXES):
+                    metadata.append((entry.name, entry.stat().st_mtime_ns))
+
+    # The entry isn't a directory (e.g. it is a zip file), or it changed
+    # while we were looking at it (in which case its mtime has too).
+    except OSError:
+        pass
+
+    return [(path, mtime)] + sorted(metadata)
+
+
+def _get_source(klass):
+    """Return the source file of a plugin class and its modification time.
+
+    Return None if the class's module doesn't have a source file.
+
+    """
+
+    filename = getattr(sys.modules.get(klass.__module__), "__file__", None)
+    if filename is None:
+        return None
+
+    try:
+        return {"filename": filename, "mtime": os.stat(filename).st_mtime_ns}
+
+    except OSError:
+        return None
+
+
+def _is_source_current(entry):
+    """Is the source of the plugin in a cache entry unchanged?"""
+
+    source = entry.get("source")
+    if source is None:
+        return True
+
+    try:
+        return os.stat(source["filename"]).st_mtime_ns == source["mtime"]
+
+    except OSError:
+        return False
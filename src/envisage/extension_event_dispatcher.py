@@ -0,0 +1,370 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Extension event dispatchers."""
+
+# Standard library imports.
+import collections
+import logging
+import threading
+
+# Enthought library imports.
+from traits.api import Any, Bool, Callable, HasTraits, provides
+
+# Local imports.
+from .extension_point_changed_event import ExtensionPointChangedEvent
+from .i_extension_event_dispatcher import IExtensionEventDispatcher
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+@provides(IExtensionEventDispatcher)
+class SynchronousEventDispatcher(HasTraits):
+    """An extension event dispatcher that calls the listeners immediately.
+
+    This is the default dispatcher used by extension registries. The
+    listeners are called in the thread that changed the extensions, before
+    the change returns, and any exception raised by a listener is passed on.
+
+    """
+
+    ###########################################################################
+    # 'IExtensionEventDispatcher' interface.
+    ###########################################################################
+
+    def close(self):
+        """Deliver any pending events and stop dispatching."""
+
+    def dispatch(self, registry, refs, event):
+        """Dispatch an extension point changed event."""
+
+        for ref in refs:
+            listener = ref()
+            if listener is not None:
+                listener(registry, event)
+
+    def flush(self):
+        """Deliver any pending events before returning."""
+
+
+@provides(IExtensionEventDispatcher)
+class ThreadEventDispatcher(HasTraits):
+    """An extension event dispatcher that calls the listeners in a thread.
+
+    Events are queued and delivered by a worker thread (started when the
+    first event is dispatched), so slow listeners don't hold up whoever
+    changed the extensions. Consecutive additions to the end of the same
+    extension point that are still queued are delivered as a single event.
+    Exceptions raised by listeners are logged.
+
+    e.g.::
+
+        application.extension_registry.dispatcher = ThreadEventDispatcher()
+
+    """
+
+    #### Private interface ####################################################
+
+    # The condition that guards the queue, and that the worker thread waits on.
+    _condition = Any
+
+    # Has the dispatcher been closed?
+    _closed = Bool(False)
+
+    # Is the worker thread delivering an event?
+    _delivering = Bool(False)
+
+    # The events waiting to be delivered.
+    _queue = Any
+
+    # The worker thread (None until the first event is dispatched).
+    _thread = Any
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._condition = threading.Condition()
+        self._queue = _EventQueue()
+
+    ###########################################################################
+    # 'IExtensionEventDispatcher' interface.
+    ###########################################################################
+
+    def close(self):
+        """Deliver any pending events and stop dispatching."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def dispatch(self, registry, refs, event):
+        """Dispatch an extension point changed event."""
+
+        with self._condition:
+            if not self._closed:
+                self._queue.put(registry, refs, event)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._deliver_events,
+                        name="ExtensionEventDispatcher",
+                        daemon=True,
+                    )
+                    self._thread.start()
+
+                self._condition.notify_all()
+                return
+
+        _deliver(registry, refs, event)
+
+    def flush(self):
+        """Deliver any pending events before returning."""
+
+        # The worker thread can't wait for itself!
+        if self._thread is threading.current_thread():
+            return
+
+        with self._condition:
+            while self._queue or self._delivering:
+                self._condition.wait()
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _deliver_events(self):
+        """Deliver queued events until the dispatcher is closed."""
+
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+
+                entry = self._queue.get()
+                if entry is None:
+                    return
+
+                self._delivering = True
+
+            try:
+                _deliver(*entry)
+
+            finally:
+                with self._condition:
+                    self._delivering = False
+                    self._condition.notify_all()
+
+
+@provides(IExtensionEventDispatcher)
+class CallLaterEventDispatcher(HasTraits):
+    """An extension event dispatcher that calls the listeners in an event loop.
+
+    Events are queued, and delivered by a function that is posted to an
+    event loop using 'call_later', e.g. for a GUI::
+
+        dispatcher = CallLaterEventDispatcher(call_later=GUI.invoke_later)
+
+    or for an asyncio event loop::
+
+        dispatcher = CallLaterEventDispatcher(
+            call_later=loop.call_soon_threadsafe
+        )
+
+    Consecutive additions to the end of the same extension point that are
+    still queued are delivered as a single event. Exceptions raised by
+    listeners are logged.
+
+    """
+
+    #### 'CallLaterEventDispatcher' interface #################################
+
+    #: A callable that arranges for a function (passed to it without any
+    #: arguments) to be called later in the event loop's thread. It may be
+    #: called from any thread.
+    call_later = Callable
+
+    #### Private interface ####################################################
+
+    # Has the dispatcher been closed?
+    _closed = Bool(False)
+
+    # The lock that guards the queue.
+    _lock = Any
+
+    # The events waiting to be delivered.
+    _queue = Any
+
+    # Has delivery of the queued events been posted to the event loop?
+    _scheduled = Bool(False)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._lock = threading.Lock()
+        self._queue = _EventQueue()
+
+    ###########################################################################
+    # 'IExtensionEventDispatcher' interface.
+    ###########################################################################
+
+    def close(self):
+        """Deliver any pending events and stop dispatching."""
+
+        with self._lock:
+            self._closed = True
+
+        self.flush()
+
+    def dispatch(self, registry, refs, event):
+        """Dispatch an extension point changed event."""
+
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._queue.put(registry, refs, event)
+                schedule = not self._scheduled
+                self._scheduled = True
+
+        if closed:
+            _deliver(registry, refs, event)
+
+        elif schedule:
+            self.call_later(self._deliver_events)
+
+    def flush(self):
+        """Deliver any pending events before returning.
+
+        The events are delivered in the calling thread.
+
+        """
+
+        self._deliver_events()
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _deliver_events(self):
+        """Deliver the queued events."""
+
+        with self._lock:
+            self._scheduled = False
+
+        while True:
+            with self._lock:
+                entry = self._queue.get()
+
+            if entry is None:
+                break
+
+            _deliver(*entry)
+
+
+class _EventQueue:
+    """A queue of extension point changed events waiting to be delivered.
+
+    An event that adds extensions to the end of the extensions that the last
+    queued event for the same extension point added (for the same listeners)
+    is merged into that event.
+
+    The queue isn't thread safe.
+
+    """
+
+    def __init__(self):
+        """Constructor."""
+
+        # The queued entries, each of which is [registry, refs, event].
+        self._entries = collections.deque()
+
+        # The last queued entry for each extension point of each registry.
+        #
+        # { (id(registry), extension_point_id) : entry }
+        self._last_entries = {}
+
+    def __len__(self):
+        """Return the number of queued events."""
+
+        return len(self._entries)
+
+    def get(self):
+        """Remove and return the next entry, or None if the queue is empty."""
+
+        if not self._entries:
+            return None
+
+        entry = self._entries.popleft()
+
+        key = (id(entry[0]), entry[2].extension_point_id)
+        if self._last_entries.get(key) is entry:
+            del self._last_entries[key]
+
+        return entry
+
+    def put(self, registry, refs, event):
+        """Queue an event."""
+
+        key = (id(registry), event.extension_point_id)
+
+        entry = self._last_entries.get(key)
+        if entry is not None and entry[1] is refs and _follows(entry[2], event):
+            entry[2] = ExtensionPointChangedEvent(
+                extension_point_id=event.extension_point_id,
+                added=list(entry[2].added) + list(event.added),
+                removed=[],
+                index=entry[2].index,
+            )
+
+        else:
+            entry = self._last_entries[key] = [registry, refs, event]
+            self._entries.append(entry)
+
+
+def _deliver(registry, refs, event):
+    """Call the listeners with an event, logging any exceptions."""
+
+    for ref in refs:
+        listener = ref()
+        if listener is not None:
+            try:
+                listener(registry, event)
+
+            except Exception:
+                logger.exception(
+                    "error in listener to extension point <%s>",
+                    event.extension_point_id,
+                )
+
+
+def _follows(event, next_event):
+    """Return True if an event only adds extensions right after another."""
+
+    return (
+        isinstance(event.index, int)
+        and isinstance(next_event.index, int)
+        and not event.removed
+        and not next_event.removed
+        and next_event.index == event.index + len(event.added)
+    )
@@ -14,7 +14,7 @@ import inspect
 import weakref
 
 # Enthought library imports.
-from traits.api import List, provides, TraitType, Undefined
+from traits.api import List, provides, TraitListObject, TraitType, Undefined
 
 # Local imports.
 from .i_extension_point import IExtensionPoint
@@ -59,8 +59,14 @@ class ExtensionPoint(TraitType):
     # 'object' interface.
     ###########################################################################
 
-    def __init__(self, trait_type=List, id=None, **metadata):
-        """Constructor."""
+    def __init__(self, trait_type=List, id=None, key=None, **metadata):
+        """Constructor.
+
+        If 'key' is specified then it is the name of an attribute that
+        identifies each contribution (e.g. 'id'), and contributions can be
+        looked up by it using 'get_by_key'.
+
+        """
 
         # We add '__extension_point__' to the metadata to make the extension
         # point traits easier to find with the 'traits' and 'trait_names'
@@ -88,6 +94,9 @@ class ExtensionPoint(TraitType):
 
         self.id = id
 
+        # The name of the attribute that identifies each contribution (if any).
+        self.key = key
+
         # A dictionary that is used solely to keep a reference to all extension
         # point listeners alive until their associated objects are garbage
         # collected.
@@ -95,6 +104,15 @@ class ExtensionPoint(TraitType):
         # Dict(weakref.ref(Any), Dict(Str, Callable))
         self._obj_to_listeners_map = weakref.WeakKeyDictionary()
 
+        # The validated extensions, cached for each object and trait until the
+        # extensions to the extension point change, along with the extension
+        # registry they came from, the generation of the extensions (see
+        # 'ExtensionRegistry.get_generation') and (if the extension point has
+        # a key, and it has been used) the extensions indexed by their keys.
+        #
+        # Dict(weakref.ref(Any), Dict(Str, [registry, List, int, Dict]))
+        self._obj_to_cache_map = weakref.WeakKeyDictionary()
+
     def __repr__(self):
         """String representation of an ExtensionPoint object"""
         return "ExtensionPoint(id={!r})".format(self.id)
@@ -108,11 +126,29 @@ class ExtensionPoint(TraitType):
 
         extension_registry = self._get_extension_registry(obj)
 
-        # Get the extensions to this extension point.
-        extensions = extension_registry.get_extensions(self.id)
+        # If the extensions haven't changed since they were last validated then
+        # we just need a new list of them (so that changing the list we return
+        # doesn't change what we return next time).
+        entry = self._get_cache_entry(obj, trait_name, extension_registry)
+        if entry is not None:
+            extensions = TraitListObject(self.trait_type, obj, trait_name, [])
+            list.extend(extensions, entry[1])
+
+        else:
+            # Get the generation first, so that if the extensions change while
+            # we are getting them, we don't cache the old ones as the new ones.
+            generation = self._get_generation(extension_registry)
+
+            # Get the extensions to this extension point.
+            extensions = extension_registry.get_extensions(self.id)
+
+            # Make sure the contributions are of the appropriate type.
+            extensions = self.trait_type.validate(obj, trait_name, extensions)
+            self._cache_extensions(
+                obj, trait_name, extension_registry, generation, extensions
+            )
 
-        # Make sure the contributions are of the appropriate type.
-        return self.trait_type.validate(obj, trait_name, extensions)
+        return extensions
 
     def set(self, obj, name, value):
         """Trait type setter."""
@@ -167,6 +203,37 @@ class ExtensionPoint(TraitType):
         listeners = self._obj_to_listeners_map.setdefault(obj, {})
         listeners[trait_name] = listener
 
+    def get_by_key(self, obj, trait_name, key):
+        """Return the contribution with the specified key, or None.
+
+        If more than one contribution has the key then the first one is
+        returned. The contributions are indexed by their keys the first time
+        that this is called after they change, so that subsequent lookups
+        don't have to search them.
+
+        Raise a 'ValueError' if the extension point doesn't have a key.
+
+        """
+
+        if self.key is None:
+            raise ValueError("extension point <%s> has no key" % self.id)
+
+        extension_registry = self._get_extension_registry(obj)
+
+        entry = self._get_cache_entry(obj, trait_name, extension_registry)
+        if entry is None:
+            extensions = self.get(obj, trait_name)
+
+            # Extensions to unknown extension points aren't cached.
+            entry = self._get_cache_entry(obj, trait_name, extension_registry)
+            if entry is None:
+                return self._index_extensions(extensions).get(key)
+
+        if entry[3] is None:
+            entry[3] = self._index_extensions(entry[1])
+
+        return entry[3].get(key)
+
     def disconnect(self, obj, trait_name):
         """Disconnect the extension point from a trait on an object."""
 
@@ -184,6 +251,48 @@ class ExtensionPoint(TraitType):
     # Private interface.
     ###########################################################################
 
+    def _cache_extensions(
+        self, obj, trait_name, extension_registry, generation, extensions
+    ):
+        """Cache the validated extensions of a trait on an object.
+
+        The extensions to an unknown extension point aren't cached, and
+        neither are the extensions from an extension registry that doesn't
+        keep track of their generation, because we can't tell when they
+        change.
+
+        """
+
+        if generation is None:
+            return
+
+        if extension_registry.get_extension_point(self.id) is None:
+            return
+
+        cache = self._obj_to_cache_map.setdefault(obj, {})
+        cache[trait_name] = [extension_registry, list(extensions), generation, None]
+
+    def _get_cache_entry(self, obj, trait_name, extension_registry):
+        """Return the cache entry for a trait on an object.
+
+        Return None if no extensions are cached, or if they came from a
+        different extension registry, or if they have since changed, or if
+        the extension point has since been removed.
+
+        """
+
+        entry = self._obj_to_cache_map.get(obj, {}).get(trait_name)
+        if entry is None or entry[0] is not extension_registry:
+            return None
+
+        if entry[2] != self._get_generation(extension_registry):
+            return None
+
+        if extension_registry.get_extension_point(self.id) is None:
+            return None
+
+        return entry
+
     def _get_extension_registry(self, obj):
         """Return the extension registry in effect for an object."""
 
@@ -197,3 +306,60 @@ class ExtensionPoint(TraitType):
             )
 
         return extension_registry
+
+    def _get_generation(self, extension_registry):
+        """Return the generation of the extensions to the extension point.
+
+        Return None if the extension registry doesn't keep track of it.
+
+        """
+
+        get_generation = getattr(extension_registry, "get_generation", None)
+        if get_generation is None:
+            return None
+
+        return get_generation(self.id)
+
+    def _index_extensions(self, extensions):
+        """Index extensions by their keys (the first one with each key wins)."""
+
+        index = {}
+        for extension in extensions:
+            index.setdefault(getattr(extension, self.key, None), extension)
+
+        # Contributions without the key can't be looked up by it.
+        index.pop(None, None)
+
+        return index
+
+
+def get_extension_by_key(obj, trait_name, key):
+    """Return the contribution to an extension point with the specified key.
+
+    Parameters
+    ----------
+    obj : HasTraits
+        The object with the extension point trait.
+    trait_name : str
+        The name of the extension point trait on obj (which must have been
+        declared with a 'key').
+    key : object
+        The key of the contribution.
+
+    Returns
+    -------
+    object or None
+        The first contribution with the key, or None if there isn't one.
+
+    Raises
+    ------
+    ValueError
+        If the trait isn't an extension point with a key.
+    """
+
+    trait = obj.trait(trait_name)
+    trait_type = getattr(trait, "trait_type", None)
+    if not isinstance(trait_type, ExtensionPoint):
+        raise ValueError("trait <%s> is not an extension point" % trait_name)
+
+    return trait_type.get_by_key(obj, trait_name, key)
@@ -15,18 +15,22 @@ import types
 import weakref
 
 # Enthought library imports.
-from traits.api import Dict, HasTraits, provides
+from traits.api import Dict, HasTraits, Instance, provides
 
 # Local imports.
+from .extension_event_dispatcher import SynchronousEventDispatcher
 from .extension_point_changed_event import ExtensionPointChangedEvent
+from .i_extension_event_dispatcher import IExtensionEventDispatcher
 from .i_extension_registry import IExtensionRegistry
+from .i_profiler import IProfiler
+from .profiler import NullProfiler
 from .unknown_extension_point import UnknownExtensionPoint
 
 # Logging.
 logger = logging.getLogger(__name__)
 
 
-def _saferef(listener):
+def _saferef(listener, callback=None):
     """
     Weak reference for a (possibly bound method) listener.
 
@@ -44,6 +48,9 @@ def _saferef(listener):
         Listener to return a weak reference for. This can be
         either a plain function, a bound method, or some other
         form of callable.
+    callback : callable, optional
+        Called with the weak reference when the listener is garbage
+        collected.
 
     Returns
     -------
@@ -54,15 +61,31 @@ def _saferef(listener):
 
     """
     if isinstance(listener, types.MethodType):
-        return weakref.WeakMethod(listener)
+        return weakref.WeakMethod(listener, callback)
     else:
-        return weakref.ref(listener)
+        return weakref.ref(listener, callback)
 
 
 @provides(IExtensionRegistry)
 class ExtensionRegistry(HasTraits):
     """A base class for extension registry implementation."""
 
+    #### 'ExtensionRegistry' interface ########################################
+
+    #: The dispatcher that calls the listeners when extensions are added to or
+    #: removed from an extension point. By default the listeners are called
+    #: synchronously. Only the listeners are deferred by other dispatchers:
+    #: the registry's own bookkeeping (e.g. the generation that tells
+    #: 'ExtensionPoint' traits that their cached extensions are out of date)
+    #: is always updated straight away.
+    dispatcher = Instance(IExtensionEventDispatcher, factory=SynchronousEventDispatcher)
+
+    #: The profiler that records how long it takes to get the extensions to
+    #: each extension point for the first time (the application's, if the
+    #: registry was created by an application). By default nothing is
+    #: recorded.
+    profiler = Instance(IProfiler, factory=NullProfiler)
+
     ###########################################################################
     # Protected 'ExtensionRegistry' interface.
     ###########################################################################
@@ -78,7 +101,12 @@ class ExtensionRegistry(HasTraits):
     # These are called when extensions are added to or removed from an
     # extension point.
     #
-    # e.g. Dict(extension_point, [weakref.ref(callable)])
+    # Each extension point has an insertion-ordered set of weak references
+    # to its listeners (a dictionary whose values are all None), so that
+    # listeners can be removed in constant time. References are removed when
+    # their listeners are garbage collected.
+    #
+    # e.g. Dict(extension_point, {weakref.ref(callable) : None})
     #
     # A listener is any Python callable with the following signature:-
     #
@@ -86,6 +114,24 @@ class ExtensionRegistry(HasTraits):
     #     ...
     _listeners = Dict
 
+    # The references to all of the listeners to an extension point (as
+    # returned by '_get_listener_refs'), built when it is first needed.
+    #
+    # e.g. Dict(extension_point, (weakref.ref(callable), ...))
+    _listener_refs = Dict
+
+    # The generation of the extensions to each extension point, which is
+    # incremented whenever they change (see 'get_generation').
+    #
+    # e.g. Dict(extension_point, int)
+    _generations = Dict
+
+    # The callables to call before the extensions to each extension point are
+    # next got.
+    #
+    # e.g. Dict(extension_point, [callable])
+    _lookup_hooks = Dict
+
     ###########################################################################
     # 'IExtensionRegistry' interface.
     ###########################################################################
@@ -93,8 +139,9 @@ class ExtensionRegistry(HasTraits):
     def add_extension_point_listener(self, listener, extension_point_id=None):
         """Add a listener for extensions being added or removed."""
 
-        listeners = self._listeners.setdefault(extension_point_id, [])
-        listeners.append(_saferef(listener))
+        listeners = self._listeners.setdefault(extension_point_id, {})
+        listeners[_saferef(listener, self._make_pruner(extension_point_id))] = None
+        self._discard_listener_refs(extension_point_id)
 
     def add_extension_point(self, extension_point):
         """Add an extension point."""
@@ -105,6 +152,9 @@ class ExtensionRegistry(HasTraits):
     def get_extensions(self, extension_point_id):
         """Return the extensions contributed to an extension point."""
 
+        if self._lookup_hooks:
+            self._run_lookup_hooks(extension_point_id)
+
         return self._get_extensions(extension_point_id)[:]
 
     def get_extension_point(self, extension_point_id):
@@ -120,8 +170,17 @@ class ExtensionRegistry(HasTraits):
     def remove_extension_point_listener(self, listener, extension_point_id=None):
         """Remove a listener for extensions being added or removed."""
 
-        listeners = self._listeners.setdefault(extension_point_id, [])
-        listeners.remove(_saferef(listener))
+        listeners = self._listeners.get(extension_point_id, {})
+        try:
+            del listeners[_saferef(listener)]
+
+        except KeyError:
+            raise ValueError(
+                "listener %r is not listening to extension point <%s>"
+                % (listener, extension_point_id)
+            ) from None
+
+        self._discard_listener_refs(extension_point_id)
 
     def remove_extension_point(self, extension_point_id):
         """Remove an extension point."""
@@ -155,6 +214,35 @@ class ExtensionRegistry(HasTraits):
         refs = self._get_listener_refs(extension_point_id)
         self._call_listeners(refs, extension_point_id, extensions, old, None)
 
+    ###########################################################################
+    # 'ExtensionRegistry' interface.
+    ###########################################################################
+
+    def call_on_lookup(self, extension_point_id, callback):
+        """Call a callable before the extensions to an extension point are got.
+
+        The callable is called without any arguments, and only once, the
+        next time that 'get_extensions' is called for the extension point.
+
+        """
+
+        self._lookup_hooks.setdefault(extension_point_id, []).append(callback)
+
+        # Make sure that 'ExtensionPoint' traits don't answer the next lookup
+        # from their caches (without calling 'get_extensions').
+        self._increment_generation(extension_point_id)
+
+    def get_generation(self, extension_point_id):
+        """Return the generation of the extensions to an extension point.
+
+        The generation changes whenever the extensions change, before any
+        listeners are called (however they are dispatched), so anything that
+        caches the extensions can tell whether they are still current.
+
+        """
+
+        return self._generations.get(extension_point_id, 0)
+
     ###########################################################################
     # Protected 'ExtensionRegistry' interface.
     ###########################################################################
@@ -162,6 +250,10 @@ class ExtensionRegistry(HasTraits):
     def _call_listeners(self, refs, extension_point_id, added, removed, index):
         """Call listeners that are listening to an extension point."""
 
+        # The extensions have changed, so anything that has cached them must
+        # get them again (even if the listeners are only called later).
+        self._increment_generation(extension_point_id)
+
         event = ExtensionPointChangedEvent(
             extension_point_id=extension_point_id,
             added=added,
@@ -169,10 +261,7 @@ class ExtensionRegistry(HasTraits):
             index=index,
         )
 
-        for ref in refs:
-            listener = ref()
-            if listener is not None:
-                listener(self, event)
+        self.dispatcher.dispatch(self, refs, event)
 
     def _check_extension_point(self, extension_point_id):
         """Check to see if the extension point exists.
@@ -184,6 +273,20 @@ class ExtensionRegistry(HasTraits):
         if extension_point_id not in self._extension_points:
             raise UnknownExtensionPoint(extension_point_id)
 
+    def _discard_listener_refs(self, extension_point_id):
+        """Discard the references to the listeners to an extension point.
+
+        If the extension point Id is None, then the references to the
+        listeners to *all* extension points are discarded.
+
+        """
+
+        if extension_point_id is None:
+            self._listener_refs.clear()
+
+        else:
+            self._listener_refs.pop(extension_point_id, None)
+
     def _get_extensions(self, extension_point_id):
         """Return the extensions for the given extension point."""
 
@@ -192,14 +295,50 @@ class ExtensionRegistry(HasTraits):
     def _get_listener_refs(self, extension_point_id):
         """Get weak references to all listeners to an extension point.
 
-        Returns a list containing the weak references to those listeners that
+        Returns a tuple containing the weak references to those listeners that
         are listening to this extension point specifically first, followed by
         those that are listening to any extension point.
 
         """
 
-        refs = []
-        refs.extend(self._listeners.get(extension_point_id, []))
-        refs.extend(self._listeners.get(None, []))
+        refs = self._listener_refs.get(extension_point_id)
+        if refs is None:
+            refs = tuple(self._listeners.get(extension_point_id, ())) + tuple(
+                self._listeners.get(None, ())
+            )
+            self._listener_refs[extension_point_id] = refs
 
         return refs
+
+    def _increment_generation(self, extension_point_id):
+        """Increment the generation of the extensions to an extension point."""
+
+        self._generations[extension_point_id] = (
+            self._generations.get(extension_point_id, 0) + 1
+        )
+
+    def _make_pruner(self, extension_point_id):
+        """Make a callback that removes a dead reference to a listener.
+
+        The callback only holds a weak reference to the registry, so that
+        listeners don't keep the registry alive.
+
+        """
+
+        registry_ref = weakref.ref(self)
+
+        def prune(ref):
+            registry = registry_ref()
+            if registry is not None:
+                listeners = registry._listeners.get(extension_point_id, {})
+                if ref in listeners:
+                    del listeners[ref]
+                    registry._discard_listener_refs(extension_point_id)
+
+        return prune
+
+    def _run_lookup_hooks(self, extension_point_id):
+        """Call (and forget) the callables waiting for an extension point."""
+
+        for callback in self._lookup_hooks.pop(extension_point_id, []):
+            callback()
@@ -0,0 +1,45 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""The extension event dispatcher interface."""
+
+# Enthought library imports.
+from traits.api import Interface
+
+
+class IExtensionEventDispatcher(Interface):
+    """The extension event dispatcher interface.
+
+    An extension registry hands the events that it fires when extensions are
+    added or removed to a dispatcher, which decides when (and in which
+    thread) the listeners are called. Dispatchers that defer calling the
+    listeners deliver the events in the order that they were dispatched,
+    but listeners may find the registry in a later state than the event
+    that they are called with describes.
+
+    """
+
+    def close(self):
+        """Deliver any pending events and stop dispatching.
+
+        Events dispatched after the dispatcher has been closed are delivered
+        synchronously.
+
+        """
+
+    def dispatch(self, registry, refs, event):
+        """Dispatch an extension point changed event.
+
+        'refs' are weak references to the listeners to call with the
+        registry and the event.
+
+        """
+
+    def flush(self):
+        """Deliver any pending events before returning."""
@@ -31,6 +31,12 @@ class IExtensionPoint(Interface):
     # e.g. 'envisage.ui.workbench.views'
     id = Str
 
+    # The name of the attribute that identifies each contribution (if any),
+    # so that contributions can be looked up by it.
+    #
+    # e.g. 'id'
+    key = Str
+
     # A trait type that describes what can be contributed to the extension
     # point.
     #
@@ -10,7 +10,7 @@
 """The plugin interface."""
 
 # Enthought library imports.
-from traits.api import Instance, Interface, Str
+from traits.api import Enum, Instance, Interface, List, Str
 
 # Local imports.
 from .i_plugin_activator import IPluginActivator
@@ -22,6 +22,12 @@ class IPlugin(Interface):
     #: The activator used to start and stop the plugin.
     activator = Instance(IPluginActivator)
 
+    #: When the plugin is started: 'eager' (when the plugin manager starts
+    #: it), 'lazy_on_service' (when a protocol that it provides is first
+    #: looked up) or 'lazy_on_extension_point' (when one of its extension
+    #: points is first used). Lazy activation is up to the activator.
+    activation = Enum("eager", "lazy_on_service", "lazy_on_extension_point")
+
     #: The application that the plugin is part of.
     application = Instance("envisage.api.IApplication")
 
@@ -40,6 +46,15 @@ class IPlugin(Interface):
     #: The plugin's name (suitable for displaying to the user).
     name = Str
 
+    #: The Ids of the plugins (or the names of the things, such as service
+    #: protocols, that other plugins provide) that must be started before
+    #: this plugin is.
+    requires = List(Str)
+
+    #: The names of the things (such as service protocols) that the plugin
+    #: provides to other plugins, in addition to its Id.
+    provides = List(Str)
+
     def start(self):
         """Start the plugin.
 
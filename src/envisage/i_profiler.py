@@ -0,0 +1,69 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""The profiler interface."""
+
+# Enthought library imports.
+from traits.api import Interface
+
+
+class IProfiler(Interface):
+    """The profiler interface.
+
+    A profiler records *spans*, i.e. how long the phases of the work done by
+    an application (starting plugins, reading extension points for the first
+    time, creating services etc.) took. Spans can be nested, and are
+    recorded for whichever thread they run in, so a profiler must be safe to
+    use from multiple threads.
+
+    """
+
+    def reset(self):
+        """Discard all of the spans recorded so far."""
+
+    def save(self, filename):
+        """Save the spans recorded so far as a Chrome trace event file.
+
+        The file can be viewed with e.g. 'chrome://tracing' or Perfetto.
+
+        """
+
+    def span(self, name, category="envisage", **args):
+        """Return a context manager that records a span while it is entered.
+
+        'args' are recorded with the span (their values should be JSON
+        serializable).
+
+        e.g.::
+
+            with profiler.span('plugin.start', plugin=plugin.id):
+                ...
+
+        """
+
+    def trace_events(self):
+        """Return the spans recorded so far as Chrome trace events.
+
+        Each event is a dictionary, in the trace event format's 'complete
+        event' form, e.g.::
+
+            {
+                'name' : 'plugin.start',
+                'cat'  : 'envisage',
+                'ph'   : 'X',
+                'ts'   : 1234.5,
+                'dur'  : 678.9,
+                'pid'  : 4321,
+                'tid'  : 140000000000,
+                'args' : {'plugin' : 'acme.foo'}
+            }
+
+        where times are in microseconds.
+
+        """
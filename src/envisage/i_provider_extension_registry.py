@@ -19,6 +19,15 @@ class IProviderExtensionRegistry(IExtensionRegistry):
     def add_provider(self, provider):
         """Add an extension provider."""
 
+    def add_providers(self, providers):
+        """Add several extension providers at once.
+
+        This is equivalent to adding each of the providers in turn, except
+        that listeners are only notified once for each extension point,
+        rather than once for each provider that contributes to it.
+
+        """
+
     def get_providers(self):
         """Return all of the providers in the registry."""
 
@@ -28,3 +37,16 @@ class IProviderExtensionRegistry(IExtensionRegistry):
         Raise a 'ValueError' if the provider is not in the registry.
 
         """
+
+    def remove_providers(self, providers):
+        """Remove several extension providers at once.
+
+        This is equivalent to removing each of the providers in turn, except
+        that listeners are only notified once for each run of contiguous
+        contributions removed from an extension point, rather than once for
+        each provider that contributed to it.
+
+        Raise a 'ValueError' if any of the providers is not in the registry
+        (in which case none of them are removed).
+
+        """
@@ -0,0 +1,57 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""The service metrics interface."""
+
+# Enthought library imports.
+from traits.api import Interface
+
+
+class IServiceMetrics(Interface):
+    """The service metrics interface.
+
+    A service metrics collector is told about the work done by a service
+    registry, so that we can find out which protocols are looked up most
+    often, how long their queries take, and which service factories are
+    slow.
+
+    The methods are called by whichever thread uses the registry, so a
+    collector must be safe to use from multiple threads.
+
+    """
+
+    def dump(self):
+        """Return a snapshot of the metrics collected so far.
+
+        The snapshot is a dictionary keyed by protocol name, e.g.::
+
+            {
+                'acme.IMyService' : {
+                    'lookups'   : {...},
+                    'queries'   : {...},
+                    'factories' : {...}
+                }
+            }
+
+        Each entry describes the timings recorded for that protocol, and only
+        the kinds of timing that were recorded are included.
+
+        """
+
+    def record_factory(self, protocol_name, seconds):
+        """Record that a service factory took a time to build a service."""
+
+    def record_lookup(self, protocol_name, seconds):
+        """Record that a lookup of a protocol took a time."""
+
+    def record_query(self, protocol_name, seconds):
+        """Record that evaluating a query over a service took a time."""
+
+    def reset(self):
+        """Discard all of the metrics collected so far."""
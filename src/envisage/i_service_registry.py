@@ -37,6 +37,34 @@ class IServiceRegistry(Interface):
     # An event that is fired when a service is unregistered.
     unregistered = Event
 
+    async def aget_service(self, protocol, query="", minimize="", maximize=""):
+        """Return at most one service that matches the specified query.
+
+        This is the asynchronous version of 'get_service'. Unlike the
+        synchronous lookups, it can create services whose factories are
+        coroutine functions, by awaiting them. A service's factory is only
+        awaited once, however many lookups on the same event loop are
+        waiting for it at the same time.
+
+        """
+
+    async def aget_services(self, protocol, query="", minimize="", maximize=""):
+        """Return all services that match the specified query.
+
+        This is the asynchronous version of 'get_services' (see
+        'aget_service' for details).
+
+        """
+
+    def create_scope(self):
+        """Create a scope for the services with a 'scoped' lifetime.
+
+        Return a 'ServiceScope'. While the scope is active, each service with
+        a 'scoped' lifetime is created (at most) once for the scope, and the
+        services are disposed of when the scope is closed.
+
+        """
+
     def get_service(self, protocol, query="", minimize="", maximize=""):
         """Return at most one service that matches the specified query.
 
@@ -71,6 +99,16 @@ class IServiceRegistry(Interface):
         If no query is specified then all services that provide the specified
         protocol are returned (if any exist).
 
+        The query is either a string containing a Python expression, e.g.
+        'price <= 100', or a callable that takes a single argument and
+        returns True if the service matches. Either way, the names available
+        to the query are the service's properties, together with the
+        attributes of the service object itself (the properties take
+        precedence). A string query is evaluated with those names in scope,
+        whereas a callable is passed them as a read-only mapping, e.g.
+        'lambda service: service["price"] <= 100'. A service that fails to
+        evaluate the query simply does not match it.
+
         """
 
     def get_service_properties(self, service_id):
@@ -83,7 +121,9 @@ class IServiceRegistry(Interface):
 
         """
 
-    def register_service(self, protocol, obj, properties=None):
+    def register_service(
+        self, protocol, obj, properties=None, lifetime="singleton", dispose=None
+    ):
         """Register a service.
 
         The protocol can be an actual class or interface, or the *name* of a
@@ -106,6 +146,44 @@ class IServiceRegistry(Interface):
         and returns an object. For *really* lazy loading, the factory can also
         be specified as a string which is used to import the callable.
 
+        A service factory can also be a coroutine function, in which case the
+        service is created by the first asynchronous lookup ('aget_service'
+        or 'aget_services') that finds it. Until then, synchronous lookups
+        ignore the service.
+
+        The lifetime says how often a service factory is called:
+
+        'singleton'
+            The factory is called once, and the service it creates replaces
+            it (this is the default).
+        'transient'
+            The factory is called for every lookup, and each caller owns the
+            service that it is given.
+        'scoped'
+            The factory is called once per service scope (see
+            'create_scope'). Lookups ignore the service outside of a scope.
+
+        If a 'dispose' callable (or a string that can be used to import one)
+        is specified, then it is called with each singleton or scoped service
+        that a factory created, when the service is unregistered or its scope
+        is closed.
+
+        """
+
+    def resolve_service(self, service_id):
+        """Return the service with the specified id, creating it if need be.
+
+        Unlike 'get_service_from_id', if the service was registered as a
+        service factory then the factory is called (if it hasn't been
+        already). This can be used to create a service ahead of the first
+        lookup that needs it.
+
+        Return None if the service can't be created synchronously (i.e. its
+        factory is a coroutine function, or it is a scoped service and no
+        scope is active).
+
+        If no such service exists a 'ValueError' exception is raised.
+
         """
 
     def set_service_properties(self, service_id, properties):
@@ -0,0 +1,135 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""A contribution that is only imported when it is used."""
+
+# Standard library imports.
+import threading
+
+# Local imports.
+from .import_manager import ImportManager
+
+# Marks a lazy contribution that hasn't been materialized yet.
+_NOT_MATERIALIZED = object()
+
+
+class LazyContribution:
+    """A contribution that is only imported when it is used.
+
+    Plugins usually have to import (and create) everything that they
+    contribute when the extension point is first read, even if most of
+    the contributions are never used. A lazy contribution is described by
+    the symbol path of the actual contribution, plus any metadata that
+    consumers need without using it, e.g.::
+
+        def _task_factories_default(self):
+            return [
+                LazyContribution(
+                    "acme.ui.tasks.acme_task:AcmeTaskFactory",
+                    properties={"id": "acme.task", "name": "Acme"},
+                    id="acme.task",
+                    name="Acme",
+                )
+            ]
+
+    Consumers can read the metadata (here 'id' and 'name') without
+    importing anything. Any other use of the contribution (getting any
+    other attribute, or calling it) *materializes* it: the symbol is
+    imported and, if properties were given, called with them as keyword
+    arguments to create the actual contribution. The contribution is only
+    materialized once.
+
+    A lazy contribution stands in for the actual contribution, but it is
+    not an instance of its class, so it can only be contributed to
+    extension points that don't check the type of their contributions
+    (e.g. 'List' or 'List(Callable)'). Use 'materialize' to get the actual
+    contribution.
+
+    """
+
+    __slots__ = (
+        "_lazy_lock",
+        "_lazy_metadata",
+        "_lazy_object",
+        "_lazy_properties",
+        "_lazy_symbol_path",
+    )
+
+    def __init__(self, symbol_path, properties=None, **metadata):
+        """Constructor.
+
+        'symbol_path' is the path of the contribution (or the callable that
+        creates it if 'properties' is a dictionary), in the form used by
+        'ImportManager.import_symbol'.
+
+        """
+
+        self._lazy_symbol_path = symbol_path
+        self._lazy_properties = properties
+        self._lazy_metadata = metadata
+        self._lazy_object = _NOT_MATERIALIZED
+        self._lazy_lock = threading.RLock()
+
+    def __call__(self, *args, **kw):
+        """Call the actual contribution."""
+
+        return self._lazy_materialize()(*args, **kw)
+
+    def __getattr__(self, name):
+        """Return metadata, or an attribute of the actual contribution."""
+
+        # Slots that haven't been set yet (e.g. while the contribution is
+        # being copied) aren't metadata.
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+
+        metadata = self._lazy_metadata
+        if name in metadata:
+            return metadata[name]
+
+        return getattr(self._lazy_materialize(), name)
+
+    def __repr__(self):
+        """Return a string representation of the lazy contribution."""
+
+        args = [repr(self._lazy_symbol_path)]
+        if self._lazy_properties is not None:
+            args.append("properties=%r" % (self._lazy_properties,))
+        args.extend("%s=%r" % item for item in self._lazy_metadata.items())
+
+        return "LazyContribution(%s)" % ", ".join(args)
+
+    def _lazy_materialize(self):
+        """Return the actual contribution, importing (and creating) it."""
+
+        obj = self._lazy_object
+        if obj is _NOT_MATERIALIZED:
+            with self._lazy_lock:
+                obj = self._lazy_object
+                if obj is _NOT_MATERIALIZED:
+                    obj = ImportManager().import_symbol(self._lazy_symbol_path)
+                    if self._lazy_properties is not None:
+                        obj = obj(**self._lazy_properties)
+
+                    self._lazy_object = obj
+
+        return obj
+
+
+def materialize(contribution):
+    """Return the actual contribution that a contribution stands in for.
+
+    This is the contribution itself, unless it is a 'LazyContribution'.
+
+    """
+
+    if isinstance(contribution, LazyContribution):
+        contribution = contribution._lazy_materialize()
+
+    return contribution
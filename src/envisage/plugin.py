@@ -15,10 +15,11 @@ import os
 from os.path import exists, join
 
 # Enthought library imports.
-from traits.api import Instance, Property, provides, Str
+from traits.api import Enum, Instance, List, Property, provides, Str
 from traits.util.camel_case import camel_case_to_words
 
 # Local imports.
+from .deferred_plugin_activator import DeferredPluginActivator
 from .extension_point import ExtensionPoint
 from .extension_provider import ExtensionProvider
 from .i_application import IApplication
@@ -28,7 +29,6 @@ from .i_plugin import IPlugin
 from .i_plugin_activator import IPluginActivator
 from .i_service_registry import IServiceRegistry
 from .i_service_user import IServiceUser
-from .plugin_activator import PluginActivator
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -48,7 +48,16 @@ class Plugin(ExtensionProvider):
     #:
     #: By default the *same* activator instance is used for *all* plugins of
     #: this type.
-    activator = Instance(IPluginActivator, PluginActivator())
+    activator = Instance(IPluginActivator, DeferredPluginActivator())
+
+    #: When the plugin is started.
+    #:
+    #: By default the plugin is started by the plugin manager ('eager').
+    #: Otherwise (with the default activator) it is started the first time
+    #: that one of the protocols that it 'provides' is looked up in the
+    #: service registry ('lazy_on_service'), or that the extensions to one of
+    #: the extension points it offers are got ('lazy_on_extension_point').
+    activation = Enum("eager", "lazy_on_service", "lazy_on_extension_point")
 
     #: The application that the plugin is part of.
     application = Instance(IApplication)
@@ -72,6 +81,18 @@ class Plugin(ExtensionProvider):
     #: just set it!
     name = Str
 
+    #: The Ids of the plugins (or the names of the things, such as service
+    #: protocols, that other plugins provide) that must be started before
+    #: this plugin is.
+    #:
+    #: Plugin managers start plugins after the plugins that they require,
+    #: and stop them before.
+    requires = List(Str)
+
+    #: The names of the things (such as service protocols) that the plugin
+    #: provides to other plugins, in addition to its Id.
+    provides = List(Str)
+
     #### 'IExtensionPointUser' interface ######################################
 
     #: The extension registry that the object's extension points are stored in.
@@ -0,0 +1,199 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Ordering plugins by their requirements."""
+
+# Standard library imports.
+import concurrent.futures
+import heapq
+import logging
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+def sort_plugins(plugins):
+    """Return plugins in the order that they should be started.
+
+    Each plugin comes after the plugins that provide what it requires (see
+    'IPlugin.requires' and 'IPlugin.provides'), and otherwise plugins stay
+    in the order given, so plugins without any requirements are started in
+    exactly the same order as they always were.
+
+    Raise a 'ValueError' if the requirements are circular.
+
+    """
+
+    plugins = list(plugins)
+    requirements, dependents = _get_requirements(plugins)
+
+    counts = list(map(len, requirements))
+    ready = [index for index, count in enumerate(counts) if count == 0]
+    heapq.heapify(ready)
+
+    order = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(plugins[index])
+
+        for dependent in dependents[index]:
+            counts[dependent] -= 1
+            if counts[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    if len(order) < len(plugins):
+        raise ValueError(
+            "plugins %s have circular requirements"
+            % ", ".join(
+                plugins[index].id for index, count in enumerate(counts) if count > 0
+            )
+        )
+
+    return order
+
+
+def start_plugins(start_plugin, plugins, max_workers=1, on_error=None):
+    """Start plugins in an order that respects their requirements.
+
+    'start_plugin' is called with each plugin to start it. If 'max_workers'
+    is greater than one, then plugins whose requirements have all been
+    started are started concurrently by a pool of that many threads (so they
+    had better be thread safe!).
+
+    If starting a plugin raises an exception then no more plugins are
+    started, and once any that are being started have been, the exception is
+    raised.
+
+    If 'on_error' is given, then instead it is called with the plugin and the
+    exception, and the other plugins are still started, except for those
+    that require the plugin. 'on_error' is then called with each of those
+    too (with a 'ValueError'). 'on_error' is always called in the thread
+    that called this function.
+
+    """
+
+    plugins = sort_plugins(plugins)
+    requirements, dependents = _get_requirements(plugins)
+
+    # The indices of the plugins that have failed to start.
+    failed = set()
+
+    if max_workers <= 1:
+        for index, plugin in enumerate(plugins):
+            if requirements[index] & failed:
+                failed.add(index)
+                on_error(plugin, _requirement_error(plugin))
+                continue
+
+            try:
+                start_plugin(plugin)
+
+            except Exception as error:
+                if on_error is None:
+                    raise
+
+                failed.add(index)
+                on_error(plugin, error)
+
+        return
+
+    counts = list(map(len, requirements))
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers, thread_name_prefix="PluginStarter"
+    ) as executor:
+        # { future : index }
+        pending = {
+            executor.submit(start_plugin, plugins[index]): index
+            for index, count in enumerate(counts)
+            if count == 0
+        }
+
+        error = None
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+
+            # Start the plugins that were waiting for the ones just started,
+            # in the order that they would be started in one after another.
+            ready = []
+            for future in sorted(done, key=pending.get):
+                index = pending.pop(future)
+                if future.exception() is not None:
+                    if on_error is None:
+                        error = error or future.exception()
+
+                    else:
+                        failed.add(index)
+                        on_error(plugins[index], future.exception())
+
+                else:
+                    for dependent in dependents[index]:
+                        counts[dependent] -= 1
+                        if counts[dependent] == 0:
+                            ready.append(dependent)
+
+            if error is None:
+                for index in sorted(ready):
+                    pending[executor.submit(start_plugin, plugins[index])] = index
+
+    if error is not None:
+        raise error
+
+    # Any plugins that weren't started require a plugin that failed to start
+    # (or require one that does etc.).
+    for index, plugin in enumerate(plugins):
+        if index not in failed and counts[index] > 0:
+            on_error(plugin, _requirement_error(plugin))
+
+
+def _get_requirements(plugins):
+    """Return the requirements between plugins.
+
+    Return a tuple containing, for each plugin, the set of the indices of the
+    plugins that it requires, and the list of the indices of the plugins
+    that require it.
+
+    """
+
+    # { name : [index] }
+    providers = {}
+    for index, plugin in enumerate(plugins):
+        for name in [plugin.id, *plugin.provides]:
+            providers.setdefault(name, []).append(index)
+
+    requirements = [set() for plugin in plugins]
+    for index, plugin in enumerate(plugins):
+        for name in plugin.requires:
+            if name not in providers:
+                logger.warning(
+                    "plugin %s requires <%s>, which no plugin provides",
+                    plugin.id,
+                    name,
+                )
+
+            requirements[index].update(providers.get(name, []))
+            requirements[index].discard(index)
+
+    dependents = [[] for plugin in plugins]
+    for index, required in enumerate(requirements):
+        for required_index in sorted(required):
+            dependents[required_index].append(index)
+
+    return requirements, dependents
+
+
+def _requirement_error(plugin):
+    """Return the error for a plugin that requires a plugin that failed."""
+
+    return ValueError(
+        "plugin %s was not started because a plugin it requires failed to start"
+        % plugin.id
+    )
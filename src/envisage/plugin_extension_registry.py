@@ -45,12 +45,10 @@ class PluginExtensionRegistry(ProviderExtensionRegistry):
         # the registry's plugin manager on the fly, but hey... Hence, 'old'
         # will probably always be 'None'!
         if old is not None:
-            for plugin in old:
-                self.remove_provider(plugin)
+            self.remove_providers(list(old))
 
         if new is not None:
-            for plugin in new:
-                self.add_provider(plugin)
+            self.add_providers(list(new))
 
     @on_trait_change("plugin_manager:plugin_added")
     def _on_plugin_added(self, obj, trait_name, old, event):
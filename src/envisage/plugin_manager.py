@@ -11,12 +11,27 @@
 
 import logging
 
-from traits.api import Event, HasTraits, Instance, List, observe, provides
+from traits.api import (
+    Any,
+    Event,
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    observe,
+    provides,
+    Set,
+)
 
 from .i_application import IApplication
 from .i_plugin import IPlugin
 from .i_plugin_manager import IPluginManager
+from .i_profiler import IProfiler
+from .plugin_dependencies import sort_plugins
 from .plugin_event import PluginEvent
+from .plugin_report import PluginReport
+from .plugin_supervisor import PluginSupervisor, PluginTimeoutError
+from .profiler import NullProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +63,21 @@ class PluginManager(HasTraits):
     #: The application that the plugin manager is part of.
     application = Instance(IApplication)
 
+    #: The maximum number of plugins that are started at the same time (by a
+    #: pool of threads). Plugins are only started once the plugins that they
+    #: require have been. By default plugins are started one at a time.
+    max_workers = Int(1)
+
+    #: The profiler that records how long each plugin takes to start and stop
+    #: (the application's, if the plugin manager is the application's). By
+    #: default nothing is recorded.
+    profiler = Instance(IProfiler, factory=NullProfiler)
+
+    #: Supervises starting and stopping the plugins (timeouts and what to do
+    #: if a plugin fails). By default the first exception raised by a plugin
+    #: aborts the start (or stop).
+    supervisor = Instance(PluginSupervisor, factory=PluginSupervisor)
+
     @observe("application")
     def _set_new_application_on_all_plugins(self, event):
         """Static trait change handler."""
@@ -87,16 +117,13 @@ class PluginManager(HasTraits):
         self.plugin_added = PluginEvent(plugin=plugin)
 
     def get_plugin(self, plugin_id):
-        """Return the plugin with the specified Id."""
+        """Return the plugin with the specified Id.
 
-        for plugin in self._plugins:
-            if plugin_id == plugin.id:
-                break
+        If more than one plugin has the Id then the first one is returned.
 
-        else:
-            plugin = None
+        """
 
-        return plugin
+        return self._get_plugins_by_id().get(plugin_id)
 
     def remove_plugin(self, plugin):
         """Remove a plugin from the manager."""
@@ -105,10 +132,25 @@ class PluginManager(HasTraits):
         self.plugin_removed = PluginEvent(plugin=plugin)
 
     def start(self):
-        """Start the plugin manager."""
+        """Start the plugin manager.
+
+        Plugins are started after the plugins that they require, and
+        otherwise in the order that they were added.
 
-        for plugin in self._plugins:
-            self.start_plugin(plugin)
+        Return a 'PluginReport' of the plugins that failed to start.
+
+        """
+
+        failures = self.supervisor.start_plugins(
+            self.start_plugin, self._plugins, self.max_workers, self.stop_plugin
+        )
+        self._failed_plugins = {
+            failure.plugin
+            for failure in failures
+            if not isinstance(failure.error, PluginTimeoutError)
+        }
+
+        return PluginReport(failures=failures)
 
     def start_plugin(self, plugin=None, plugin_id=None):
         """Start the specified plugin."""
@@ -116,21 +158,34 @@ class PluginManager(HasTraits):
         plugin = plugin or self.get_plugin(plugin_id)
         if plugin is not None:
             logger.debug("plugin %s starting", plugin.id)
-            plugin.activator.start_plugin(plugin)
+            with self.profiler.span("plugin.start", plugin=plugin.id):
+                plugin.activator.start_plugin(plugin)
             logger.debug("plugin %s started", plugin.id)
 
         else:
             raise ValueError("no such plugin %s" % plugin_id)
 
     def stop(self):
-        """Stop the plugin manager."""
+        """Stop the plugin manager.
+
+        Return a 'PluginReport' of the plugins that failed to stop.
+
+        """
 
-        # We stop the plugins in the reverse order that they were started.
-        stop_order = self._plugins[:]
-        stop_order.reverse()
+        # We stop the plugins in the reverse order that they were started,
+        # except for those that failed to start (or weren't started because a
+        # plugin they require failed). Plugins that timed out are stopped, as
+        # they may have finished starting since.
+        stop_order = [
+            plugin
+            for plugin in reversed(sort_plugins(self._plugins))
+            if plugin not in self._failed_plugins
+        ]
+        self._failed_plugins = set()
 
-        for plugin in stop_order:
-            self.stop_plugin(plugin)
+        failures = self.supervisor.stop_plugins(self.stop_plugin, stop_order)
+
+        return PluginReport(failures=failures)
 
     def stop_plugin(self, plugin=None, plugin_id=None):
         """Stop the specified plugin."""
@@ -138,7 +193,8 @@ class PluginManager(HasTraits):
         plugin = plugin or self.get_plugin(plugin_id)
         if plugin is not None:
             logger.debug("plugin %s stopping", plugin.id)
-            plugin.activator.stop_plugin(plugin)
+            with self.profiler.span("plugin.stop", plugin=plugin.id):
+                plugin.activator.stop_plugin(plugin)
             logger.debug("plugin %s stopped", plugin.id)
 
         else:
@@ -149,17 +205,42 @@ class PluginManager(HasTraits):
     # The plugins that the manager manages!
     _plugins = List(IPlugin)
 
+    # The plugins indexed by Id (built when it is first needed).
+    #
+    # { plugin_id : plugin }
+    #
+    # If more than one plugin has the same Id then the first one is indexed.
+    _plugins_by_id = Any
+
+    # The plugins that failed to start (other than by timing out), or weren't
+    # started because a plugin they require failed, when the manager was last
+    # started.
+    _failed_plugins = Set
+
     @observe("_plugins")
     def _update_application_on_all_plugins(self, event):
         """Static trait change handler."""
         old, new = event.old, event.new
         self._update_application_on_plugins(old, new)
+        self._plugins_by_id = None
 
     @observe("_plugins:items")
     def _update_application_on_changed_plugins(self, event):
         """Static trait change handler."""
 
         self._update_application_on_plugins(event.removed, event.added)
+        if self._plugins_by_id is not None:
+            self._update_plugins_by_id(event.removed, event.added)
+
+    def _get_plugins_by_id(self):
+        """Return the plugins indexed by Id."""
+
+        plugins_by_id = self._plugins_by_id
+        if plugins_by_id is None:
+            plugins_by_id = self._plugins_by_id = {}
+            self._update_plugins_by_id([], self._plugins)
+
+        return plugins_by_id
 
     #### Private protocol #####################################################
 
@@ -171,3 +252,22 @@ class PluginManager(HasTraits):
 
         for plugin in added:
             plugin.application = self.application
+
+    def _update_plugins_by_id(self, removed, added):
+        """Update the index of plugins by Id for plugins added/removed."""
+
+        plugins_by_id = self._plugins_by_id
+
+        for plugin in removed:
+            if plugins_by_id.get(plugin.id) is plugin:
+                del plugins_by_id[plugin.id]
+
+                # Another plugin may have the same Id.
+                for other in self._plugins:
+                    if other.id == plugin.id:
+                        plugins_by_id[plugin.id] = other
+                        break
+
+        for plugin in added:
+            if plugins_by_id.setdefault(plugin.id, plugin) is not plugin:
+                logger.warning("more than one plugin has the Id <%s>", plugin.id)
@@ -0,0 +1,386 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Static descriptions of plugins, and plugins that are loaded on demand."""
+
+# Standard library imports.
+import json
+import logging
+
+# Enthought library imports.
+from traits.api import Bool, HasTraits, Instance, List, on_trait_change, Str
+from traits.util.camel_case import camel_case_to_words
+
+# Local imports.
+from .extension_point import ExtensionPoint
+from .i_plugin import IPlugin
+from .import_manager import ImportManager
+from .plugin import Plugin
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+class PluginManifest(HasTraits):
+    """A static description of a plugin.
+
+    A manifest says which extension points a plugin offers and which
+    extension points it contributes to, so that the plugin doesn't have to
+    be imported (let alone created) to find out. Manifests are usually
+    generated from the plugin class and saved next to it, e.g.::
+
+        manifest = PluginManifest.from_plugin_class(AcmePlugin)
+        manifest.save('acme/plugin_manifest.json')
+
+    and then loaded by the application instead of the plugin::
+
+        manifest = PluginManifest.load('acme/plugin_manifest.json')
+        plugin_manager.add_plugin(manifest.create_plugin())
+
+    """
+
+    #### 'PluginManifest' interface ###########################################
+
+    #: The plugin's unique identifier.
+    id = Str
+
+    #: The plugin's name (suitable for displaying to the user).
+    name = Str
+
+    #: The symbol path of the plugin class (in the form used by
+    #: 'ImportManager.import_symbol').
+    plugin_class = Str
+
+    #: The Ids of the extension points offered by the plugin.
+    extension_points = List(Str)
+
+    #: The Ids of the extension points that the plugin contributes to.
+    contributions = List(Str)
+
+    #: The plugin's requirements (see 'IPlugin.requires').
+    requires = List(Str)
+
+    #: What the plugin provides (see 'IPlugin.provides').
+    provides = List(Str)
+
+    #: Can the plugin be loaded when one of its contributions is first
+    #: requested, rather than when it is started? Plugins that do their own
+    #: work in 'start' usually can't.
+    lazy = Bool(True)
+
+    @classmethod
+    def from_plugin_class(cls, klass, instantiate=False, **traits):
+        """Generate the manifest of a plugin class.
+
+        The class is introspected, but not instantiated. Any traits given
+        override the ones taken from the class, which is necessary if the
+        class computes its Id, name, requirements or what it provides
+        dynamically, unless 'instantiate' is True, in which case a plugin is
+        created (without an application) to find out what they are.
+
+        """
+
+        # The traits taken from the class, with the functions that compute
+        # their defaults for classes that don't give them a value.
+        static_traits = [
+            ("id", _default_id),
+            ("name", _default_name),
+            ("requires", None),
+            ("provides", None),
+        ]
+
+        plugin = None
+        for trait_name, default in static_traits:
+            if trait_name in traits:
+                continue
+
+            try:
+                traits[trait_name] = _get_class_default(klass, trait_name, default)
+
+            except ValueError:
+                if not instantiate:
+                    raise
+
+                if plugin is None:
+                    plugin = klass()
+
+                value = getattr(plugin, trait_name)
+                traits[trait_name] = list(value) if isinstance(value, list) else value
+
+        manifest = cls(
+            plugin_class="%s:%s" % (klass.__module__, klass.__name__),
+            extension_points=[
+                trait.trait_type.id
+                for trait in klass.class_traits(__extension_point__=True).values()
+            ],
+            contributions=list(
+                dict.fromkeys(
+                    trait.contributes_to
+                    for trait in klass.class_traits(
+                        contributes_to=lambda value: value is not None
+                    ).values()
+                )
+            ),
+            lazy=klass.start is Plugin.start,
+            **traits,
+        )
+
+        return manifest
+
+    @classmethod
+    def load(cls, filename):
+        """Load a manifest from a JSON file."""
+
+        with open(filename, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def create_plugin(self, **traits):
+        """Create a plugin that stands in for the plugin described."""
+
+        return ManifestPlugin(manifest=self, **traits)
+
+    def save(self, filename):
+        """Save the manifest to a JSON file."""
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.trait_get(), f, indent=4)
+            f.write("\n")
+
+
+class ManifestPlugin(Plugin):
+    """A plugin that stands in for the plugin described by a manifest.
+
+    The extension points and contributions of the actual plugin are taken
+    from the manifest, and the actual plugin is only imported and created
+    when one of its contributions is requested (or when it is started, if
+    the manifest says that the plugin isn't lazy). If the actual plugin is
+    loaded after this one was started, then it is started straight away.
+
+    """
+
+    #### 'ManifestPlugin' interface ###########################################
+
+    #: The manifest of the actual plugin.
+    manifest = Instance(PluginManifest)
+
+    #: The actual plugin (None until it is loaded).
+    plugin = Instance(IPlugin)
+
+    #: The symbol path of the actual plugin's class (in the form used by
+    #: 'ImportManager.import_symbol'). If no manifest is given, then it is
+    #: generated from the class when it is first needed (which imports the
+    #: class).
+    plugin_class = Str
+
+    #### Private interface ####################################################
+
+    # The placeholders for the extension points offered by the actual plugin.
+    _extension_points = List
+
+    # Has this plugin been started?
+    _started = Bool(False)
+
+    ###########################################################################
+    # 'IExtensionProvider' interface.
+    ###########################################################################
+
+    def get_extension_points(self):
+        """Return the extension points offered by the provider."""
+
+        return self._extension_points
+
+    def get_extensions(self, extension_point_id):
+        """Return the provider's extensions to an extension point."""
+
+        if extension_point_id not in self.manifest.contributions:
+            return []
+
+        return self.load().get_extensions(extension_point_id)
+
+    ###########################################################################
+    # 'IPlugin' interface.
+    ###########################################################################
+
+    #### Trait initializers ###################################################
+
+    def _id_default(self):
+        """Trait initializer."""
+
+        # Setting the Id when the plugin is created gets the default first
+        # (to notify listeners of the change), and that mustn't generate the
+        # manifest.
+        if not self.traits_inited():
+            return ""
+
+        return self.manifest.id
+
+    def _name_default(self):
+        """Trait initializer."""
+
+        # See '_id_default'.
+        if not self.traits_inited():
+            return ""
+
+        return self.manifest.name
+
+    def _provides_default(self):
+        """Trait initializer."""
+
+        return self.manifest.provides
+
+    def _requires_default(self):
+        """Trait initializer."""
+
+        return self.manifest.requires
+
+    #### Methods ##############################################################
+
+    def start(self):
+        """Start the plugin."""
+
+        self._started = True
+        if self.plugin is not None:
+            self._start_plugin()
+
+        elif not self.manifest.lazy:
+            self.load()
+
+    def stop(self):
+        """Stop the plugin."""
+
+        if self.plugin is not None:
+            self.plugin.activator.stop_plugin(self.plugin)
+
+        self._started = False
+
+    ###########################################################################
+    # 'ManifestPlugin' interface.
+    ###########################################################################
+
+    def load(self):
+        """Load (and if necessary, start) the actual plugin.
+
+        Return the actual plugin.
+
+        """
+
+        if self.plugin is None:
+            logger.debug("plugin %s loading", self.id)
+            import_manager = self._get_import_manager()
+            klass = import_manager.import_symbol(self.manifest.plugin_class)
+            self.plugin = klass(application=self.application)
+
+            if self.plugin.id != self.id:
+                logger.warning(
+                    "plugin %s has Id <%s> in its manifest", self.plugin.id, self.id
+                )
+
+            if self._started:
+                self._start_plugin()
+
+        return self.plugin
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    #### Trait initializers ###################################################
+
+    def _manifest_default(self):
+        """Trait initializer."""
+
+        # See '_id_default' (here it's the manifest itself being set).
+        if not self.traits_inited():
+            return PluginManifest()
+
+        try:
+            klass = self._get_import_manager().import_symbol(self.plugin_class)
+            manifest = PluginManifest.from_plugin_class(klass, instantiate=True)
+
+        # A plugin that can't be loaded doesn't offer or contribute anything.
+        except Exception:
+            logger.exception("error loading plugin %s", self.plugin_class)
+            manifest = PluginManifest(plugin_class=self.plugin_class)
+
+        return manifest
+
+    def __extension_points_default(self):
+        """Trait initializer."""
+
+        return [
+            ExtensionPoint(id=extension_point_id)
+            for extension_point_id in self.manifest.extension_points
+        ]
+
+    #### Trait change handlers ################################################
+
+    def _application_changed(self, new):
+        """Static trait change handler."""
+
+        if self.plugin is not None:
+            self.plugin.application = new
+
+    @on_trait_change("plugin:extension_point_changed")
+    def _plugin_extension_point_changed(self, event):
+        """Dynamic trait change handler."""
+
+        self.extension_point_changed = event
+
+    #### Methods ##############################################################
+
+    def _get_import_manager(self):
+        """Return the import manager used to import the actual plugin."""
+
+        return self.application or ImportManager()
+
+    def _start_plugin(self):
+        """Start the actual plugin."""
+
+        logger.debug("plugin %s starting on load", self.id)
+        self.plugin.activator.start_plugin(self.plugin)
+
+
+def _default_id(klass):
+    """Return the Id that a plugin class without an Id gets."""
+
+    return "%s.%s" % (klass.__module__, klass.__name__)
+
+
+def _default_name(klass):
+    """Return the name that a plugin class without a name gets."""
+
+    return camel_case_to_words(klass.__name__)
+
+
+def _get_class_default(klass, trait_name, default=None):
+    """Return the static default value of a trait of a plugin class.
+
+    'default' is called with the class to get the default value of a string
+    trait that the class doesn't give a value.
+
+    """
+
+    if getattr(klass, "_%s_default" % trait_name, None) is not getattr(
+        Plugin, "_%s_default" % trait_name, None
+    ):
+        raise ValueError(
+            "plugin class <%s> computes its %s - specify it explicitly"
+            % (klass.__name__, trait_name)
+        )
+
+    value = klass.__class_traits__[trait_name].default_value()[1]
+    if isinstance(value, list):
+        value = list(value)
+
+    # Unless the class gives a value, the default is computed by the plugin's
+    # trait initializer.
+    elif not isinstance(value, str) or not value:
+        value = default(klass)
+
+    return value
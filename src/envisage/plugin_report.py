@@ -0,0 +1,82 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Reports of what went wrong when starting or stopping plugins."""
+
+# Enthought library imports.
+from traits.api import Bool, Enum, HasTraits, Instance, Int, List
+
+# Local imports.
+from .i_plugin import IPlugin
+
+
+class PluginFailure(HasTraits):
+    """A plugin that failed to start or stop."""
+
+    #### 'PluginFailure' interface ############################################
+
+    #: The plugin.
+    plugin = Instance(IPlugin)
+
+    #: What the plugin failed to do.
+    action = Enum("start", "stop")
+
+    #: The exception raised (a 'PluginTimeoutError' if the plugin took too
+    #: long).
+    error = Instance(BaseException)
+
+    #: The number of attempts made (0 if the plugin wasn't started because a
+    #: plugin it requires failed to start).
+    attempts = Int
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __repr__(self):
+        """Return a string representation of the failure."""
+
+        return "PluginFailure(%s failed to %s: %r)" % (
+            self.plugin.id,
+            self.action,
+            self.error,
+        )
+
+
+class PluginReport(HasTraits):
+    """A report of what went wrong when starting or stopping plugins.
+
+    This is what 'Application.start' and 'Application.stop' return. A report
+    is true unless the start or stop was vetoed, so::
+
+        if application.start():
+            ...
+
+    still works, even if some plugins failed (which is only possible if the
+    plugin manager's supervisor doesn't abort on failures).
+
+    """
+
+    #### 'PluginReport' interface #############################################
+
+    #: The plugins that failed to start or stop (in the order that they
+    #: failed).
+    failures = List(Instance(PluginFailure))
+
+    #: Was the start or stop vetoed?
+    vetoed = Bool(False)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __bool__(self):
+        """Return True unless the start or stop was vetoed."""
+
+        return not self.vetoed
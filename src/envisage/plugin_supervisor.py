@@ -0,0 +1,254 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Supervises starting and stopping plugins."""
+
+# Standard library imports.
+import logging
+import threading
+import time
+
+# Enthought library imports.
+from traits.api import Enum, Float, HasTraits, Int, Union
+
+# Local imports.
+from .plugin_dependencies import start_plugins
+from .plugin_report import PluginFailure
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+class PluginTimeoutError(Exception):
+    """The exception raised when a plugin takes too long to start or stop."""
+
+
+class PluginSupervisor(HasTraits):
+    """Supervises starting and stopping plugins.
+
+    By default a supervisor does nothing but start and stop the plugins, and
+    the first exception raised by a plugin aborts the start (or stop). To let
+    an application come up even if some of its plugins don't, e.g.::
+
+        plugin_manager.supervisor = PluginSupervisor(
+            policy='retry', start_timeout=30.0
+        )
+
+    and then look at the report returned by 'Application.start'.
+
+    If a timeout is given, then each plugin is started (or stopped) in a
+    supervising thread of its own, so plugins must be safe to start in a
+    thread other than the main one. A plugin that times out is reported as
+    having failed, but its thread can't be stopped, so it may still finish
+    starting (or stopping) later on.
+
+    Unless the policy is 'abort', a plugin that fails to start (other than
+    by timing out) is stopped straight away, to undo whatever it did before
+    it failed (e.g. connecting its extension point traits), before it is
+    retried or reported, and it isn't stopped again when the other plugins
+    are. So a plugin's 'stop' must cope with a 'start' that didn't finish.
+
+    """
+
+    #### 'PluginSupervisor' interface #########################################
+
+    #: What to do when a plugin fails to start or stop:
+    #:
+    #: - 'abort' raises the exception (and no more plugins are started or
+    #:   stopped).
+    #: - 'skip' reports the failure and carries on with the other plugins
+    #:   (except for the plugins that require a plugin that failed to start,
+    #:   which aren't started).
+    #: - 'retry' tries again (up to 'retries' times, waiting longer each
+    #:   time) and then reports the failure and carries on as for 'skip'.
+    #:   Plugins that time out aren't retried, as they may still be running.
+    policy = Enum("abort", "skip", "retry")
+
+    #: The number of seconds that a plugin can take to start (None means that
+    #: there is no limit).
+    start_timeout = Union(None, Float)
+
+    #: The number of seconds that a plugin can take to stop (None means that
+    #: there is no limit).
+    stop_timeout = Union(None, Float)
+
+    #: The maximum number of times that a plugin is retried (if the policy is
+    #: 'retry').
+    retries = Int(3)
+
+    #: The number of seconds to wait before the first retry.
+    retry_delay = Float(1.0)
+
+    #: The factor that the wait is multiplied by after each retry.
+    backoff = Float(2.0)
+
+    def start_plugins(self, start_plugin, plugins, max_workers=1, stop_plugin=None):
+        """Start plugins in an order that respects their requirements.
+
+        'start_plugin' is called with each plugin to start it (see the
+        'start_plugins' function for 'max_workers'). If 'stop_plugin' is
+        given, then unless the policy is 'abort', it is called with each
+        plugin that fails to start, to undo whatever the plugin did before
+        it failed.
+
+        Return the list of 'PluginFailure's.
+
+        """
+
+        attempts = {}
+        failures = []
+
+        def start(plugin):
+            self._call(
+                start_plugin,
+                plugin,
+                self.start_timeout,
+                "start",
+                attempts,
+                undo=None if self.policy == "abort" else stop_plugin,
+            )
+
+        def on_error(plugin, error):
+            failures.append(
+                PluginFailure(
+                    plugin=plugin,
+                    action="start",
+                    error=error,
+                    attempts=attempts.get(plugin, 0),
+                )
+            )
+
+        start_plugins(
+            start,
+            plugins,
+            max_workers,
+            on_error=None if self.policy == "abort" else on_error,
+        )
+
+        return failures
+
+    def stop_plugins(self, stop_plugin, plugins):
+        """Stop plugins in the order given.
+
+        'stop_plugin' is called with each plugin to stop it.
+
+        Return the list of 'PluginFailure's.
+
+        """
+
+        attempts = {}
+        failures = []
+        for plugin in plugins:
+            try:
+                self._call(stop_plugin, plugin, self.stop_timeout, "stop", attempts)
+
+            except Exception as error:
+                if self.policy == "abort":
+                    raise
+
+                failures.append(
+                    PluginFailure(
+                        plugin=plugin,
+                        action="stop",
+                        error=error,
+                        attempts=attempts[plugin],
+                    )
+                )
+
+        return failures
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _call(self, function, plugin, timeout, action, attempts, undo=None):
+        """Call a function with a plugin, retrying if the policy says so.
+
+        The number of attempts made is recorded in 'attempts'. If 'undo' is
+        given, then it is called with the plugin after each attempt that
+        fails (other than by timing out, as the attempt may still be
+        running).
+
+        """
+
+        retries = self.retries if self.policy == "retry" else 0
+        delay = self.retry_delay
+        for attempt in range(retries + 1):
+            attempts[plugin] = attempt + 1
+            try:
+                _call_with_timeout(function, plugin, timeout, action)
+                break
+
+            except PluginTimeoutError:
+                raise
+
+            except Exception:
+                if undo is not None:
+                    self._undo(undo, plugin, action)
+
+                if attempt == retries:
+                    raise
+
+                logger.exception(
+                    "plugin %s failed to %s, retrying in %ss", plugin.id, action, delay
+                )
+                time.sleep(delay)
+                delay *= self.backoff
+
+    def _undo(self, undo, plugin, action):
+        """Undo a failed attempt to start (or stop) a plugin.
+
+        Any exception is logged rather than raised, so that it doesn't hide
+        the exception that the attempt failed with.
+
+        """
+
+        try:
+            undo(plugin)
+
+        except Exception:
+            logger.exception("error undoing failed %s of plugin %s", action, plugin.id)
+
+
+def _call_with_timeout(function, plugin, timeout, action):
+    """Call a function with a plugin, in a thread if there is a timeout.
+
+    Raise a 'PluginTimeoutError' if the function doesn't return in time.
+
+    """
+
+    if timeout is None:
+        function(plugin)
+        return
+
+    # The exception raised by the function (if any).
+    errors = []
+
+    def target():
+        try:
+            function(plugin)
+
+        except BaseException as error:
+            errors.append(error)
+
+    # The thread is a daemon so that a plugin that never finishes doesn't
+    # stop the process from exiting.
+    thread = threading.Thread(
+        target=target, name="PluginSupervisor-%s" % plugin.id, daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+
+    if thread.is_alive():
+        raise PluginTimeoutError(
+            "plugin %s took longer than %ss to %s" % (plugin.id, timeout, action)
+        )
+
+    if errors:
+        raise errors[0]
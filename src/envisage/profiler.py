@@ -0,0 +1,181 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Profilers."""
+
+# Standard library imports.
+import contextlib
+import json
+import os
+import threading
+import time
+
+# Enthought library imports.
+from traits.api import Any, Float, HasTraits, provides
+
+# Local imports.
+from .i_profiler import IProfiler
+
+# The context manager returned by the null profiler (which can be reused).
+_NULL_SPAN = contextlib.nullcontext()
+
+
+@provides(IProfiler)
+class NullProfiler(HasTraits):
+    """A profiler that doesn't record anything.
+
+    This is the default profiler used by applications, plugin managers and
+    registries.
+
+    """
+
+    ###########################################################################
+    # 'IProfiler' interface.
+    ###########################################################################
+
+    def reset(self):
+        """Discard all of the spans recorded so far."""
+
+    def save(self, filename):
+        """Save the spans recorded so far as a Chrome trace event file."""
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": []}, f)
+
+    def span(self, name, category="envisage", **args):
+        """Return a context manager that records a span while it is entered."""
+
+        return _NULL_SPAN
+
+    def trace_events(self):
+        """Return the spans recorded so far as Chrome trace events."""
+
+        return []
+
+
+@provides(IProfiler)
+class Profiler(HasTraits):
+    """A profiler that records spans in memory.
+
+    e.g.::
+
+        application = Application(profiler=Profiler(), ...)
+        application.start()
+        application.profiler.save('start-up.json')
+
+    """
+
+    #### Private interface ####################################################
+
+    # The lock that guards the events.
+    _lock = Any
+
+    # The recorded spans (as trace events).
+    _events = Any
+
+    # The 'time.perf_counter' value that the event times are relative to.
+    _origin = Float
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._lock = threading.Lock()
+        self._events = []
+        self._origin = time.perf_counter()
+
+    ###########################################################################
+    # 'IProfiler' interface.
+    ###########################################################################
+
+    def reset(self):
+        """Discard all of the spans recorded so far."""
+
+        with self._lock:
+            self._events = []
+
+    def save(self, filename):
+        """Save the spans recorded so far as a Chrome trace event file."""
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"},
+                f,
+                indent=1,
+            )
+
+    def span(self, name, category="envisage", **args):
+        """Return a context manager that records a span while it is entered."""
+
+        return _Span(self, name, category, args)
+
+    def trace_events(self):
+        """Return the spans recorded so far as Chrome trace events."""
+
+        with self._lock:
+            # Spans are recorded when they end, so sort them by when they
+            # started (outer spans first).
+            return sorted(
+                (dict(event) for event in self._events),
+                key=lambda event: (event["ts"], -event["dur"]),
+            )
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _record(self, name, category, args, start, end):
+        """Record a span."""
+
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+
+        with self._lock:
+            self._events.append(event)
+
+
+class _Span:
+    """A context manager that records a span with a profiler."""
+
+    def __init__(self, profiler, name, category, args):
+        """Constructor."""
+
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        """Start the span."""
+
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """End (and record) the span."""
+
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+
+        self.profiler._record(self.name, self.category, self.args, self.start, end)
@@ -13,7 +13,7 @@
 import logging
 
 # Enthought library imports.
-from traits.api import List, on_trait_change, provides
+from traits.api import Dict, Int, List, on_trait_change, provides
 
 # Local imports.
 from .extension_registry import ExtensionRegistry
@@ -33,6 +33,39 @@ class ProviderExtensionRegistry(ExtensionRegistry):
     # The extension providers that populate the registry.
     _providers = List(IExtensionProvider)
 
+    #### Private interface ####################################################
+
+    # The contributions from all providers to each extension point that has
+    # been accessed, as a single list.
+    #
+    # { extension_point_id : [extension, ...] }
+    #
+    # This is kept in step with the list of lists in '_extensions' as
+    # providers are added and removed and their contributions change, so that
+    # getting the extensions doesn't have to concatenate all of the providers'
+    # contributions every time. It is never handed out, only copies of it.
+    _flattened_extensions = Dict
+
+    # The slot that holds each provider's contributions in the lists of lists
+    # in '_extensions'.
+    #
+    # { provider : slot }
+    #
+    # Providers are given slots in the order in which they are added. When a
+    # provider is removed its slot is left empty rather than deleted (so that
+    # the slots of the providers after it don't change), until the empty
+    # slots outnumber the used ones and the slots are compacted.
+    _provider_slots = Dict
+
+    # The number of slots (used and empty) in each list of lists.
+    _slot_count = Int
+
+    # The offsets of each slot's contributions in the whole list of
+    # contributions to each extension point that has been accessed.
+    #
+    # { extension_point_id : _OffsetIndex }
+    _offsets = Dict
+
     ###########################################################################
     # 'IExtensionRegistry' interface.
     ###########################################################################
@@ -54,6 +87,24 @@ class ProviderExtensionRegistry(ExtensionRegistry):
         for extension_point_id, (refs, added, index) in events.items():
             self._call_listeners(refs, extension_point_id, added, [], index)
 
+    def add_providers(self, providers):
+        """Add several extension providers at once."""
+
+        # The providers' contributions are all added to the end of the
+        # contributions to each extension point, so for each extension point
+        # they can be merged into a single event, at the index of the first.
+        events = {}
+        for provider in providers:
+            for extension_point_id, event in self._add_provider(provider).items():
+                if extension_point_id in events:
+                    events[extension_point_id][1].extend(event[1])
+
+                else:
+                    events[extension_point_id] = event
+
+        for extension_point_id, (refs, added, index) in events.items():
+            self._call_listeners(refs, extension_point_id, added, [], index)
+
     def get_providers(self):
         """Return all of the providers in the registry."""
 
@@ -71,6 +122,57 @@ class ProviderExtensionRegistry(ExtensionRegistry):
         for extension_point_id, (refs, removed, index) in events.items():
             self._call_listeners(refs, extension_point_id, [], removed, index)
 
+    def remove_providers(self, providers):
+        """Remove several extension providers at once.
+
+        Raise a 'ValueError' if any of the providers is not in the registry
+        (in which case none of them are removed).
+
+        """
+
+        slots = list(map(self._get_provider_slot, providers))
+        if len(set(slots)) < len(slots):
+            raise ValueError("providers can only be removed once")
+
+        # Find the runs of contributions to each extension point that the
+        # providers' contributions make up, before we remove them. Each run is
+        # removed by a single event, so listeners never see the contributions
+        # of other providers (in between runs) as being added or removed. The
+        # index of each event allows for the runs removed before it.
+        #
+        # { extension_point_id : [(index, removed), ...] }
+        events = {}
+        for extension_point_id, extensions in self._extensions.items():
+            offsets = self._offsets[extension_point_id]
+            all = self._flattened_extensions[extension_point_id]
+
+            runs = []
+            for offset, length in sorted(
+                (offsets.offset(slot), len(extensions[slot]))
+                for slot in slots
+                if len(extensions[slot]) > 0
+            ):
+                if runs and runs[-1][0] + runs[-1][1] == offset:
+                    runs[-1][1] += length
+
+                else:
+                    runs.append([offset, length])
+
+            count = 0
+            for offset, length in runs:
+                events.setdefault(extension_point_id, []).append(
+                    (offset - count, all[offset : offset + length])
+                )
+                count += length
+
+        for provider in providers:
+            self._remove_provider(provider)
+
+        for extension_point_id, removals in events.items():
+            refs = self._get_listener_refs(extension_point_id)
+            for index, removed in removals:
+                self._call_listeners(refs, extension_point_id, [], removed, index)
+
     ###########################################################################
     # Protected 'ExtensionRegistry' interface.
     ###########################################################################
@@ -85,11 +187,11 @@ class ProviderExtensionRegistry(ExtensionRegistry):
                 "getting extensions of unknown extension point <%s>"
                 % extension_point_id
             )
-            extensions = []
+            all = []
 
         # Has this extension point already been accessed?
         elif extension_point_id in self._extensions:
-            extensions = self._extensions[extension_point_id]
+            all = self._flattened_extensions[extension_point_id]
 
         # If not, then ask each provider for its contributions to the extension
         # point.
@@ -97,19 +199,16 @@ class ProviderExtensionRegistry(ExtensionRegistry):
             extensions = self._initialize_extensions(extension_point_id)
             self._extensions[extension_point_id] = extensions
 
-        # We store the extensions as a list of lists, with each inner list
-        # containing the contributions from a single provider. Here we just
-        # concatenate them into a single list.
-        #
-        # You could use a list comprehension, here:-
-        #
-        #     all = [x for y in extensions for x in y]
-        #
-        # But I'm sure that that makes it any clearer ;^)
+            # We store the extensions as a list of lists, with each inner list
+            # containing the contributions from a single provider, and also
+            # concatenated into a single list.
+            all = []
+            for extensions_of_single_provider in extensions:
+                all.extend(extensions_of_single_provider)
+            self._flattened_extensions[extension_point_id] = all
 
-        all = []
-        for extensions_of_single_provider in extensions:
-            all.extend(extensions_of_single_provider)
+        # Callers must copy the list if they hand it on ('get_extensions'
+        # does).
         return all
 
     ###########################################################################
@@ -119,6 +218,10 @@ class ProviderExtensionRegistry(ExtensionRegistry):
     def _add_provider(self, provider):
         """Add a new provider."""
 
+        # Give the provider the next slot.
+        self._provider_slots[provider] = self._slot_count
+        self._slot_count += 1
+
         # Add the provider's extension points.
         self._add_provider_extension_points(provider)
 
@@ -144,14 +247,21 @@ class ProviderExtensionRegistry(ExtensionRegistry):
         for extension_point_id, extensions in self._extensions.items():
             new = provider.get_extensions(extension_point_id)
 
+            # The provider's contributions go at the end.
+            all = self._flattened_extensions[extension_point_id]
+
             # We only need fire an event for this extension point if the
             # provider contributes any extensions.
             if len(new) > 0:
-                index = sum(map(len, extensions))
+                index = len(all)
                 refs = self._get_listener_refs(extension_point_id)
                 events[extension_point_id] = (refs, new[:], index)
 
-            extensions.append(new)
+            # Keep a copy of the provider's contributions, so that we know
+            # what they were when they change.
+            extensions.append(new[:])
+            all.extend(new)
+            self._offsets[extension_point_id].append(len(new))
 
         return events
 
@@ -172,6 +282,11 @@ class ProviderExtensionRegistry(ExtensionRegistry):
 
         # And finally take it out of the list of providers.
         self._providers.remove(provider)
+        del self._provider_slots[provider]
+
+        # Compact the slots once most of them are empty.
+        if 2 * len(self._provider_slots) < self._slot_count:
+            self._compact_slots()
 
         return events
 
@@ -183,23 +298,30 @@ class ProviderExtensionRegistry(ExtensionRegistry):
         # need to fire.
         events = {}
 
-        # Find the index of the provider in the provider list. Its
-        # contributions are at the same index in the extensions list of lists.
-        index = self._providers.index(provider)
+        # Find the provider's slot. Its contributions are in the same slot in
+        # the extensions list of lists.
+        slot = self._get_provider_slot(provider)
 
         # Does the provider contribute any extensions to an extension point
         # that has already been accessed?
         for extension_point_id, extensions in self._extensions.items():
-            old = extensions[index]
+            old = extensions[slot]
 
             # We only need fire an event for this extension point if the
             # provider contributed any extensions.
             if len(old) > 0:
-                offset = sum(map(len, extensions[:index]))
+                offsets = self._offsets[extension_point_id]
+                offset = offsets.offset(slot)
                 refs = self._get_listener_refs(extension_point_id)
                 events[extension_point_id] = (refs, old[:], offset)
 
-            del extensions[index]
+                del self._flattened_extensions[extension_point_id][
+                    offset : offset + len(old)
+                ]
+                offsets.update(slot, -len(old))
+
+            # Leave the slot empty.
+            extensions[slot] = []
 
         return events
 
@@ -242,15 +364,20 @@ class ProviderExtensionRegistry(ExtensionRegistry):
         # empty list instead of barfing!
         extensions = self._extensions[extension_point_id]
 
-        # Find the index of the provider in the provider list. Its
-        # contributions are at the same index in the extensions list of lists.
-        provider_index = self._providers.index(obj)
-
-        # Get the updated list from the provider.
-        extensions[provider_index] = obj.get_extensions(extension_point_id)
+        # Find the provider's slot. Its contributions are in the same slot in
+        # the extensions list of lists.
+        slot = self._get_provider_slot(obj)
 
         # Find where the provider's contributions are in the whole 'list'.
-        offset = sum(map(len, extensions[:provider_index]))
+        offsets = self._offsets[extension_point_id]
+        offset = offsets.offset(slot)
+
+        # Get (a copy of) the updated list from the provider, and splice it
+        # into the whole 'list' in place of the provider's old contributions.
+        old = extensions[slot]
+        new = extensions[slot] = obj.get_extensions(extension_point_id)[:]
+        self._flattened_extensions[extension_point_id][offset : offset + len(old)] = new
+        offsets.update(slot, len(new) - len(old))
 
         # Translate the event index from one that refers to the list of
         # contributions from the provider, to the list of contributions from
@@ -267,14 +394,50 @@ class ProviderExtensionRegistry(ExtensionRegistry):
 
     #### Methods ##############################################################
 
+    def _compact_slots(self):
+        """Remove the empty slots, renumbering the providers' slots."""
+
+        old_slots = [self._provider_slots[provider] for provider in self._providers]
+
+        for extension_point_id, extensions in self._extensions.items():
+            extensions[:] = [extensions[slot] for slot in old_slots]
+            self._offsets[extension_point_id] = _OffsetIndex(map(len, extensions))
+
+        self._provider_slots = {
+            provider: slot for slot, provider in enumerate(self._providers)
+        }
+        self._slot_count = len(self._providers)
+
+    def _get_provider_slot(self, provider):
+        """Return the slot of a provider.
+
+        Raise a 'ValueError' if the provider is not in the registry.
+
+        """
+
+        try:
+            slot = self._provider_slots[provider]
+
+        except KeyError:
+            raise ValueError("provider <%s> is not in the registry" % provider)
+
+        return slot
+
     def _initialize_extensions(self, extension_point_id):
         """Initialize the extensions to an extension point."""
 
         # We store the extensions as a list of lists, with each inner list
-        # containing the contributions from a single provider.
-        extensions = []
-        for provider in self._providers:
-            extensions.append(provider.get_extensions(extension_point_id)[:])
+        # containing the contributions from a single provider (in its slot).
+        extensions = [[] for slot in range(self._slot_count)]
+        with self.profiler.span(
+            "extension_point.initialize", extension_point=extension_point_id
+        ):
+            for provider in self._providers:
+                extensions[self._provider_slots[provider]] = provider.get_extensions(
+                    extension_point_id
+                )[:]
+
+        self._offsets[extension_point_id] = _OffsetIndex(map(len, extensions))
 
         logger.debug("extensions to <%s> <%s>", extension_point_id, extensions)
 
@@ -290,3 +453,52 @@ class ProviderExtensionRegistry(ExtensionRegistry):
             index = index + offset
 
         return index
+
+
+class _OffsetIndex:
+    """The offsets of the providers' contributions to an extension point.
+
+    This is a Fenwick (binary indexed) tree over the number of contributions
+    in each provider slot, so that finding where a slot's contributions start
+    in the whole list of contributions, and changing the number of
+    contributions in a slot, both take O(log n) time.
+
+    """
+
+    def __init__(self, lengths=()):
+        """Constructor."""
+
+        # The tree is 1-based: node 'i' holds the total length of the slots
+        # in the range '(i - (i & -i), i]'.
+        self._tree = [0]
+        self._tree.extend(lengths)
+
+        for i in range(1, len(self._tree)):
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+
+    def append(self, length):
+        """Add a new slot with the given number of contributions."""
+
+        i = len(self._tree)
+        self._tree.append(length + self.offset(i - 1) - self.offset(i - (i & -i)))
+
+    def offset(self, slot):
+        """Return the total number of contributions in the slots before one."""
+
+        total = 0
+        i = slot
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+
+        return total
+
+    def update(self, slot, delta):
+        """Change the number of contributions in a slot."""
+
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
@@ -39,7 +39,8 @@ class Service(TraitType):
         # The protocol that the service must provide.
         self._protocol = protocol
 
-        # The optional query.
+        # The optional query (a string or a callable - see
+        # 'IServiceRegistry.get_services' for details).
         self._query = query
 
         # The optional name of the trait/property to minimize.
@@ -0,0 +1,198 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Service metrics collectors."""
+
+# Standard library imports.
+import bisect
+import math
+import threading
+
+# Enthought library imports.
+from traits.api import Any, Dict, HasTraits, observe, provides, Tuple
+
+# Local imports.
+from .i_service_metrics import IServiceMetrics
+
+# The upper bounds (in seconds) of the buckets that timings are counted in.
+DEFAULT_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+
+@provides(IServiceMetrics)
+class NullServiceMetrics(HasTraits):
+    """A service metrics collector that doesn't collect anything.
+
+    This is the default collector used by the service registry, which doesn't
+    even time anything while it is in use.
+
+    """
+
+    ###########################################################################
+    # 'IServiceMetrics' interface.
+    ###########################################################################
+
+    def dump(self):
+        """Return a snapshot of the metrics collected so far."""
+
+        return {}
+
+    def record_factory(self, protocol_name, seconds):
+        """Record that a service factory took a time to build a service."""
+
+    def record_lookup(self, protocol_name, seconds):
+        """Record that a lookup of a protocol took a time."""
+
+    def record_query(self, protocol_name, seconds):
+        """Record that evaluating a query over a service took a time."""
+
+    def reset(self):
+        """Discard all of the metrics collected so far."""
+
+
+@provides(IServiceMetrics)
+class ServiceMetrics(HasTraits):
+    """A service metrics collector that keeps counts and histograms.
+
+    For each protocol, it counts the lookups, query evaluations and factory
+    calls, and keeps the total, minimum and maximum time that they took,
+    along with a histogram of the times.
+
+    e.g.::
+
+        metrics = ServiceMetrics()
+        application.service_registry.metrics = metrics
+
+        ...
+
+        for protocol_name, timings in metrics.dump().items():
+            print(protocol_name, timings['lookups']['count'])
+
+    """
+
+    #### 'ServiceMetrics' interface ###########################################
+
+    #: The upper bounds (in seconds) of the histogram buckets. Times greater
+    #: than the last bound are counted in an extra, unbounded, bucket.
+    #: Changing the buckets discards the metrics collected so far.
+    buckets = Tuple(DEFAULT_BUCKETS)
+
+    #### Private interface ####################################################
+
+    # The timings recorded for each protocol.
+    #
+    # { protocol_name : { kind : _Timings } }
+    _timings = Dict
+
+    # The lock that guards the timings.
+    _lock = Any
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._lock = threading.Lock()
+
+    ###########################################################################
+    # 'IServiceMetrics' interface.
+    ###########################################################################
+
+    def dump(self):
+        """Return a snapshot of the metrics collected so far."""
+
+        with self._lock:
+            return {
+                protocol_name: {
+                    kind: timings.dump(self.buckets) for kind, timings in kinds.items()
+                }
+                for protocol_name, kinds in self._timings.items()
+            }
+
+    def record_factory(self, protocol_name, seconds):
+        """Record that a service factory took a time to build a service."""
+
+        self._record(protocol_name, "factories", seconds)
+
+    def record_lookup(self, protocol_name, seconds):
+        """Record that a lookup of a protocol took a time."""
+
+        self._record(protocol_name, "lookups", seconds)
+
+    def record_query(self, protocol_name, seconds):
+        """Record that evaluating a query over a service took a time."""
+
+        self._record(protocol_name, "queries", seconds)
+
+    def reset(self):
+        """Discard all of the metrics collected so far."""
+
+        with self._lock:
+            self._timings = {}
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    #### Trait change handlers ################################################
+
+    @observe("buckets")
+    def _reset_on_buckets_changed(self, event):
+        """Static trait change handler."""
+
+        self.reset()
+
+    #### Methods ##############################################################
+
+    def _record(self, protocol_name, kind, seconds):
+        """Record a time of the specified kind for a protocol."""
+
+        with self._lock:
+            kinds = self._timings.setdefault(protocol_name, {})
+            timings = kinds.get(kind)
+            if timings is None:
+                timings = kinds[kind] = _Timings(len(self.buckets) + 1)
+
+            timings.add(seconds, bisect.bisect_left(self.buckets, seconds))
+
+
+class _Timings:
+    """The times recorded for one kind of work on one protocol."""
+
+    def __init__(self, num_buckets):
+        """Constructor."""
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.counts = [0] * num_buckets
+
+    def add(self, seconds, bucket):
+        """Add a time that falls into the specified bucket."""
+
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.counts[bucket] += 1
+
+    def dump(self, buckets):
+        """Return a dictionary describing the times."""
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": list(zip(buckets + (math.inf,), self.counts)),
+        }
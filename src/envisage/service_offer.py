@@ -10,7 +10,7 @@
 """An offer to provide a service."""
 
 # Enthought library imports.
-from traits.api import Callable, Dict, HasTraits, Str, Type, Union
+from traits.api import Bool, Callable, Dict, Enum, HasTraits, Str, Type, Union
 
 
 class ServiceOffer(HasTraits):
@@ -33,6 +33,10 @@ class ServiceOffer(HasTraits):
     #:
     #:   callable(**properties) -> Any
     #:
+    #: The factory can also be a coroutine function, in which case the
+    #: service is only created by an asynchronous lookup, e.g.
+    #: 'await application.aget_service(protocol)'.
+    #:
     #: e.g. 'foo.bar.baz.Baz' is turned into 'from foo.bar.baz import Baz'
     factory = Union(Str, Callable)
 
@@ -40,3 +44,30 @@ class ServiceOffer(HasTraits):
     #:
     #: This dictionary is passed as keyword arguments to the factory.
     properties = Dict
+
+    #: How often the factory is called to create a service.
+    #:
+    #: 'singleton' services are created once, 'transient' services for every
+    #: lookup, and 'scoped' services once per service scope. See
+    #: 'IServiceRegistry.register_service' for details.
+    lifetime = Enum("singleton", "transient", "scoped")
+
+    #: An optional callable (or a string that can be used to import a
+    #: callable) that disposes of a service created by the factory.
+    #:
+    #: e.g::
+    #:
+    #:   callable(service) -> None
+    #:
+    #: It is called when the service is unregistered (e.g. when the plugin
+    #: that registered the offer is stopped), or when the scope of a scoped
+    #: service is closed.
+    dispose = Union(None, Str, Callable)
+
+    #: Should the service be created in the background as soon as the
+    #: application has started, rather than by the first lookup that needs it?
+    #:
+    #: This only applies to 'singleton' services whose factories are not
+    #: coroutine functions. The services are created in a thread pool, so
+    #: their factories must be safe to call from a background thread.
+    warm = Bool(False)
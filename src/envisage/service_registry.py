@@ -10,18 +10,99 @@
 """The service registry."""
 
 # Standard library imports.
+import asyncio
+import builtins
+import collections
+import functools
+import heapq
+import inspect
 import logging
+import operator
+import threading
+import time
+import types
+import weakref
 
 # Enthought library imports.
-from traits.api import Dict, Event, HasTraits, Int, provides
+from traits.api import (
+    Any,
+    Bool,
+    Dict,
+    Event,
+    HasTraits,
+    Instance,
+    Int,
+    observe,
+    provides,
+)
 
 # Local imports.
+from .i_import_manager import IImportManager
+from .i_profiler import IProfiler
+from .i_service_metrics import IServiceMetrics
 from .i_service_registry import IServiceRegistry
 from .import_manager import ImportManager
+from .profiler import NullProfiler
+from .service_metrics import NullServiceMetrics
+from .service_scope import get_active_scope, ServiceScope
 
 # Logging.
 logger = logging.getLogger(__name__)
 
+# The maximum number of compiled query strings that are cached.
+_QUERY_CACHE_SIZE = 256
+
+# The maximum number of imported symbols (string protocols and service
+# factories) that each registry caches.
+_SYMBOL_CACHE_SIZE = 256
+
+# The lifetimes that a service can have (see 'IServiceRegistry.register_service').
+SINGLETON = "singleton"
+TRANSIENT = "transient"
+SCOPED = "scoped"
+
+_LIFETIMES = (SINGLETON, TRANSIENT, SCOPED)
+
+# Returned in place of a service that a lookup can't create (because its factory
+# is asynchronous and the lookup isn't, or because it is a scoped service and no
+# scope is active).
+_NOT_CREATED = object()
+
+# The globals that queries are evaluated in (their namespace is their locals).
+_QUERY_GLOBALS = {"__builtins__": builtins}
+
+
+@functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _compile_query(query):
+    """Compile a query string.
+
+    Returns a tuple containing the code object, and whether the query contains
+    any nested scopes (and so must be evaluated with its namespace as its
+    globals).
+
+    """
+
+    code = compile(query, "<query>", "eval")
+    needs_globals = any(isinstance(const, types.CodeType) for const in code.co_consts)
+
+    return code, needs_globals
+
+
+def _get_query_names(code):
+    """Return the names used by a compiled query (and any nested scopes).
+
+    This includes attribute names, so it is a superset of the names that
+    the query looks up in its namespace.
+
+    """
+
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_get_query_names(const))
+
+    return names
+
 
 class NoSuchServiceError(Exception):
     """Raised when a required service is not found."""
@@ -29,7 +110,15 @@ class NoSuchServiceError(Exception):
 
 @provides(IServiceRegistry)
 class ServiceRegistry(HasTraits):
-    """The service registry."""
+    """The service registry.
+
+    The registry can be used from multiple threads. Registering and
+    unregistering services, and setting their properties, are serialized, but
+    lookups never wait for them: each lookup works from a snapshot of the
+    services registered against its protocol. A service factory is called
+    at most once, however many threads look the service up at the same time.
+
+    """
 
     ####  IServiceRegistry interface ##########################################
 
@@ -39,6 +128,36 @@ class ServiceRegistry(HasTraits):
     #: An event that is fired when a service is unregistered.
     unregistered = Event
 
+    ####  'ServiceRegistry' interface #########################################
+
+    #: Whether to cache the results of service lookups.
+    #:
+    #: If True, the services found by a lookup are remembered, keyed by the
+    #: protocol, query, minimize and maximize arguments, until a service is
+    #: registered or unregistered against that protocol, or the properties of
+    #: one of its services are set. Changes to the attributes of the service
+    #: objects themselves do *not* invalidate the cache, so only turn this on
+    #: if the queries and the minimized/maximized attributes that you use do
+    #: not change while the service is registered. The results of lookups
+    #: with callable queries are not cached.
+    cache_lookups = Bool(False)
+
+    #: The collector that is told how often each protocol is looked up, how
+    #: long the lookups and their queries take, and how long service
+    #: factories take to build their services. By default nothing is
+    #: collected (or even timed).
+    metrics = Instance(IServiceMetrics, factory=NullServiceMetrics)
+
+    #: The profiler that records how long service factories take to build
+    #: their services (the application's, if the registry was created by an
+    #: application). By default nothing is recorded.
+    profiler = Instance(IProfiler, factory=NullProfiler)
+
+    #: The import manager used to import protocols and service factories that
+    #: are specified as strings (the application's, if the registry was
+    #: created by an application).
+    import_manager = Instance(IImportManager, factory=ImportManager)
+
     ####  Private interface ###################################################
 
     # The services in the registry.
@@ -56,14 +175,125 @@ class ServiceRegistry(HasTraits):
     # registered with the object.
     _services = Dict
 
+    # The Ids of the services in the registry, indexed by protocol name.
+    #
+    # { protocol_name : (service_id, ...) }
+    #
+    # The Ids for each protocol are kept in the order in which the services
+    # were registered, so that looking up a protocol only has to visit the
+    # services that were registered against it. The tuples are replaced
+    # rather than modified, so a lookup can iterate over one without a lock.
+    _service_ids_by_protocol = Dict
+
     # The next service Id (service Ids are never persisted between process
     # invocations so this is simply an ever increasing integer!).
     _service_id = Int
 
+    # The cached results of service lookups (used if 'cache_lookups' is True).
+    #
+    # { protocol_name : { (query, minimize, maximize) : [obj, ...] } }
+    _lookup_cache = Dict
+
+    # Incremented whenever any cached lookup results are discarded, so that a
+    # lookup that was overtaken by a change to the registry (e.g. by a service
+    # factory that registers another service) does not cache its results.
+    _lookup_cache_generation = Int
+
+    # The lock that serializes changes to the registry.
+    _lock = Any
+
+    # The locks that make sure that each service factory is only called once.
+    #
+    # { service_id : threading.RLock }
+    _factory_locks = Dict
+
+    # The creations of services by asynchronous factories that are in progress.
+    #
+    # { service_id : asyncio.Future }
+    _async_creations = Dict
+
+    # The lifecycles of the services that were registered with a lifetime
+    # other than 'singleton', or with a disposal hook.
+    #
+    # { service_id : (lifetime, dispose, obj) }
+    #
+    # where 'obj' is the object that was registered (so that we can tell
+    # whether a singleton service was created by its factory).
+    _lifecycles = Dict
+
+    # The service scopes that have been created and not yet closed.
+    _scopes = Any
+
+    # The symbols (string protocols and service factories) that have been
+    # imported, least recently used first.
+    #
+    # { symbol_path : symbol }
+    _symbol_cache = Any
+
+    # The metrics collector, or None if 'metrics' doesn't collect anything
+    # (so that we don't time anything for it).
+    _metrics = Any
+
+    # The profiler, or None if 'profiler' doesn't record anything.
+    _profiler = Any
+
+    # The callables to call before the next lookup of each protocol.
+    #
+    # { protocol_name : [callable, ...] }
+    _lookup_hooks = Dict
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        # The lock is created here rather than by a trait initializer, so that
+        # two threads can't race to create it (and before the traits are set,
+        # as their change handlers use it).
+        self._lock = threading.RLock()
+        self._scopes = weakref.WeakSet()
+        self._symbol_cache = collections.OrderedDict()
+
+        super().__init__(**traits)
+
     ###########################################################################
     # 'IServiceRegistry' interface.
     ###########################################################################
 
+    async def aget_service(self, protocol, query="", minimize="", maximize=""):
+        """Return at most one service that matches the specified query."""
+
+        services = await self._afind_services(
+            protocol, query, minimize, maximize, count=1
+        )
+        if len(services) > 0:
+            service = services[0]
+
+        else:
+            service = None
+
+        return service
+
+    async def aget_services(self, protocol, query="", minimize="", maximize=""):
+        """Return all services that match the specified query."""
+
+        return await self._afind_services(protocol, query, minimize, maximize)
+
+    def create_scope(self):
+        """Create a scope for the services with a 'scoped' lifetime.
+
+        See 'ServiceScope' for how to use it.
+
+        """
+
+        scope = ServiceScope(registry=self)
+        with self._lock:
+            self._scopes.add(scope)
+
+        return scope
+
     def get_required_service(self, protocol, query="", minimize="", maximize=""):
         """Return the service that matches the specified query.
 
@@ -80,7 +310,14 @@ class ServiceRegistry(HasTraits):
     def get_service(self, protocol, query="", minimize="", maximize=""):
         """Return at most one service that matches the specified query."""
 
-        services = self.get_services(protocol, query, minimize, maximize)
+        # If lookups are cached then use (and populate) the cache. Otherwise,
+        # we only need to find the best service, not to rank all of them.
+        if self.cache_lookups:
+            services = self.get_services(protocol, query, minimize, maximize)
+
+        else:
+            services = self._find_services(protocol, query, minimize, maximize, count=1)
+
         if len(services) > 0:
             service = services[0]
 
@@ -103,35 +340,31 @@ class ServiceRegistry(HasTraits):
     def get_services(self, protocol, query="", minimize="", maximize=""):
         """Return all services that match the specified query."""
 
-        services = []
-        for service_id, (name, obj, properties) in self._services.items():
-            if self._get_protocol_name(protocol) == name:
-                # If the protocol is a string then we need to import it!
-                if isinstance(protocol, str):
-                    actual_protocol = ImportManager().import_symbol(protocol)
+        name = self._get_protocol_name(protocol)
 
-                # Otherwise, it is an actual protocol, so just use it!
-                else:
-                    actual_protocol = protocol
+        # Callable queries are often created afresh for each lookup (e.g. by a
+        # lambda), so caching their results would only fill up the cache.
+        cache_lookups = self.cache_lookups and not callable(query)
 
-                # If the registered service is actually a factory then use it
-                # to create the actual object.
-                obj = self._resolve_factory(
-                    actual_protocol, name, obj, properties, service_id
-                )
+        if cache_lookups:
+            key = (query, minimize, maximize)
+            cached = self._lookup_cache.get(name, {}).get(key)
+            if cached is not None:
+                if self._metrics is not None:
+                    self._metrics.record_lookup(name, 0.0)
 
-                # If a query was specified then only add the service if it
-                # matches it!
-                if len(query) == 0 or self._eval_query(obj, properties, query):
-                    services.append(obj)
+                return cached[:]
 
-        # Are we minimizing or maximising anything? If so then sort the list
-        # of services by the specified attribute/property.
-        if minimize != "":
-            services.sort(key=lambda x: getattr(x, minimize))
+            generation = self._lookup_cache_generation
 
-        elif maximize != "":
-            services.sort(key=lambda x: getattr(x, maximize), reverse=True)
+        services = self._find_services(protocol, query, minimize, maximize)
+
+        # The results of lookups that create transient or scoped services
+        # can't be reused.
+        if cache_lookups and not self._has_lifetimes(name):
+            with self._lock:
+                if generation == self._lookup_cache_generation:
+                    self._lookup_cache.setdefault(name, {})[key] = services[:]
 
         return services
 
@@ -147,74 +380,430 @@ class ServiceRegistry(HasTraits):
 
         return properties
 
-    def register_service(self, protocol, obj, properties=None):
+    def register_service(
+        self, protocol, obj, properties=None, lifetime=SINGLETON, dispose=None
+    ):
         """Register a service."""
 
+        if lifetime not in _LIFETIMES:
+            raise ValueError("unknown service lifetime <%s>" % lifetime)
+
         protocol_name = self._get_protocol_name(protocol)
 
         # Make sure each service gets its own properties dictionary.
         if properties is None:
             properties = {}
 
-        service_id = self._next_service_id()
-        self._services[service_id] = (protocol_name, obj, properties)
+        with self._lock:
+            service_id = self._next_service_id()
+            self._services[service_id] = (protocol_name, obj, properties)
+            if lifetime != SINGLETON or dispose is not None:
+                self._lifecycles[service_id] = (lifetime, dispose, obj)
+
+            self._service_ids_by_protocol[protocol_name] = (
+                self._service_ids_by_protocol.get(protocol_name, ()) + (service_id,)
+            )
+            self._discard_cached_lookups(protocol_name)
+
         self.registered = service_id
 
         logger.debug("service <%d> registered %s", service_id, protocol_name)
 
         return service_id
 
-    def set_service_properties(self, service_id, properties):
-        """Set the dictionary of properties associated with a service."""
+    def resolve_service(self, service_id):
+        """Return the service with the specified id, creating it if need be."""
 
         try:
-            protocol, obj, old_properties = self._services[service_id]
-            self._services[service_id] = protocol, obj, properties.copy()
+            name, obj, properties = self._services[service_id]
 
         except KeyError:
             raise ValueError("no service with id <%d>" % service_id)
 
+        protocol = self._import_symbol(name)
+
+        service = self._resolve_factory(protocol, name, obj, properties, service_id)
+        if service is _NOT_CREATED:
+            service = None
+
+        return service
+
+    def set_service_properties(self, service_id, properties):
+        """Set the dictionary of properties associated with a service."""
+
+        with self._lock:
+            try:
+                protocol, obj, old_properties = self._services[service_id]
+                self._services[service_id] = protocol, obj, properties.copy()
+
+            except KeyError:
+                raise ValueError("no service with id <%d>" % service_id)
+
+            self._discard_cached_lookups(protocol)
+
     def unregister_service(self, service_id):
         """Unregister a service."""
 
-        try:
-            protocol, obj, properties = self._services.pop(service_id)
-            self.unregistered = service_id
+        with self._lock:
+            try:
+                protocol, obj, properties = self._services.pop(service_id)
 
-            logger.debug("service <%d> unregistered", service_id)
+            except KeyError:
+                raise ValueError("no service with id <%d>" % service_id)
 
-        except KeyError:
-            raise ValueError("no service with id <%d>" % service_id)
+            service_ids = tuple(
+                id for id in self._service_ids_by_protocol[protocol] if id != service_id
+            )
+            if len(service_ids) > 0:
+                self._service_ids_by_protocol[protocol] = service_ids
+
+            else:
+                del self._service_ids_by_protocol[protocol]
+                self._symbol_cache.pop(protocol, None)
+
+            self._discard_cached_lookups(protocol)
+            self._factory_locks.pop(service_id, None)
+            lifetime, dispose, registered = self._lifecycles.pop(
+                service_id, (SINGLETON, None, obj)
+            )
+            scopes = list(self._scopes)
+
+            # Forget the service's factory if it was imported.
+            for symbol_path in {obj, registered}:
+                if isinstance(symbol_path, str):
+                    self._symbol_cache.pop(symbol_path, None)
+
+        # Dispose of any instances of the service that the registry created.
+        if lifetime == SINGLETON and obj is not registered:
+            self._dispose_service(service_id, obj, dispose)
+
+        elif lifetime == SCOPED:
+            for scope in scopes:
+                scope._discard_service(service_id)
+
+        self.unregistered = service_id
+
+        logger.debug("service <%d> unregistered", service_id)
+
+    ###########################################################################
+    # 'ServiceRegistry' interface.
+    ###########################################################################
+
+    def call_on_lookup(self, protocol, callback):
+        """Call a callable before the next lookup of a protocol.
+
+        The callable is called without any arguments, and only once, so it
+        can register services (e.g. by starting a plugin) that the lookup
+        will then find.
+
+        """
+
+        name = self._get_protocol_name(protocol)
+        with self._lock:
+            self._lookup_hooks.setdefault(name, []).append(callback)
+
+            # Make sure that the next lookup isn't answered from the cache.
+            self._discard_cached_lookups(name)
 
     ###########################################################################
     # Private interface.
     ###########################################################################
 
+    #### Trait change handlers ################################################
+
+    @observe("cache_lookups")
+    def _clear_lookup_cache(self, event):
+        """Static trait change handler."""
+
+        with self._lock:
+            self._lookup_cache = {}
+            self._lookup_cache_generation += 1
+
+    @observe("metrics")
+    def _update_metrics(self, event):
+        """Static trait change handler."""
+
+        if isinstance(event.new, NullServiceMetrics):
+            self._metrics = None
+
+        else:
+            self._metrics = event.new
+
+    @observe("profiler")
+    def _update_profiler(self, event):
+        """Static trait change handler."""
+
+        if isinstance(event.new, NullProfiler):
+            self._profiler = None
+
+        else:
+            self._profiler = event.new
+
+    #### Methods ##############################################################
+
+    async def _acreate_service(self, factory, name, obj, properties, service_id):
+        """Create a service using an asynchronous factory."""
+
+        try:
+            service = await factory(**properties)
+            self._replace_factory(service_id, name, obj, service)
+
+        finally:
+            with self._lock:
+                self._async_creations.pop(service_id, None)
+
+                # Synchronous lookups skip a service until it is created, so
+                # any results that they cached are now out of date.
+                self._discard_cached_lookups(name)
+
+        return service
+
+    async def _afind_services(self, protocol, query, minimize, maximize, count=None):
+        """Find the services that match the specified query.
+
+        This is the asynchronous version of '_find_services'.
+
+        """
+
+        if self._lookup_hooks:
+            self._run_lookup_hooks(self._get_protocol_name(protocol))
+
+        metrics = self._metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        limit = self._get_search_limit(minimize, maximize, count)
+
+        services = []
+        for candidate in self._iter_candidates(protocol, query):
+            if limit is not None and len(services) >= limit:
+                break
+
+            service_id, actual_protocol, name, obj, properties = candidate
+
+            # If the registered service is actually a factory then use it
+            # to create the actual object.
+            obj = await self._aresolve_factory(
+                actual_protocol, name, obj, properties, service_id
+            )
+
+            # Scoped services can't be created outside of a scope.
+            if obj is _NOT_CREATED:
+                continue
+
+            # If a query was specified then only add the service if it
+            # matches it!
+            if not query or self._eval_query(name, obj, properties, query):
+                services.append(obj)
+
+        services = self._rank_services(services, minimize, maximize, count)
+
+        if metrics is not None:
+            metrics.record_lookup(
+                self._get_protocol_name(protocol), time.perf_counter() - start
+            )
+
+        return services
+
+    async def _aresolve_factory(self, protocol, name, obj, properties, service_id):
+        """If 'obj' is a factory then use it to create the actual service.
+
+        This is the asynchronous version of '_resolve_factory', which can
+        also use asynchronous factories.
+
+        """
+
+        if not self._is_service_factory(protocol, obj):
+            return obj
+
+        factory = self._get_callable(obj)
+        if not inspect.iscoroutinefunction(factory):
+            return self._resolve_factory(protocol, name, obj, properties, service_id)
+
+        factory = self._instrument_factory(name, factory)
+        lifetime, dispose, _ = self._lifecycles.get(service_id, (SINGLETON, None, None))
+
+        # A transient service is created afresh for every lookup.
+        if lifetime == TRANSIENT:
+            return await factory(**properties)
+
+        # A scoped service is created once for each scope.
+        if lifetime == SCOPED:
+            scope = self._get_active_scope()
+            if scope is None:
+                return _NOT_CREATED
+
+            return await scope._aget_service(service_id, factory, properties, dispose)
+
+        with self._lock:
+            # The service may have been created since we looked it up.
+            entry = self._services.get(service_id)
+            if entry is not None and entry[1] is not obj:
+                return entry[1]
+
+            # If the service is already being created then wait for that
+            # rather than creating another one.
+            creation = self._async_creations.get(service_id)
+            if creation is None:
+                creation = asyncio.ensure_future(
+                    self._acreate_service(factory, name, obj, properties, service_id)
+                )
+                self._async_creations[service_id] = creation
+
+        # Shield the creation, so that cancelling one of the lookups that is
+        # waiting for it doesn't cancel it for the others.
+        return await asyncio.shield(creation)
+
     def _create_namespace(self, service, properties):
-        """Create a namespace in which to evaluate a query."""
+        """Create a namespace in which to evaluate a query.
+
+        The properties take precedence over the attributes of the service.
+        Rather than copying both into a new dictionary, the namespace is a
+        view onto them (with an empty dictionary in front to receive any
+        names that the query assigns to).
+
+        """
 
-        namespace = {}
-        namespace.update(service.__dict__)
-        namespace.update(properties)
+        return collections.ChainMap({}, properties, service.__dict__)
 
-        return namespace
+    def _discard_cached_lookups(self, protocol_name):
+        """Discard any cached lookup results for a protocol.
+
+        This must be called with the registry's lock held.
+
+        """
+
+        self._lookup_cache.pop(protocol_name, None)
+        self._lookup_cache_generation += 1
+
+    def _dispose_service(self, service_id, obj, dispose):
+        """Dispose of a service that the registry created (if need be)."""
+
+        if dispose is None:
+            return
+
+        try:
+            self._get_callable(dispose)(obj)
+
+        except Exception:
+            logger.exception("disposing of service <%d>", service_id)
 
-    def _eval_query(self, service, properties, query):
+    def _eval_query(self, name, service, properties, query):
         """Evaluate a query over a single service.
 
+        'name' is the name of the protocol that the service is registered
+        against.
+
         Return True if the service matches the query, otherwise return False.
 
         """
 
+        metrics = self._metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
         namespace = self._create_namespace(service, properties)
         try:
-            result = eval(query, namespace)
+            result = self._eval_query_in_namespace(query, namespace)
 
         except Exception:
             result = False
 
+        if metrics is not None:
+            metrics.record_query(name, time.perf_counter() - start)
+
+        return result
+
+    def _eval_query_in_namespace(self, query, namespace):
+        """Evaluate a query in the specified namespace."""
+
+        if callable(query):
+            result = query(types.MappingProxyType(namespace))
+
+        else:
+            code, needs_globals = _compile_query(query)
+
+            # Scopes nested within the query (e.g. generator expressions) can
+            # only see the query's namespace if it is its globals.
+            if needs_globals:
+                result = eval(code, dict(namespace))
+
+            else:
+                result = eval(code, _QUERY_GLOBALS, namespace)
+
         return result
 
+    def _find_services(self, protocol, query, minimize, maximize, count=None):
+        """Find the services that match the specified query.
+
+        If 'count' is specified then at most that many services are returned
+        (the best ones, if we are minimizing or maximizing anything).
+
+        """
+
+        if self._lookup_hooks:
+            self._run_lookup_hooks(self._get_protocol_name(protocol))
+
+        metrics = self._metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        limit = self._get_search_limit(minimize, maximize, count)
+
+        services = []
+        for candidate in self._iter_candidates(protocol, query):
+            if limit is not None and len(services) >= limit:
+                break
+
+            service_id, actual_protocol, name, obj, properties = candidate
+
+            # If the registered service is actually a factory then use it
+            # to create the actual object.
+            obj = self._resolve_factory(
+                actual_protocol, name, obj, properties, service_id
+            )
+
+            # Services with asynchronous factories can't be created here.
+            if obj is _NOT_CREATED:
+                continue
+
+            # If a query was specified then only add the service if it
+            # matches it!
+            if not query or self._eval_query(name, obj, properties, query):
+                services.append(obj)
+
+        services = self._rank_services(services, minimize, maximize, count)
+
+        if metrics is not None:
+            metrics.record_lookup(
+                self._get_protocol_name(protocol), time.perf_counter() - start
+            )
+
+        return services
+
+    def _get_callable(self, callable_or_symbol_path):
+        """Return a callable, importing it if it is given as a symbol path."""
+
+        if isinstance(callable_or_symbol_path, str):
+            return self._import_symbol(callable_or_symbol_path)
+
+        return callable_or_symbol_path
+
+    def _get_active_scope(self):
+        """Return the active service scope, if it belongs to this registry."""
+
+        scope = get_active_scope()
+        if scope is not None and scope.registry is not self:
+            scope = None
+
+        return scope
+
+    def _get_factory_lock(self, service_id):
+        """Return the lock that guards the factory of a service."""
+
+        with self._lock:
+            return self._factory_locks.setdefault(service_id, threading.RLock())
+
     def _get_protocol_name(self, protocol_or_name):
         """Returns the full class name for a protocol."""
 
@@ -229,6 +818,122 @@ class ServiceRegistry(HasTraits):
 
         return name
 
+    def _get_search_limit(self, minimize, maximize, count):
+        """Return how many matching services a lookup needs to find.
+
+        Returns None if the lookup needs to find all of them.
+
+        """
+
+        # If we don't need to rank the services then we can stop as soon as
+        # we have found enough of them.
+        if count is not None and minimize == "" and maximize == "":
+            limit = count
+
+        else:
+            limit = None
+
+        return limit
+
+    def _has_lifetimes(self, protocol_name):
+        """Are any services registered against a protocol not singletons?"""
+
+        for service_id in self._service_ids_by_protocol.get(protocol_name, ()):
+            lifetime, _, _ = self._lifecycles.get(service_id, (SINGLETON, None, None))
+            if lifetime != SINGLETON:
+                return True
+
+        return False
+
+    def _import_symbol(self, symbol_path):
+        """Import a symbol, or return it from the cache if it was already."""
+
+        with self._lock:
+            if symbol_path in self._symbol_cache:
+                self._symbol_cache.move_to_end(symbol_path)
+                return self._symbol_cache[symbol_path]
+
+        symbol = self.import_manager.import_symbol(symbol_path)
+
+        with self._lock:
+            self._symbol_cache[symbol_path] = symbol
+            if len(self._symbol_cache) > _SYMBOL_CACHE_SIZE:
+                self._symbol_cache.popitem(last=False)
+
+        return symbol
+
+    def _instrument_factory(self, name, factory):
+        """Wrap a service factory so that its build times are recorded.
+
+        The factory is returned as it is if no metrics are being collected
+        and nothing is being profiled.
+
+        """
+
+        metrics = self._metrics
+        if metrics is None and self._profiler is None:
+            return factory
+
+        profiler = self.profiler
+
+        if inspect.iscoroutinefunction(factory):
+
+            async def timed_factory(**properties):
+                start = time.perf_counter()
+                with profiler.span("service.create", protocol=name):
+                    service = await factory(**properties)
+
+                if metrics is not None:
+                    metrics.record_factory(name, time.perf_counter() - start)
+
+                return service
+
+        else:
+
+            def timed_factory(**properties):
+                start = time.perf_counter()
+                with profiler.span("service.create", protocol=name):
+                    service = factory(**properties)
+
+                if metrics is not None:
+                    metrics.record_factory(name, time.perf_counter() - start)
+
+                return service
+
+        return timed_factory
+
+    def _is_ruled_out_by_properties(self, properties, query):
+        """Does a query rule a service out on its properties alone?
+
+        This is only the case if the query can be evaluated using just the
+        properties (i.e. every name that it uses is a property, so none of
+        them can refer to one of the service's attributes or a builtin), and
+        it evaluates to False. Callable queries can't be inspected, so they
+        never rule a service out.
+
+        """
+
+        if callable(query):
+            return False
+
+        try:
+            code, needs_globals = _compile_query(query)
+
+        except Exception:
+            return False
+
+        if not _get_query_names(code) <= properties.keys():
+            return False
+
+        namespace = collections.ChainMap({}, properties)
+        try:
+            result = self._eval_query_in_namespace(query, namespace)
+
+        except Exception:
+            return False
+
+        return not result
+
     def _is_service_factory(self, protocol, obj):
         """Is the object a factory for services supporting the protocol?"""
 
@@ -238,31 +943,165 @@ class ServiceRegistry(HasTraits):
 
         return not isinstance(obj, protocol)
 
+    def _iter_candidates(self, protocol, query):
+        """Iterate over the services that might match a query.
+
+        Yields a tuple '(service_id, actual_protocol, name, obj, properties)'
+        for each service registered against the protocol, in the order in
+        which they were registered, unless the service is provided by a
+        factory and its properties alone rule it out.
+
+        """
+
+        name = self._get_protocol_name(protocol)
+
+        # If the protocol is a string then we need to import it, but only if
+        # any services are registered against it!
+        actual_protocol = None
+
+        # The services may be registered or unregistered while we iterate
+        # (by another thread, or by a service factory), so we skip any that
+        # have gone.
+        for service_id in self._service_ids_by_protocol.get(name, ()):
+            entry = self._services.get(service_id)
+            if entry is None:
+                continue
+
+            name, obj, properties = entry
+
+            if actual_protocol is None:
+                if isinstance(protocol, str):
+                    actual_protocol = self._import_symbol(protocol)
+
+                # Otherwise, it is an actual protocol, so just use it!
+                else:
+                    actual_protocol = protocol
+
+            # Don't call a service factory just to find out that its service
+            # doesn't match the query.
+            if query and self._is_service_factory(actual_protocol, obj):
+                if self._is_ruled_out_by_properties(properties, query):
+                    continue
+
+            yield service_id, actual_protocol, name, obj, properties
+
     def _next_service_id(self):
-        """Returns the next service ID."""
+        """Returns the next service ID.
+
+        This must be called with the registry's lock held.
+
+        """
 
         self._service_id += 1
 
         return self._service_id
 
+    def _rank_services(self, services, minimize, maximize, count):
+        """Rank services by the attribute to minimize or maximize (if any).
+
+        If 'count' is specified then at most that many services are returned.
+
+        """
+
+        # If we only want the best few services then we select them rather
+        # than sorting all of them (the selection is stable, just like the
+        # sort).
+        if minimize != "":
+            key = operator.attrgetter(minimize)
+            if count is None:
+                services.sort(key=key)
+
+            else:
+                services = heapq.nsmallest(count, services, key=key)
+
+        elif maximize != "":
+            key = operator.attrgetter(maximize)
+            if count is None:
+                services.sort(key=key, reverse=True)
+
+            else:
+                services = heapq.nlargest(count, services, key=key)
+
+        return services
+
+    def _replace_factory(self, service_id, name, factory, obj):
+        """Replace a service factory with the service that it created.
+
+        The factory will not get called again unless the service is
+        unregistered first. We don't resurrect a service that was unregistered
+        while its factory was being called.
+
+        """
+
+        with self._lock:
+            entry = self._services.get(service_id)
+            if entry is not None and entry[1] is factory:
+                self._services[service_id] = (name, obj, entry[2])
+
     def _resolve_factory(self, protocol, name, obj, properties, service_id):
-        """If 'obj' is a factory then use it to create the actual service."""
+        """If 'obj' is a factory then use it to create the actual service.
+
+        Returns '_NOT_CREATED' if the service can't be created by a
+        synchronous lookup, i.e. if its factory is asynchronous (and a
+        singleton service hasn't yet been created by an asynchronous lookup),
+        or if it is a scoped service and no scope is active.
+
+        """
 
         # Is the registered service actually a service *factory*?
-        if self._is_service_factory(protocol, obj):
-            # A service factory is any callable that takes two arguments, the
-            # first is the protocol, the second is the (possibly empty)
-            # dictionary of properties that were registered with the service.
-            #
-            # If the factory is specified as a symbol path then import it.
-            if isinstance(obj, str):
-                obj = ImportManager().import_symbol(obj)
-
-            obj = obj(**properties)
-
-            # The resulting service object replaces the factory in the cache
-            # (i.e. the factory will not get called again unless it is
-            # unregistered first).
-            self._services[service_id] = (name, obj, properties)
+        if not self._is_service_factory(protocol, obj):
+            return obj
 
-        return obj
+        lifetime, dispose, _ = self._lifecycles.get(service_id, (SINGLETON, None, None))
+
+        # A service factory is any callable that takes the (possibly empty)
+        # dictionary of properties that were registered with the service as
+        # keyword arguments.
+        if lifetime == SINGLETON:
+            with self._get_factory_lock(service_id):
+                # Another thread may have created the service while we were
+                # waiting for the lock, in which case we use that one.
+                entry = self._services.get(service_id)
+                if entry is not None and entry[1] is not obj:
+                    return entry[1]
+
+                factory = self._get_callable(obj)
+                if inspect.iscoroutinefunction(factory):
+                    return _NOT_CREATED
+
+                factory = self._instrument_factory(name, factory)
+                service = factory(**properties)
+                self._replace_factory(service_id, name, obj, service)
+
+                with self._lock:
+                    self._factory_locks.pop(service_id, None)
+
+        else:
+            factory = self._get_callable(obj)
+            if inspect.iscoroutinefunction(factory):
+                return _NOT_CREATED
+
+            factory = self._instrument_factory(name, factory)
+
+            # A transient service is created afresh for every lookup.
+            if lifetime == TRANSIENT:
+                service = factory(**properties)
+
+            # A scoped service is created once for each scope.
+            else:
+                scope = self._get_active_scope()
+                if scope is None:
+                    return _NOT_CREATED
+
+                service = scope._get_service(service_id, factory, properties, dispose)
+
+        return service
+
+    def _run_lookup_hooks(self, protocol_name):
+        """Call (and forget) the callables waiting for a protocol lookup."""
+
+        with self._lock:
+            callbacks = self._lookup_hooks.pop(protocol_name, [])
+
+        for callback in callbacks:
+            callback()
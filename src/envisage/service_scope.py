@@ -0,0 +1,214 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""A scope for the services with a 'scoped' lifetime."""
+
+# Standard library imports.
+import asyncio
+import contextlib
+import contextvars
+import logging
+import threading
+
+# Enthought library imports.
+from traits.api import Any, Bool, Dict, HasTraits, Instance, List
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+# The service scope that is active in the current thread or task.
+_active_scope = contextvars.ContextVar("envisage_active_service_scope", default=None)
+
+
+class ServiceScope(HasTraits):
+    """A scope for the services with a 'scoped' lifetime.
+
+    Each scope creates its own instance of every 'scoped' service that is
+    looked up while it is active, and disposes of them when it is closed.
+    Scopes are created by the service registry, e.g. for a task::
+
+        with service_registry.create_scope():
+            ...
+
+    which activates the scope for the duration of the 'with' block, and
+    closes it at the end. A longer-lived scope (e.g. for a window) can
+    instead be activated whenever code runs on its behalf, and closed
+    explicitly when it is finished with::
+
+        scope = service_registry.create_scope()
+
+        with scope.activate():
+            ...
+
+        scope.close()
+
+    Outside of any scope, lookups ignore 'scoped' services.
+
+    """
+
+    #### 'ServiceScope' interface #############################################
+
+    #: The service registry that the scope belongs to.
+    registry = Instance("envisage.service_registry.ServiceRegistry")
+
+    #: Has the scope been closed?
+    closed = Bool(False)
+
+    #### Private interface ####################################################
+
+    # The services created in the scope, in the order in which they were
+    # created.
+    #
+    # { service_id : (obj, dispose) }
+    _services = Dict
+
+    # The creations of services by asynchronous factories that are in progress.
+    #
+    # { service_id : asyncio.Future }
+    _async_creations = Dict
+
+    # The lock that guards the creation and disposal of the scope's services.
+    _lock = Any
+
+    # The tokens used to restore the previously active scope(s).
+    _tokens = List
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        """Activate the scope."""
+
+        self._tokens.append(_active_scope.set(self))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deactivate and close the scope."""
+
+        _active_scope.reset(self._tokens.pop())
+        self.close()
+
+    ###########################################################################
+    # 'ServiceScope' interface.
+    ###########################################################################
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Return a context manager that activates the scope (only)."""
+
+        token = _active_scope.set(self)
+        try:
+            yield self
+
+        finally:
+            _active_scope.reset(token)
+
+    def close(self):
+        """Close the scope, disposing of the services created in it.
+
+        The services are disposed of in the reverse order in which they were
+        created.
+
+        """
+
+        with self._lock:
+            services = list(self._services.items())
+            self._services = {}
+            self.closed = True
+
+        for service_id, (obj, dispose) in reversed(services):
+            self.registry._dispose_service(service_id, obj, dispose)
+
+    ###########################################################################
+    # Protected 'ServiceScope' interface.
+    ###########################################################################
+
+    async def _aget_service(self, service_id, factory, properties, dispose):
+        """Return the scope's instance of a service with an async factory."""
+
+        with self._lock:
+            self._check_open()
+            if service_id in self._services:
+                return self._services[service_id][0]
+
+            creation = self._async_creations.get(service_id)
+            if creation is None:
+                creation = asyncio.ensure_future(
+                    self._acreate_service(service_id, factory, properties, dispose)
+                )
+                self._async_creations[service_id] = creation
+
+        return await asyncio.shield(creation)
+
+    def _discard_service(self, service_id):
+        """Discard (and dispose of) the scope's instance of a service."""
+
+        with self._lock:
+            obj, dispose = self._services.pop(service_id, (None, None))
+
+        if obj is not None:
+            self.registry._dispose_service(service_id, obj, dispose)
+
+    def _get_service(self, service_id, factory, properties, dispose):
+        """Return the scope's instance of a service, creating it if need be."""
+
+        with self._lock:
+            self._check_open()
+            if service_id not in self._services:
+                self._services[service_id] = (factory(**properties), dispose)
+
+            return self._services[service_id][0]
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    async def _acreate_service(self, service_id, factory, properties, dispose):
+        """Create the scope's instance of a service with an async factory."""
+
+        try:
+            obj = await factory(**properties)
+
+        finally:
+            with self._lock:
+                self._async_creations.pop(service_id, None)
+
+        with self._lock:
+            if not self.closed:
+                self._services.setdefault(service_id, (obj, dispose))
+                return self._services[service_id][0]
+
+        # The scope was closed while the service was being created.
+        self.registry._dispose_service(service_id, obj, dispose)
+        raise ValueError("service scope is closed")
+
+    def _check_open(self):
+        """Raise a 'ValueError' if the scope has been closed."""
+
+        if self.closed:
+            raise ValueError("service scope is closed")
+
+
+def get_active_scope():
+    """Return the service scope that is active in the current thread or task.
+
+    Returns None if no scope is active.
+
+    """
+
+    return _active_scope.get()
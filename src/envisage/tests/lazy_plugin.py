@@ -0,0 +1,42 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""A plugin used in the plugin manifest tests!"""
+
+# Enthought library imports.
+from traits.api import List
+
+from envisage.api import ExtensionPoint, Plugin
+
+
+class LazyPlugin(Plugin):
+    """A plugin that is only loaded when one of its contributions is used."""
+
+    id = "envisage.tests.lazy"
+
+    things = ExtensionPoint(List, id="envisage.tests.things")
+
+    fruits = List(["apple", "orange"], contributes_to="envisage.tests.fruits")
+
+    started = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+
+class NeedyPlugin(Plugin):
+    """A plugin that computes its requirements."""
+
+    id = "envisage.tests.needy"
+
+    def _requires_default(self):
+        return ["envisage.tests.lazy"]
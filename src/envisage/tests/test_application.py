@@ -169,12 +169,12 @@ class ApplicationTestCase(unittest.TestCase):
 
         # Start the application.
         started = application.start()
-        self.assertEqual(True, started)
+        self.assertTrue(started)
         self.assertEqual(["starting", "started"], tracker.event_names)
 
         # Stop the application.
         stopped = application.stop()
-        self.assertEqual(True, stopped)
+        self.assertTrue(stopped)
         self.assertEqual(
             ["starting", "started", "stopping", "stopped"], tracker.event_names
         )
@@ -198,7 +198,7 @@ class ApplicationTestCase(unittest.TestCase):
 
         # Start the application.
         started = application.start()
-        self.assertEqual(False, started)
+        self.assertFalse(started)
         self.assertTrue("started" not in tracker.event_names)
 
     def test_veto_stopping(self):
@@ -221,11 +221,11 @@ class ApplicationTestCase(unittest.TestCase):
         # Start the application.
         started = application.start()
         self.assertEqual(["starting", "started"], tracker.event_names)
-        self.assertEqual(True, started)
+        self.assertTrue(started)
 
         # Stop the application.
         stopped = application.stop()
-        self.assertEqual(False, stopped)
+        self.assertFalse(stopped)
         self.assertTrue("stopped" not in tracker.event_names)
 
     def test_start_and_stop_errors(self):
@@ -146,6 +146,44 @@ class CompositePluginManagerTestCase(unittest.TestCase):
         a.remove_plugin(a.get_plugin("foo"))
         self.assertEqual(0, self._plugin_count(composite_plugin_manager))
 
+    def test_start_and_stop_in_order_of_requirements(self):
+        a = PluginManager(plugins=[SimplePlugin(id="foo", requires=["bar"])])
+        b = PluginManager(plugins=[SimplePlugin(id="bar")])
+        composite_plugin_manager = CompositePluginManager(plugin_managers=[a, b])
+
+        started = []
+        for plugin in composite_plugin_manager:
+            plugin.observe(
+                lambda event: started.append(event.object.id) if event.new else None,
+                "started",
+            )
+
+        self._test_start_and_stop(composite_plugin_manager, ["foo", "bar"])
+        self.assertEqual(["bar", "foo"], started)
+
+    def test_get_plugin(self):
+        a = PluginManager(plugins=[SimplePlugin(id="foo")])
+        b = PluginManager(plugins=[SimplePlugin(id="bar")])
+        composite_plugin_manager = CompositePluginManager(plugin_managers=[a, b])
+
+        self.assertIs(a.get_plugin("foo"), composite_plugin_manager.get_plugin("foo"))
+        self.assertIs(b.get_plugin("bar"), composite_plugin_manager.get_plugin("bar"))
+        self.assertIsNone(composite_plugin_manager.get_plugin("baz"))
+
+        # Changes to the plugin managers are picked up.
+        baz = SimplePlugin(id="baz")
+        b.add_plugin(baz)
+        self.assertIs(baz, composite_plugin_manager.get_plugin("baz"))
+
+        b.remove_plugin(baz)
+        self.assertIsNone(composite_plugin_manager.get_plugin("baz"))
+
+        c = PluginManager(plugins=[SimplePlugin(id="foo")])
+        with self.assertLogs("envisage.composite_plugin_manager", "WARNING"):
+            composite_plugin_manager.plugin_managers.insert(0, c)
+            plugin = composite_plugin_manager.get_plugin("foo")
+        self.assertIs(c.get_plugin("foo"), plugin)
+
     def test_correct_exception_propagated_from_plugin_manager(self):
         plugin_manager = CompositePluginManager(
             plugin_managers=[RaisingPluginManager()]
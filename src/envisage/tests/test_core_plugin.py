@@ -14,7 +14,7 @@ import unittest
 from importlib.resources import as_file, files
 
 # Enthought library imports.
-from traits.api import HasTraits, Interface, List, on_trait_change, Str
+from traits.api import HasTraits, Interface, List, on_trait_change, provides, Str
 
 from envisage.api import CorePlugin, Plugin, ServiceOffer
 from envisage.tests.support import SimpleApplication
@@ -23,6 +23,17 @@ from envisage.tests.support import SimpleApplication
 PKG = "envisage.tests"
 
 
+class IWarmJunk(Interface):
+    """A service that is pre-warmed."""
+
+
+@provides(IWarmJunk)
+class WarmJunk(HasTraits):
+    """An implementation of 'IWarmJunk'."""
+
+    name = Str()
+
+
 class CorePluginTestCase(unittest.TestCase):
     """Tests for the core plugin."""
 
@@ -235,3 +246,111 @@ class CorePluginTestCase(unittest.TestCase):
         application.unregister_service(some_junk_id)
 
         application.stop()
+
+    def test_service_offer_is_disposed_when_plugin_stops(self):
+        class IJunk(Interface):
+            trash = Str()
+
+        @provides(IJunk)
+        class Junk(HasTraits):
+            trash = Str("garbage")
+
+        disposed = []
+
+        class PluginA(Plugin):
+            service_offers = List(contributes_to="envisage.service_offers")
+
+            def _service_offers_default(self):
+                return [
+                    ServiceOffer(protocol=IJunk, factory=Junk, dispose=disposed.append),
+                    ServiceOffer(protocol=IJunk, factory=Junk, lifetime="transient"),
+                ]
+
+        application = SimpleApplication(plugins=[CorePlugin(), PluginA()])
+        application.start()
+
+        junk, transient_junk = application.get_services(IJunk)
+        self.assertIsNot(transient_junk, application.get_services(IJunk)[1])
+
+        application.stop()
+        self.assertEqual([junk], disposed)
+
+    def test_warm_service_offers(self):
+        created = []
+
+        def warm_junk_factory(name):
+            created.append(name)
+            return WarmJunk(name=name)
+
+        def service_offer(name, **traits):
+            return ServiceOffer(
+                protocol=IWarmJunk,
+                factory=warm_junk_factory,
+                properties={"name": name},
+                **traits,
+            )
+
+        class PluginA(Plugin):
+            service_offers = List(contributes_to="envisage.service_offers")
+
+            def _service_offers_default(self):
+                return [
+                    service_offer("cold"),
+                    service_offer("warm", warm=True),
+                    service_offer("transient", warm=True, lifetime="transient"),
+                ]
+
+        application = SimpleApplication(plugins=[CorePlugin(), PluginA()])
+
+        with self.assertLogs("envisage.core_plugin", level="INFO") as logs:
+            application.start()
+
+            # Stopping waits for the services being pre-warmed.
+            application.stop()
+
+        self.assertEqual(["warm"], created)
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("pre-warmed", logs.output[0])
+
+    def test_warm_service_offer_added_after_start(self):
+        created = []
+
+        def warm_junk_factory(name):
+            created.append(name)
+            return WarmJunk(name=name)
+
+        class PluginA(Plugin):
+            service_offers = List(contributes_to="envisage.service_offers")
+
+            def _service_offers_default(self):
+                return [
+                    ServiceOffer(
+                        protocol=IWarmJunk,
+                        factory=warm_junk_factory,
+                        properties={"name": "cold"},
+                    )
+                ]
+
+        plugin = PluginA()
+        application = SimpleApplication(plugins=[CorePlugin(), plugin])
+
+        # None of the services offered when the application starts is to be
+        # pre-warmed...
+        application.start()
+
+        # ... but one offered afterwards is.
+        with self.assertLogs("envisage.core_plugin", level="INFO") as logs:
+            plugin.service_offers.append(
+                ServiceOffer(
+                    protocol=IWarmJunk,
+                    factory=warm_junk_factory,
+                    properties={"name": "warm"},
+                    warm=True,
+                )
+            )
+
+            # Stopping waits for the services being pre-warmed.
+            application.stop()
+
+        self.assertEqual(["warm"], created)
+        self.assertIn("pre-warmed", logs.output[0])
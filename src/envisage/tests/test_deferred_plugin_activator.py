@@ -0,0 +1,160 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for the deferred plugin activator."""
+
+# Standard library imports.
+import unittest
+
+# Enthought library imports.
+from traits.api import Bool, List
+
+from envisage.api import (
+    Application,
+    DeferredPluginActivator,
+    ExtensionPoint,
+    Plugin,
+    PluginManager,
+    ServiceRegistry,
+)
+from envisage.tests.ets_config_patcher import ETSConfigPatcher
+from envisage.tests.foo import Foo
+from envisage.tests.i_foo import IFoo
+
+
+class LazyPlugin(Plugin):
+    """A plugin that records whether it has been started."""
+
+    #### 'LazyPlugin' interface ###############################################
+
+    started = Bool(False)
+    stopped = Bool(False)
+
+    fruits = ExtensionPoint(List, id="envisage.tests.fruits")
+
+    ###########################################################################
+    # 'IPlugin' interface.
+    ###########################################################################
+
+    def start(self):
+        """Start the plugin."""
+
+        self.started = True
+        self.application.register_service(IFoo, Foo())
+
+    def stop(self):
+        """Stop the plugin."""
+
+        self.stopped = True
+
+
+class DeferredPluginActivatorTestCase(unittest.TestCase):
+    """Tests for the deferred plugin activator."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        ets_config_patcher = ETSConfigPatcher()
+        ets_config_patcher.start()
+        self.addCleanup(ets_config_patcher.stop)
+
+    def test_default_activator(self):
+        self.assertIsInstance(Plugin().activator, DeferredPluginActivator)
+        self.assertEqual("eager", Plugin().activation)
+
+    def test_eager(self):
+        plugin = LazyPlugin()
+        application = self._create_application(plugin)
+
+        application.start()
+        self.assertTrue(plugin.started)
+
+    def test_lazy_on_service(self):
+        plugin = LazyPlugin(
+            activation="lazy_on_service", provides=["envisage.tests.i_foo.IFoo"]
+        )
+        application = self._create_application(plugin)
+
+        application.start()
+        self.assertFalse(plugin.started)
+
+        # Looking up a protocol that the plugin provides starts it first.
+        self.assertIsInstance(application.get_service(IFoo), Foo)
+        self.assertTrue(plugin.started)
+
+        application.stop()
+        self.assertTrue(plugin.stopped)
+
+    def test_lazy_on_extension_point(self):
+        plugin = LazyPlugin(activation="lazy_on_extension_point")
+        application = self._create_application(plugin)
+
+        application.start()
+        self.assertFalse(plugin.started)
+
+        application.get_extensions("envisage.tests.fruits")
+        self.assertTrue(plugin.started)
+
+    def test_lazy_on_extension_point_read_by_trait(self):
+        plugin = LazyPlugin(activation="lazy_on_extension_point")
+        application = self._create_application(plugin)
+
+        # The extensions are read (and cached) before the plugin is started.
+        self.assertEqual([], plugin.fruits)
+
+        application.start()
+        self.assertFalse(plugin.started)
+
+        plugin.fruits
+        self.assertTrue(plugin.started)
+
+    def test_registry_without_lookup_hooks(self):
+        class EagerServiceRegistry(ServiceRegistry):
+            call_on_lookup = None
+
+        plugin = LazyPlugin(
+            activation="lazy_on_service", provides=["envisage.tests.i_foo.IFoo"]
+        )
+        application = self._create_application(plugin)
+        application.service_registry = EagerServiceRegistry()
+
+        # The plugin is started straight away.
+        with self.assertLogs("envisage.deferred_plugin_activator", "WARNING"):
+            application.start()
+
+        self.assertTrue(plugin.started)
+
+    def test_unused_plugin_is_not_stopped(self):
+        plugin = LazyPlugin(activation="lazy_on_extension_point")
+        application = self._create_application(plugin)
+
+        application.start()
+        application.stop()
+        self.assertFalse(plugin.started)
+        self.assertFalse(plugin.stopped)
+
+        # Using the plugin after it was stopped doesn't start it.
+        application.get_extensions("envisage.tests.fruits")
+        self.assertFalse(plugin.started)
+
+    def test_nothing_to_use(self):
+        plugin = LazyPlugin(activation="lazy_on_service")
+        application = self._create_application(plugin)
+
+        with self.assertLogs("envisage.deferred_plugin_activator", "WARNING"):
+            application.start()
+
+        self.assertTrue(plugin.started)
+
+    #### Private protocol #####################################################
+
+    def _create_application(self, plugin):
+        """Create an application containing a plugin."""
+
+        return Application(id="test", plugin_manager=PluginManager(plugins=[plugin]))
@@ -0,0 +1,213 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for the entry point plugin manager."""
+
+# Standard library imports.
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Enthought library imports.
+from envisage.api import EntryPointPluginManager, ManifestPlugin
+
+# The entry point group used by the tests.
+GROUP = "envisage.tests.plugins"
+
+# The module that contains the plugin registered by the entry points.
+MODULE = "envisage.tests.lazy_plugin"
+
+# The entry points of the distribution used by the tests.
+ENTRY_POINTS = """\
+[envisage.tests.plugins]
+envisage.tests.lazy = envisage.tests.lazy_plugin:LazyPlugin
+envisage.tests.broken = envisage.tests.no_such_module:BrokenPlugin
+envisage.tests.needy = envisage.tests.lazy_plugin:NeedyPlugin
+"""
+
+
+class EntryPointPluginManagerTestCase(unittest.TestCase):
+    """Tests for the entry point plugin manager."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+        # Install a distribution that registers the plugins.
+        self.site_dir = os.path.join(self.tmpdir, "site")
+        dist_info = os.path.join(self.site_dir, "envisage_tests-1.0.dist-info")
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write("Name: envisage-tests\nVersion: 1.0\n")
+        with open(os.path.join(dist_info, "entry_points.txt"), "w") as f:
+            f.write(ENTRY_POINTS)
+
+        sys.path.insert(0, self.site_dir)
+        self.addCleanup(sys.path.remove, self.site_dir)
+
+        self.cache_filename = os.path.join(self.tmpdir, "plugins.json")
+
+        # Make sure that we can tell when the plugin's module is imported.
+        sys.modules.pop(MODULE, None)
+
+    def test_discover_plugins(self):
+        plugin_manager = EntryPointPluginManager(group=GROUP)
+        plugins = list(plugin_manager)
+
+        # Without a cache, nothing is imported until it is needed.
+        self.assertEqual(
+            ["envisage.tests.lazy", "envisage.tests.broken", "envisage.tests.needy"],
+            [plugin.id for plugin in plugins],
+        )
+        self.assertIsInstance(plugins[0], ManifestPlugin)
+        self.assertIs(plugins[0], plugin_manager.get_plugin("envisage.tests.lazy"))
+        self.assertNotIn(MODULE, sys.modules)
+
+        # The manifest is generated when the plugin is first queried.
+        self.assertEqual(
+            ["envisage.tests.things"],
+            [
+                extension_point.id
+                for extension_point in plugins[0].get_extension_points()
+            ],
+        )
+        self.assertEqual(
+            ["apple", "orange"], plugins[0].get_extensions("envisage.tests.fruits")
+        )
+
+        # A plugin that can't be imported doesn't offer or contribute anything.
+        with self.assertLogs("envisage.plugin_manifest", "ERROR"):
+            self.assertEqual([], plugins[1].get_extension_points())
+
+        self.assertEqual([], plugins[1].get_extensions("envisage.tests.fruits"))
+
+    def test_include_and_exclude(self):
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP, include=[r"envisage\.tests\..*"], exclude=[r".*broken"]
+        )
+        self.assertEqual(
+            ["envisage.tests.lazy", "envisage.tests.needy"],
+            [plugin.id for plugin in plugin_manager],
+        )
+
+        sys.modules.pop(MODULE, None)
+        plugin_manager = EntryPointPluginManager(group=GROUP, include=["acme"])
+        self.assertEqual([], list(plugin_manager))
+        self.assertNotIn(MODULE, sys.modules)
+
+    def test_cache(self):
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        self.assertEqual(1, len(list(plugin_manager)))
+        self.assertTrue(os.path.exists(self.cache_filename))
+
+        # The cached plugins are used without importing anything, or reading
+        # any distribution metadata.
+        sys.modules.pop(MODULE, None)
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        with mock.patch("importlib.metadata.distributions") as distributions:
+            with mock.patch("importlib.metadata.entry_points") as entry_points:
+                (plugin,) = plugin_manager
+
+        distributions.assert_not_called()
+        entry_points.assert_not_called()
+        self.assertEqual("envisage.tests.lazy", plugin.id)
+        self.assertEqual(["envisage.tests.fruits"], plugin.manifest.contributions)
+        self.assertNotIn(MODULE, sys.modules)
+
+        # The actual plugin is loaded on demand.
+        self.assertEqual(
+            ["apple", "orange"], plugin.get_extensions("envisage.tests.fruits")
+        )
+        self.assertIn(MODULE, sys.modules)
+
+    def test_cache_skips_broken_plugins(self):
+        with self.assertLogs("envisage.entry_point_plugin_manager", "ERROR"):
+            plugin_manager = EntryPointPluginManager(
+                group=GROUP, cache_filename=self.cache_filename
+            )
+            plugins = list(plugin_manager)
+
+        self.assertEqual(
+            ["envisage.tests.lazy", "envisage.tests.needy"],
+            [plugin.id for plugin in plugins],
+        )
+
+        # The requirements that the plugin computes are in its manifest.
+        self.assertEqual(["envisage.tests.lazy"], plugins[1].requires)
+
+    def test_cache_out_of_date(self):
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        self.assertEqual(1, len(list(plugin_manager)))
+
+        # Upgrade the distribution, so that it no longer registers any
+        # plugins (installers replace the metadata directory).
+        shutil.rmtree(os.path.join(self.site_dir, "envisage_tests-1.0.dist-info"))
+        dist_info = os.path.join(self.site_dir, "envisage_tests-2.0.dist-info")
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write("Name: envisage-tests\nVersion: 2.0\n")
+        with open(os.path.join(dist_info, "entry_points.txt"), "w") as f:
+            f.write("[%s]\n" % GROUP)
+
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        self.assertEqual([], list(plugin_manager))
+
+    def test_cache_with_edited_plugin(self):
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        self.assertEqual(1, len(list(plugin_manager)))
+
+        # Pretend that the plugin's module was edited after it was cached.
+        with open(self.cache_filename, encoding="utf-8") as f:
+            cache = json.load(f)
+
+        (entry,) = [
+            entry
+            for entry in cache["entry_points"]
+            if entry["name"] == "envisage.tests.lazy"
+        ]
+        self.assertEqual(sys.modules[MODULE].__file__, entry["source"]["filename"])
+        entry["source"]["mtime"] -= 1
+        entry["manifest"]["contributions"] = []
+        with open(self.cache_filename, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+
+        # The plugin's manifest is generated again.
+        plugin_manager = EntryPointPluginManager(
+            group=GROUP,
+            exclude=[".*broken", ".*needy"],
+            cache_filename=self.cache_filename,
+        )
+        (plugin,) = plugin_manager
+        self.assertEqual(["envisage.tests.fruits"], plugin.manifest.contributions)
@@ -0,0 +1,161 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for the extension event dispatchers."""
+
+# Standard library imports.
+import threading
+import unittest
+
+# Enthought library imports.
+from traits.api import HasTraits, List
+
+from envisage.api import (
+    CallLaterEventDispatcher,
+    ExtensionPoint,
+    ThreadEventDispatcher,
+)
+from envisage.tests.mutable_extension_registry import MutableExtensionRegistry
+
+
+class ExtensionEventDispatcherTestCase(unittest.TestCase):
+    """Tests for the extension event dispatchers."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        self.registry = MutableExtensionRegistry()
+        self.registry.add_extension_point(ExtensionPoint(List, id="my.ep"))
+        self.registry.add_extension_point(ExtensionPoint(List, id="your.ep"))
+
+        # The events (and the threads that they were delivered in) that the
+        # listener gets.
+        self.events = []
+        self.threads = []
+        self.registry.add_extension_point_listener(self.listener)
+
+    def listener(self, registry, event):
+        """Called when an extension point has changed."""
+
+        self.events.append(event)
+        self.threads.append(threading.current_thread())
+
+    def test_call_later(self):
+        calls = []
+        self.registry.dispatcher = CallLaterEventDispatcher(call_later=calls.append)
+
+        self.registry.add_extension("my.ep", 1)
+        self.registry.add_extensions("your.ep", [42])
+        self.registry.add_extensions("my.ep", [2, 3])
+        self.registry.remove_extension("my.ep", 1)
+        self.registry.add_extension("my.ep", 4)
+
+        # Nothing is delivered until the event loop gets round to it, and the
+        # delivery is only posted once.
+        self.assertEqual([], self.events)
+        self.assertEqual(1, len(calls))
+
+        calls[0]()
+
+        # Consecutive additions to the end of an extension point are merged.
+        self.assertEqual(
+            [
+                ("my.ep", 0, [1, 2, 3], []),
+                ("your.ep", 0, [42], []),
+                ("my.ep", None, [], [1]),
+                ("my.ep", 2, [4], []),
+            ],
+            [(e.extension_point_id, e.index, e.added, e.removed) for e in self.events],
+        )
+
+        # Events are delivered synchronously once the dispatcher is closed.
+        self.registry.dispatcher.close()
+        self.registry.add_extension("my.ep", 5)
+        self.assertEqual(5, len(self.events))
+        self.assertEqual(1, len(calls))
+
+    def test_call_later_flush(self):
+        self.registry.dispatcher = CallLaterEventDispatcher(call_later=lambda f: None)
+
+        self.registry.add_extension("my.ep", 1)
+        self.assertEqual([], self.events)
+
+        self.registry.dispatcher.flush()
+        self.assertEqual(1, len(self.events))
+
+    def test_thread(self):
+        dispatcher = ThreadEventDispatcher()
+        self.registry.dispatcher = dispatcher
+        self.addCleanup(dispatcher.close)
+
+        self.registry.add_extension("my.ep", 1)
+        self.registry.add_extension("my.ep", 2)
+        dispatcher.flush()
+
+        self.assertEqual([1, 2], [x for e in self.events for x in e.added])
+        self.assertNotIn(threading.current_thread(), self.threads)
+
+    def test_extension_point_trait_is_current_before_delivery(self):
+        calls = []
+        self.registry.dispatcher = CallLaterEventDispatcher(call_later=calls.append)
+
+        class Foo(HasTraits):
+            extension_registry = self.registry
+
+            x = ExtensionPoint(List, id="my.ep")
+
+        foo = Foo()
+        self.assertEqual([], foo.x)
+
+        self.registry.add_extension("my.ep", 1)
+        self.assertEqual([], self.events)
+        self.assertEqual([1], foo.x)
+
+    def test_extension_point_trait_with_thread_dispatcher(self):
+        dispatcher = ThreadEventDispatcher()
+        self.registry.dispatcher = dispatcher
+        self.addCleanup(dispatcher.close)
+
+        # Hold up the delivery of events until the trait has been read.
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.registry.add_extension_point_listener(
+            lambda registry, event: release.wait(5.0), "my.ep"
+        )
+
+        class Foo(HasTraits):
+            extension_registry = self.registry
+
+            x = ExtensionPoint(List, id="my.ep")
+
+        foo = Foo()
+        self.assertEqual([], foo.x)
+
+        self.registry.add_extension("my.ep", 1)
+        self.assertEqual([1], foo.x)
+
+        release.set()
+        dispatcher.flush()
+        self.assertEqual(1, len(self.events))
+
+    def test_listener_exceptions_are_logged(self):
+        calls = []
+        self.registry.dispatcher = CallLaterEventDispatcher(call_later=calls.append)
+
+        def bad_listener(registry, event):
+            raise ZeroDivisionError()
+
+        self.registry.add_extension_point_listener(bad_listener, "my.ep")
+        self.registry.add_extension("my.ep", 1)
+
+        with self.assertLogs("envisage.extension_event_dispatcher", "ERROR"):
+            calls[0]()
+
+        # The other listeners are still called.
+        self.assertEqual(1, len(self.events))
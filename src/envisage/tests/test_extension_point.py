@@ -12,10 +12,15 @@
 # Standard library imports.
 import unittest
 
-from traits.api import HasTraits, Int, List, TraitError
+from traits.api import BaseInt, HasTraits, Instance, Int, List, Str, TraitError
 
 # Enthought library imports.
-from envisage.api import Application, ExtensionPoint, ExtensionRegistry
+from envisage.api import (
+    Application,
+    ExtensionPoint,
+    ExtensionRegistry,
+    get_extension_by_key,
+)
 
 
 class HasExtensionPoints(HasTraits):
@@ -260,6 +265,101 @@ class ExtensionPointTestCase(unittest.TestCase):
         self.assertEqual(ep_repr.format("my.ep"), str(ep))
         self.assertEqual(ep_repr.format("my.ep"), repr(ep))
 
+    def test_extensions_are_only_validated_once(self):
+        validated = []
+
+        class CountingInt(BaseInt):
+            def validate(self, object, name, value):
+                validated.append(value)
+                return super().validate(object, name, value)
+
+        registry = self.registry
+        registry.add_extension_point(self._create_extension_point("my.ep"))
+        registry.set_extensions("my.ep", [1, 2, 3])
+
+        class Foo(HasExtensionPoints):
+            x = ExtensionPoint(List(CountingInt()), id="my.ep")
+
+        f = Foo()
+        self.assertEqual([1, 2, 3], f.x)
+        self.assertEqual([1, 2, 3], f.x)
+        self.assertEqual([1, 2, 3], validated)
+
+        # Each read still returns a new list.
+        self.assertIsNot(f.x, f.x)
+
+        # Changing the extensions means they are validated again.
+        registry.set_extensions("my.ep", [4, 5])
+        self.assertEqual([4, 5], f.x)
+        self.assertEqual([1, 2, 3, 4, 5], validated)
+
+        # Invalid extensions are never cached.
+        registry.set_extensions("my.ep", [6, "seven"])
+        for i in range(2):
+            with self.assertRaises(TraitError):
+                f.x
+
+    def test_listeners_never_see_stale_extensions(self):
+        registry = self.registry
+        registry.add_extension_point(self._create_extension_point("my.ep"))
+        registry.set_extensions("my.ep", [1])
+
+        class Foo(HasExtensionPoints):
+            x = ExtensionPoint(List(Int), id="my.ep")
+
+        f = Foo()
+        seen = []
+
+        # The listener is added before the extensions are first read (and
+        # cached).
+        def listener(extension_registry, event):
+            seen.append(f.x)
+
+        registry.add_extension_point_listener(listener, "my.ep")
+        self.assertEqual([1], f.x)
+
+        registry.set_extensions("my.ep", [1, 2])
+        self.assertEqual([[1, 2]], seen)
+
+    def test_get_by_key(self):
+        class Contribution(HasTraits):
+            id = Str
+
+        registry = self.registry
+        registry.add_extension_point(self._create_extension_point("my.ep"))
+
+        a, b, a2 = Contribution(id="a"), Contribution(id="b"), Contribution(id="a")
+        registry.set_extensions("my.ep", [a, b, a2])
+
+        class Foo(HasExtensionPoints):
+            x = ExtensionPoint(List(Instance(Contribution)), id="my.ep", key="id")
+            y = ExtensionPoint(id="my.ep")
+            z = List
+
+        f = Foo()
+
+        # The first contribution with the key wins.
+        self.assertIs(a, get_extension_by_key(f, "x", "a"))
+        self.assertIs(b, get_extension_by_key(f, "x", "b"))
+        self.assertIsNone(get_extension_by_key(f, "x", "c"))
+
+        # The index is kept up to date.
+        c = Contribution(id="c")
+        registry.set_extensions("my.ep", [b, c])
+        self.assertIsNone(get_extension_by_key(f, "x", "a"))
+        self.assertIs(c, get_extension_by_key(f, "x", "c"))
+
+        # Extension points without keys can't be looked up by key...
+        with self.assertRaises(ValueError):
+            get_extension_by_key(f, "y", "c")
+
+        # ... and nor can other traits.
+        with self.assertRaises(ValueError):
+            get_extension_by_key(f, "z", "c")
+
+        with self.assertRaises(ValueError):
+            get_extension_by_key(f, "no_such_trait", "c")
+
     ###########################################################################
     # Private interface.
     ###########################################################################
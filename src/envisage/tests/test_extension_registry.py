@@ -163,6 +163,48 @@ class ExtensionPointListenerLifetimeTestCase(unittest.TestCase):
         with self.assertDoesNotModify(self.events):
             self.registry.set_extensions("my.ep", [1, 2, 3])
 
+    def test_dead_listeners_are_pruned(self):
+        extension_registry = self.registry.extension_registry
+        objs = [ListensToExtensionPoint(self.events) for _ in range(10)]
+        for obj in objs:
+            self.registry.add_extension_point_listener(obj.listener, "my.ep")
+        self.assertEqual(10, len(extension_registry._get_listener_refs("my.ep")))
+
+        # The references are removed as soon as the listeners are collected.
+        del obj, objs[:5]
+        self.assertEqual(5, len(extension_registry._listeners["my.ep"]))
+        self.assertEqual(5, len(extension_registry._get_listener_refs("my.ep")))
+
+        self.registry.set_extensions("my.ep", [1, 2, 3])
+        self.assertEqual(5, len(self.events))
+
+    def test_listeners_called_in_order(self):
+        calls = []
+        any_listener = ListensToExtensionPoint(calls)
+        first = make_function_listener(calls)
+        second = make_function_listener(calls)
+
+        self.registry.add_extension_point_listener(any_listener.listener)
+        self.registry.add_extension_point_listener(first, "my.ep")
+        self.registry.set_extensions("my.ep", [1])
+        self.registry.add_extension_point_listener(second, "my.ep")
+        del calls[:]
+
+        # Listeners to the extension point are called first, in the order
+        # that they were added, followed by listeners to any extension point.
+        self.registry.set_extensions("my.ep", [1, 2])
+        self.assertEqual(3, len(calls))
+
+        self.registry.remove_extension_point_listener(first, "my.ep")
+        with self.assertRaises(ValueError):
+            self.registry.remove_extension_point_listener(first, "my.ep")
+
+        extension_registry = self.registry.extension_registry
+        self.assertEqual(
+            [second, any_listener.listener],
+            [ref() for ref in extension_registry._get_listener_refs("my.ep")],
+        )
+
     # Helper assertions #######################################################
 
     @contextlib.contextmanager
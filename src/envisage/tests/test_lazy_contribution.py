@@ -0,0 +1,89 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for lazy contributions."""
+
+# Standard library imports.
+import sys
+import unittest
+
+# Enthought library imports.
+from traits.api import Callable, HasTraits, List
+
+from envisage.api import (
+    Application,
+    ExtensionPoint,
+    ExtensionRegistry,
+    get_extension_by_key,
+    LazyContribution,
+    materialize,
+)
+
+# This module's package.
+PKG = "envisage.tests"
+
+
+class LazyContributionTestCase(unittest.TestCase):
+    """Tests for lazy contributions."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        # Make sure that we can tell when module 'foo' is imported.
+        sys.modules.pop(PKG + ".foo", None)
+
+    def test_metadata_does_not_materialize(self):
+        contribution = LazyContribution(PKG + ".foo:Foo", id="foo", name="Foo")
+
+        self.assertEqual("foo", contribution.id)
+        self.assertEqual("Foo", contribution.name)
+        self.assertNotIn(PKG + ".foo", sys.modules)
+
+    def test_materialize_symbol(self):
+        contribution = LazyContribution(PKG + ".foo:Foo", id="foo")
+
+        # The symbol itself is the contribution.
+        foo_class = materialize(contribution)
+        self.assertIs(sys.modules[PKG + ".foo"].Foo, foo_class)
+
+        # Calling the contribution calls the symbol.
+        self.assertIsInstance(contribution(), foo_class)
+
+        # Other objects are their own contributions.
+        self.assertIs(foo_class, materialize(foo_class))
+
+    def test_materialize_with_properties(self):
+        contribution = LazyContribution(
+            "traits.api:HasTraits", properties={"price": 100}, id="bar"
+        )
+
+        # Getting an attribute that isn't metadata creates the contribution.
+        self.assertEqual(100, contribution.price)
+        self.assertIs(materialize(contribution), materialize(contribution))
+        self.assertIsInstance(materialize(contribution), HasTraits)
+
+        with self.assertRaises(AttributeError):
+            contribution.no_such_attribute
+
+    def test_contribute_to_extension_point(self):
+        registry = Application(extension_registry=ExtensionRegistry())
+        registry.add_extension_point(ExtensionPoint(List(Callable), id="my.ep"))
+        registry.set_extensions("my.ep", [LazyContribution(PKG + ".foo:Foo", id="foo")])
+
+        class Bar(HasTraits):
+            extension_registry = registry
+
+            factories = ExtensionPoint(List(Callable), id="my.ep", key="id")
+
+        bar = Bar()
+        factory = get_extension_by_key(bar, "factories", "foo")
+        self.assertNotIn(PKG + ".foo", sys.modules)
+
+        foo = factory()
+        self.assertIsInstance(foo, sys.modules[PKG + ".foo"].Foo)
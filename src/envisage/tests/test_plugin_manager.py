@@ -10,9 +10,10 @@
 """Tests for the plugin manager."""
 
 # Standard library imports.
+import threading
 import unittest
 
-from traits.api import Bool
+from traits.api import Any, Bool
 
 # Enthought library imports.
 from envisage.api import Plugin, PluginManager
@@ -61,6 +62,35 @@ class BadPlugin(Plugin):
         raise 1 / 0
 
 
+class OrderedPlugin(Plugin):
+    """A plugin that records when it is started and stopped."""
+
+    #### 'OrderedPlugin' interface ############################################
+
+    # The list that the plugin adds its Id to when it is started or stopped.
+    events = Any
+
+    # A barrier that the plugin waits at when it is started (if any).
+    barrier = Any
+
+    ###########################################################################
+    # 'IPlugin' interface.
+    ###########################################################################
+
+    def start(self):
+        """Start the plugin."""
+
+        if self.barrier is not None:
+            self.barrier.wait()
+
+        self.events.append(("start", self.id))
+
+    def stop(self):
+        """Stop the plugin."""
+
+        self.events.append(("stop", self.id))
+
+
 class PluginManagerTestCase(unittest.TestCase):
     """Tests for the plugin manager."""
 
@@ -77,6 +107,28 @@ class PluginManagerTestCase(unittest.TestCase):
         # Try to get a non-existent plugin.
         self.assertEqual(None, plugin_manager.get_plugin("bogus"))
 
+    def test_get_plugin_after_adding_and_removing_plugins(self):
+        first = SimplePlugin(id="first")
+        plugin_manager = PluginManager(plugins=[first])
+        self.assertIs(first, plugin_manager.get_plugin("first"))
+
+        second = SimplePlugin(id="second")
+        plugin_manager.add_plugin(second)
+        self.assertIs(second, plugin_manager.get_plugin("second"))
+
+        # The first plugin with an Id wins.
+        duplicate = SimplePlugin(id="first")
+        with self.assertLogs("envisage.plugin_manager", "WARNING"):
+            plugin_manager.add_plugin(duplicate)
+        self.assertIs(first, plugin_manager.get_plugin("first"))
+
+        plugin_manager.remove_plugin(first)
+        self.assertIs(duplicate, plugin_manager.get_plugin("first"))
+
+        plugin_manager.remove_plugin(duplicate)
+        self.assertIsNone(plugin_manager.get_plugin("first"))
+        self.assertIs(second, plugin_manager.get_plugin("second"))
+
     def test_iteration_over_plugins(self):
         """iteration over plugins"""
 
@@ -130,6 +182,72 @@ class PluginManagerTestCase(unittest.TestCase):
         # Make sure the plugin was stopped.
         self.assertEqual(True, simple_plugin.stopped)
 
+    def test_start_and_stop_in_order_of_requirements(self):
+        events = []
+        plugin_manager = PluginManager(
+            plugins=[
+                OrderedPlugin(id="c", requires=["acme.IFoo"], events=events),
+                OrderedPlugin(id="d", events=events),
+                OrderedPlugin(id="b", requires=["a"], events=events),
+                OrderedPlugin(id="a", provides=["acme.IFoo"], events=events),
+            ]
+        )
+
+        plugin_manager.start()
+        plugin_manager.stop()
+
+        # Plugins without requirements keep their order.
+        self.assertEqual(
+            [("start", id) for id in "dacb"] + [("stop", id) for id in "bcad"],
+            events,
+        )
+
+    def test_circular_requirements(self):
+        plugin_manager = PluginManager(
+            plugins=[
+                OrderedPlugin(id="a", requires=["b"], events=[]),
+                OrderedPlugin(id="b", requires=["a"], events=[]),
+                OrderedPlugin(id="c", events=[]),
+            ]
+        )
+
+        with self.assertRaises(ValueError):
+            plugin_manager.start()
+
+    def test_start_in_parallel(self):
+        # The first two plugins can only start if they are started together.
+        events = []
+        barrier = threading.Barrier(2, timeout=10)
+        plugin_manager = PluginManager(
+            plugins=[
+                OrderedPlugin(id="c", requires=["a", "b"], events=events),
+                OrderedPlugin(id="a", barrier=barrier, events=events),
+                OrderedPlugin(id="b", barrier=barrier, events=events),
+            ],
+            max_workers=4,
+        )
+
+        plugin_manager.start()
+
+        self.assertEqual({("start", "a"), ("start", "b")}, set(events[:2]))
+        self.assertEqual(("start", "c"), events[2])
+
+    def test_start_in_parallel_errors(self):
+        events = []
+        plugin_manager = PluginManager(
+            plugins=[
+                BadPlugin(id="bad"),
+                OrderedPlugin(id="a", requires=["bad"], events=events),
+            ],
+            max_workers=4,
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            plugin_manager.start()
+
+        # Plugins that require a plugin that failed to start aren't started.
+        self.assertEqual([], events)
+
     def test_start_and_stop_errors(self):
         """start and stop errors"""
 
@@ -0,0 +1,158 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for plugin manifests."""
+
+# Standard library imports.
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Enthought library imports.
+from traits.api import List
+
+from envisage.api import (
+    Application,
+    ExtensionPoint,
+    Plugin,
+    PluginManager,
+    PluginManifest,
+)
+from envisage.tests.ets_config_patcher import ETSConfigPatcher
+
+# The module that contains the plugin described by the manifests.
+MODULE = "envisage.tests.lazy_plugin"
+
+# The manifest of the plugin.
+MANIFEST = {
+    "id": "envisage.tests.lazy",
+    "name": "Lazy Plugin",
+    "plugin_class": MODULE + ":LazyPlugin",
+    "extension_points": ["envisage.tests.things"],
+    "contributions": ["envisage.tests.fruits"],
+    "lazy": True,
+}
+
+
+class FruitPlugin(Plugin):
+    """A plugin that uses the contributions of the lazy plugin."""
+
+    id = "envisage.tests.fruit"
+
+    fruits = ExtensionPoint(List, id="envisage.tests.fruits")
+
+
+class PluginManifestTestCase(unittest.TestCase):
+    """Tests for plugin manifests."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        ets_config_patcher = ETSConfigPatcher()
+        ets_config_patcher.start()
+        self.addCleanup(ets_config_patcher.stop)
+
+        # Make sure that we can tell when the plugin's module is imported.
+        sys.modules.pop(MODULE, None)
+
+    def test_from_plugin_class(self):
+        module = importlib.import_module(MODULE)
+        manifest = PluginManifest.from_plugin_class(module.LazyPlugin)
+
+        # Plugins that do their own work in 'start' can't be lazy.
+        self.assertEqual(dict(MANIFEST, lazy=False), manifest.trait_get(*MANIFEST))
+
+        # Ids and names that aren't given get the same defaults as plugins.
+        manifest = PluginManifest.from_plugin_class(FruitPlugin)
+        self.assertEqual("envisage.tests.fruit", manifest.id)
+        self.assertEqual("Fruit Plugin", manifest.name)
+        self.assertEqual([], manifest.contributions)
+        self.assertTrue(manifest.lazy)
+
+    def test_from_plugin_class_with_computed_id(self):
+        class ComputedPlugin(Plugin):
+            def _id_default(self):
+                return "computed"
+
+        with self.assertRaises(ValueError):
+            PluginManifest.from_plugin_class(ComputedPlugin)
+
+        manifest = PluginManifest.from_plugin_class(ComputedPlugin, id="computed")
+        self.assertEqual("computed", manifest.id)
+
+    def test_from_plugin_class_with_computed_requirements(self):
+        class NeedyPlugin(Plugin):
+            id = "needy"
+
+            def _requires_default(self):
+                return ["acme.foo"]
+
+        with self.assertRaises(ValueError):
+            PluginManifest.from_plugin_class(NeedyPlugin)
+
+        # A plugin can be created to find out what they are.
+        manifest = PluginManifest.from_plugin_class(NeedyPlugin, instantiate=True)
+        self.assertEqual("needy", manifest.id)
+        self.assertEqual(["acme.foo"], manifest.requires)
+        self.assertEqual([], manifest.provides)
+
+    def test_save_and_load(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        filename = os.path.join(tmpdir, "plugin_manifest.json")
+
+        PluginManifest(**MANIFEST).save(filename)
+        manifest = PluginManifest.load(filename)
+
+        self.assertEqual(MANIFEST, manifest.trait_get(*MANIFEST))
+
+    def test_plugin_loaded_on_demand(self):
+        lazy = PluginManifest(**MANIFEST).create_plugin()
+        fruit = FruitPlugin()
+        application = Application(
+            id="test", plugin_manager=PluginManager(plugins=[fruit, lazy])
+        )
+
+        # The extension points of the plugin are known without importing it.
+        self.assertEqual("envisage.tests.lazy", lazy.id)
+        self.assertEqual("Lazy Plugin", lazy.name)
+        self.assertIsNotNone(application.get_extension_point("envisage.tests.things"))
+
+        application.start()
+        self.assertNotIn(MODULE, sys.modules)
+        self.assertIsNone(lazy.plugin)
+
+        # Using a contribution loads and starts the plugin.
+        self.assertEqual(["apple", "orange"], fruit.fruits)
+        self.assertIn(MODULE, sys.modules)
+        self.assertIs(application, lazy.plugin.application)
+        self.assertTrue(lazy.plugin.started)
+
+        # Changes to the contributions are passed on.
+        lazy.plugin.fruits.append("pear")
+        self.assertEqual(["apple", "orange", "pear"], fruit.fruits)
+
+        application.stop()
+        self.assertFalse(lazy.plugin.started)
+
+    def test_plugin_that_is_not_lazy(self):
+        manifest = PluginManifest(**dict(MANIFEST, lazy=False))
+        lazy = manifest.create_plugin()
+        application = Application(
+            id="test", plugin_manager=PluginManager(plugins=[lazy])
+        )
+
+        application.start()
+        self.assertTrue(lazy.plugin.started)
+
+        application.stop()
+        self.assertFalse(lazy.plugin.started)
@@ -0,0 +1,355 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for the plugin supervisor."""
+
+# Standard library imports.
+import threading
+import unittest
+
+# Enthought library imports.
+from traits.api import Any, Bool, HasTraits, Int, Interface, List, provides
+
+from envisage.api import (
+    Application,
+    Plugin,
+    PluginManager,
+    PluginReport,
+    PluginSupervisor,
+    PluginTimeoutError,
+)
+
+
+class IFoo(Interface):
+    """The service registered by 'FlakyPlugin'."""
+
+
+@provides(IFoo)
+class Foo(HasTraits):
+    """An implementation of 'IFoo'."""
+
+
+class BrokenPlugin(Plugin):
+    """A plugin that fails to start a number of times (and may fail to stop)."""
+
+    #: The number of times that the plugin fails to start.
+    failures = Int(1000)
+
+    #: Does the plugin fail to stop?
+    broken_stop = Bool(False)
+
+    #: The number of times that the plugin has been started.
+    starts = Int(0)
+
+    #: The number of times that the plugin has been stopped.
+    stops = Int(0)
+
+    def start(self):
+        """Start the plugin."""
+
+        self.starts += 1
+        if self.starts <= self.failures:
+            raise ZeroDivisionError(self.id)
+
+    def stop(self):
+        """Stop the plugin."""
+
+        self.stops += 1
+        if self.broken_stop:
+            raise ZeroDivisionError(self.id)
+
+
+class FlakyPlugin(Plugin):
+    """A plugin that registers a service and then fails, the first time."""
+
+    #: The Ids of the services that the plugin has registered.
+    service_ids = List(Int)
+
+    #: The number of times that the plugin has been started.
+    starts = Int(0)
+
+    def start(self):
+        """Start the plugin."""
+
+        self.starts += 1
+        self.service_ids.append(self.application.register_service(IFoo, Foo()))
+        if self.starts == 1:
+            raise ZeroDivisionError(self.id)
+
+    def stop(self):
+        """Stop the plugin."""
+
+        while self.service_ids:
+            self.application.unregister_service(self.service_ids.pop())
+
+
+class HangingPlugin(Plugin):
+    """A plugin that doesn't start until it is released."""
+
+    def __init__(self, **traits):
+        """Constructor."""
+
+        super().__init__(**traits)
+
+        self.release = threading.Event()
+
+    def start(self):
+        """Start the plugin."""
+
+        self.release.wait(5.0)
+
+
+class TrackedPlugin(Plugin):
+    """A plugin that records when it is started and stopped."""
+
+    #: The Ids of the plugins that have been started (shared by plugins).
+    started = Any
+
+    #: The Ids of the plugins that have been stopped (shared by plugins).
+    stopped = Any(factory=list)
+
+    def start(self):
+        """Start the plugin."""
+
+        self.started.append(self.id)
+
+    def stop(self):
+        """Stop the plugin."""
+
+        self.stopped.append(self.id)
+
+
+class PluginSupervisorTestCase(unittest.TestCase):
+    """Tests for the plugin supervisor."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        self.started = []
+
+    def test_abort_by_default(self):
+        plugin_manager = PluginManager(
+            plugins=[
+                BrokenPlugin(id="broken"),
+                TrackedPlugin(id="after", started=self.started),
+            ]
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            plugin_manager.start()
+
+        self.assertEqual([], self.started)
+
+    def test_skip(self):
+        broken = BrokenPlugin(id="broken")
+        plugin_manager = PluginManager(
+            plugins=[
+                broken,
+                TrackedPlugin(id="after", started=self.started),
+                TrackedPlugin(id="needy", requires=["broken"], started=self.started),
+            ],
+            supervisor=PluginSupervisor(policy="skip"),
+        )
+
+        report = plugin_manager.start()
+
+        # The plugin that requires the broken plugin isn't started.
+        self.assertEqual(["after"], self.started)
+        self.assertEqual(
+            ["broken", "needy"], [failure.plugin.id for failure in report.failures]
+        )
+
+        failure = report.failures[0]
+        self.assertIs(broken, failure.plugin)
+        self.assertEqual("start", failure.action)
+        self.assertIsInstance(failure.error, ZeroDivisionError)
+        self.assertEqual(1, failure.attempts)
+
+        failure = report.failures[1]
+        self.assertIsInstance(failure.error, ValueError)
+        self.assertEqual(0, failure.attempts)
+
+    def test_skip_in_parallel(self):
+        plugin_manager = PluginManager(
+            plugins=[
+                BrokenPlugin(id="broken"),
+                TrackedPlugin(id="after", started=self.started),
+                TrackedPlugin(id="needy", requires=["broken"], started=self.started),
+            ],
+            max_workers=2,
+            supervisor=PluginSupervisor(policy="skip"),
+        )
+
+        report = plugin_manager.start()
+
+        self.assertEqual(["after"], self.started)
+        self.assertEqual(
+            ["broken", "needy"], [failure.plugin.id for failure in report.failures]
+        )
+
+    def test_retry(self):
+        plugin = BrokenPlugin(id="broken", failures=2)
+        plugin_manager = PluginManager(
+            plugins=[plugin],
+            supervisor=PluginSupervisor(
+                policy="retry", retries=2, retry_delay=0.001, backoff=2.0
+            ),
+        )
+
+        with self.assertLogs("envisage.plugin_supervisor", level="ERROR") as cm:
+            report = plugin_manager.start()
+
+        self.assertEqual([], report.failures)
+        self.assertEqual(3, plugin.starts)
+
+        # Each failed start is undone before the plugin is retried.
+        self.assertEqual(2, plugin.stops)
+
+        # The wait before each retry is longer than the last.
+        self.assertEqual(
+            [
+                "plugin broken failed to start, retrying in 0.001s",
+                "plugin broken failed to start, retrying in 0.002s",
+            ],
+            [record.getMessage() for record in cm.records],
+        )
+
+    def test_retry_gives_up(self):
+        plugin = BrokenPlugin(id="broken")
+        plugin_manager = PluginManager(
+            plugins=[plugin],
+            supervisor=PluginSupervisor(policy="retry", retries=2, retry_delay=0.0),
+        )
+
+        with self.assertLogs("envisage.plugin_supervisor", level="ERROR") as cm:
+            report = plugin_manager.start()
+
+        # The last failure isn't retried.
+        self.assertEqual(2, len(cm.records))
+
+        (failure,) = report.failures
+        self.assertEqual(3, failure.attempts)
+        self.assertEqual(3, plugin.starts)
+        self.assertEqual(3, plugin.stops)
+
+    def test_retry_undoes_failed_start(self):
+        plugin = FlakyPlugin(id="flaky")
+        application = Application(
+            id="test",
+            plugin_manager=PluginManager(
+                plugins=[plugin],
+                supervisor=PluginSupervisor(policy="retry", retry_delay=0.0),
+            ),
+        )
+
+        with self.assertLogs("envisage.plugin_supervisor", level="ERROR"):
+            report = application.start()
+
+        # The service registered by the failed start was unregistered again.
+        self.assertEqual([], report.failures)
+        self.assertEqual(1, len(application.get_services(IFoo)))
+
+    def test_failed_plugins_are_not_stopped(self):
+        broken = BrokenPlugin(id="broken")
+        stopped = []
+        plugin_manager = PluginManager(
+            plugins=[
+                broken,
+                TrackedPlugin(id="after", started=self.started, stopped=stopped),
+                TrackedPlugin(
+                    id="needy",
+                    requires=["broken"],
+                    started=self.started,
+                    stopped=stopped,
+                ),
+            ],
+            supervisor=PluginSupervisor(policy="retry", retries=1, retry_delay=0.0),
+        )
+
+        with self.assertLogs("envisage.plugin_supervisor", level="ERROR"):
+            plugin_manager.start()
+
+        self.assertEqual(["after"], self.started)
+        self.assertEqual(2, broken.stops)
+
+        # Only the plugins that were started are stopped (the failed starts
+        # have already been undone).
+        plugin_manager.stop()
+        self.assertEqual(["after"], stopped)
+        self.assertEqual(2, broken.stops)
+
+    def test_start_timeout(self):
+        hanging = HangingPlugin(id="hanging")
+        self.addCleanup(hanging.release.set)
+        plugin_manager = PluginManager(
+            plugins=[hanging, TrackedPlugin(id="after", started=self.started)],
+            supervisor=PluginSupervisor(policy="skip", start_timeout=0.05),
+        )
+
+        report = plugin_manager.start()
+
+        (failure,) = report.failures
+        self.assertIs(hanging, failure.plugin)
+        self.assertIsInstance(failure.error, PluginTimeoutError)
+        self.assertEqual(["after"], self.started)
+
+    def test_start_timeout_aborts(self):
+        hanging = HangingPlugin(id="hanging")
+        self.addCleanup(hanging.release.set)
+        plugin_manager = PluginManager(
+            plugins=[hanging],
+            supervisor=PluginSupervisor(start_timeout=0.05),
+        )
+
+        with self.assertRaises(PluginTimeoutError):
+            plugin_manager.start()
+
+    def test_stop(self):
+        plugin_manager = PluginManager(
+            plugins=[
+                BrokenPlugin(id="broken", failures=0, broken_stop=True),
+                BrokenPlugin(id="other", failures=0, broken_stop=True),
+            ],
+            supervisor=PluginSupervisor(policy="skip"),
+        )
+        plugin_manager.start()
+
+        report = plugin_manager.stop()
+
+        # Plugins are stopped in the reverse order that they were started.
+        self.assertEqual(
+            ["other", "broken"], [failure.plugin.id for failure in report.failures]
+        )
+        self.assertEqual("stop", report.failures[0].action)
+
+    def test_application_report(self):
+        application = Application(
+            id="test",
+            plugin_manager=PluginManager(
+                plugins=[BrokenPlugin(id="broken")],
+                supervisor=PluginSupervisor(policy="skip"),
+            ),
+        )
+
+        with self.assertLogs("envisage.application", level="ERROR") as cm:
+            report = application.start()
+
+        # The report is true, as the start wasn't vetoed.
+        self.assertIsInstance(report, PluginReport)
+        self.assertTrue(report)
+        self.assertEqual(["broken"], [f.plugin.id for f in report.failures])
+
+        # Failures are logged by the application.
+        self.assertEqual(
+            ["plugin broken failed to start"],
+            [record.getMessage() for record in cm.records],
+        )
+
+        # Vetoed reports are false.
+        self.assertFalse(PluginReport(vetoed=True))
@@ -0,0 +1,174 @@
+# (C) Copyright 2007-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""Tests for the profilers."""
+
+# Standard library imports.
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+# Enthought library imports.
+from traits.api import HasTraits, List
+
+from envisage.api import (
+    Application,
+    ExtensionPoint,
+    NullProfiler,
+    Plugin,
+    PluginManager,
+    Profiler,
+    ServiceRegistry,
+)
+
+
+class Foo(HasTraits):
+    """A service."""
+
+
+class AcmePlugin(Plugin):
+    """A plugin that offers an extension point."""
+
+    id = "acme"
+
+    greetings = ExtensionPoint(List, id="acme.greetings")
+
+
+class BarPlugin(Plugin):
+    """A plugin that contributes to an extension point."""
+
+    id = "bar"
+
+    greetings = List(["hello"], contributes_to="acme.greetings")
+
+    def start(self):
+        """Start the plugin."""
+
+        self.application.get_extensions("acme.greetings")
+
+
+class ProfilerTestCase(unittest.TestCase):
+    """Tests for the profilers."""
+
+    def setUp(self):
+        """Prepares the test fixture before each test method is called."""
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def test_nested_spans(self):
+        profiler = Profiler()
+
+        with profiler.span("outer", plugin="acme"):
+            with profiler.span("inner", category="test"):
+                pass
+
+        outer, inner = profiler.trace_events()
+        self.assertEqual("outer", outer["name"])
+        self.assertEqual("envisage", outer["cat"])
+        self.assertEqual("X", outer["ph"])
+        self.assertEqual({"plugin": "acme"}, outer["args"])
+        self.assertEqual("inner", inner["name"])
+        self.assertEqual("test", inner["cat"])
+        self.assertEqual(os.getpid(), inner["pid"])
+
+        # The inner span is within the outer span.
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"])
+
+        profiler.reset()
+        self.assertEqual([], profiler.trace_events())
+
+    def test_span_records_error(self):
+        profiler = Profiler()
+
+        with self.assertRaises(ZeroDivisionError):
+            with profiler.span("divide"):
+                1 / 0
+
+        (event,) = profiler.trace_events()
+        self.assertEqual({"error": "ZeroDivisionError"}, event["args"])
+
+    def test_save(self):
+        profiler = Profiler()
+        with profiler.span("work"):
+            pass
+
+        filename = os.path.join(self.tmpdir, "trace.json")
+        profiler.save(filename)
+
+        with open(filename, encoding="utf-8") as f:
+            trace = json.load(f)
+
+        self.assertEqual(profiler.trace_events(), trace["traceEvents"])
+
+    def test_null_profiler(self):
+        profiler = NullProfiler()
+        with profiler.span("work"):
+            pass
+
+        self.assertEqual([], profiler.trace_events())
+
+        filename = os.path.join(self.tmpdir, "trace.json")
+        profiler.save(filename)
+
+        with open(filename, encoding="utf-8") as f:
+            self.assertEqual({"traceEvents": []}, json.load(f))
+
+    def test_application_start_and_stop(self):
+        profiler = Profiler()
+        application = Application(
+            id="test", plugins=[AcmePlugin(), BarPlugin()], profiler=profiler
+        )
+        application.start()
+        application.stop()
+
+        events = profiler.trace_events()
+        names = [event["name"] for event in events]
+        self.assertEqual("application.start", names[0])
+        self.assertIn("application.stop", names)
+
+        started = [
+            event["args"]["plugin"]
+            for event in events
+            if event["name"] == "plugin.start"
+        ]
+        self.assertEqual(["acme", "bar"], started)
+
+        (initialize,) = [
+            event for event in events if event["name"] == "extension_point.initialize"
+        ]
+        self.assertEqual({"extension_point": "acme.greetings"}, initialize["args"])
+
+    def test_application_shares_profiler(self):
+        application = Application(id="test", plugin_manager=PluginManager())
+        self.assertIsInstance(application.plugin_manager.profiler, NullProfiler)
+
+        profiler = Profiler()
+        application.profiler = profiler
+        self.assertIs(profiler, application.plugin_manager.profiler)
+        self.assertIs(profiler, application.extension_registry.profiler)
+        self.assertIs(profiler, application.service_registry.profiler)
+
+        # Components added later get the application's profiler too.
+        application.service_registry = ServiceRegistry()
+        self.assertIs(profiler, application.service_registry.profiler)
+
+    def test_service_creation(self):
+        profiler = Profiler()
+        registry = ServiceRegistry(profiler=profiler)
+        registry.register_service(Foo, lambda **properties: Foo())
+
+        registry.get_service(Foo)
+
+        (event,) = profiler.trace_events()
+        self.assertEqual("service.create", event["name"])
+        self.assertIn("Foo", event["args"]["protocol"])
@@ -11,6 +11,7 @@
 
 # Standard library imports.
 import logging
+import random
 import unittest
 
 from traits.api import Int, List
@@ -234,6 +235,18 @@ class ProviderExtensionRegistryTestCase(ExtensionRegistryTestMixin, unittest.Tes
         self.assertEqual(4, len(extensions))
         self.assertEqual([42, 43, 99, 100], extensions)
 
+        # Change the same provider's extensions again.
+        a.x.append(44)
+        del a.x[0]
+
+        extensions = registry.get_extensions("my.ep")
+        self.assertEqual([43, 44, 99, 100], extensions)
+
+        a.x[:0] = [42]
+        extensions = registry.get_extensions("my.ep")
+        self.assertEqual([42, 43, 44, 99, 100], extensions)
+        del a.x[2]
+
         # Insert a new extension via the other provider.
         b.x.insert(0, 98)
 
@@ -263,6 +276,124 @@ class ProviderExtensionRegistryTestCase(ExtensionRegistryTestMixin, unittest.Tes
         self.assertEqual(4, len(extensions))
         self.assertEqual([42, 43, 1, 2], extensions)
 
+    def test_get_extensions_returns_a_copy(self):
+        class ProviderA(ExtensionProvider):
+            def get_extension_points(self):
+                return [ExtensionPoint(List, "my.ep")]
+
+            def get_extensions(self, extension_point_id):
+                return [42] if extension_point_id == "my.ep" else []
+
+        self.registry.add_provider(ProviderA())
+
+        extensions = self.registry.get_extensions("my.ep")
+        extensions.append(43)
+
+        self.assertEqual([42], self.registry.get_extensions("my.ep"))
+
+    def test_many_providers_added_removed_and_changed(self):
+        class Provider(ExtensionProvider):
+            x = List(Int)
+
+            def get_extension_points(self):
+                return [ExtensionPoint(List, "my.ep")] if self.x == [0] else []
+
+            def get_extensions(self, extension_point_id):
+                return self.x if extension_point_id == "my.ep" else []
+
+            def _x_items_changed(self, event):
+                self._fire_extension_point_changed(
+                    "my.ep", event.added, event.removed, event.index
+                )
+
+        # Keep a copy of the extensions up to date using the events.
+        def listener(registry, event):
+            index = event.index
+            if not isinstance(index, slice):
+                index = slice(index, index + len(event.removed))
+
+            self.assertEqual(event.removed, extensions[index])
+            extensions[index] = event.added
+
+        # The first provider offers the extension point, and is never removed.
+        providers = [Provider(x=[0])]
+        self.registry.add_provider(providers[0])
+        extensions = self.registry.get_extensions("my.ep")
+        self.registry.add_extension_point_listener(listener, "my.ep")
+
+        rng = random.Random(0)
+        for i in range(1, 500):
+            action = rng.random()
+            if action < 0.4 or len(providers) == 1:
+                provider = Provider(x=[i] * rng.randrange(3))
+                providers.append(provider)
+                self.registry.add_provider(provider)
+
+            elif action < 0.7:
+                provider = providers.pop(rng.randrange(1, len(providers)))
+                self.registry.remove_provider(provider)
+
+            else:
+                provider = rng.choice(providers[1:])
+                provider.x.append(i)
+
+            expected = [x for provider in providers for x in provider.x]
+            self.assertEqual(expected, self.registry.get_extensions("my.ep"))
+            self.assertEqual(expected, extensions)
+
+    def test_add_and_remove_providers(self):
+        class Provider(ExtensionProvider):
+            x = List(Int)
+
+            def get_extension_points(self):
+                return [ExtensionPoint(List, "my.ep")] if self.x == [0] else []
+
+            def get_extensions(self, extension_point_id):
+                return self.x if extension_point_id == "my.ep" else []
+
+        events = []
+
+        def listener(registry, event):
+            events.append(event)
+
+        a, b, c, d, e = [Provider(x=[i] * (i % 3)) for i in range(5)]
+        a.x = [0]
+        self.registry.add_provider(a)
+        extensions = self.registry.get_extensions("my.ep")
+        self.registry.add_extension_point_listener(listener, "my.ep")
+
+        # One event for all of the providers' contributions.
+        self.registry.add_providers([b, c, d, e])
+        self.assertEqual(1, len(events))
+        self.assertEqual([1, 2, 2, 4], events[0].added)
+        self.assertEqual(1, events[0].index)
+
+        extensions[events[0].index : events[0].index] = events[0].added
+        self.assertEqual(extensions, self.registry.get_extensions("my.ep"))
+
+        # Removing providers that aren't next to each other removes each run
+        # of their contributions separately (without touching the
+        # contributions in between).
+        self.registry.remove_providers([b, e])
+        self.assertEqual(3, len(events))
+        self.assertEqual([1], events[1].removed)
+        self.assertEqual(1, events[1].index)
+        self.assertEqual([4], events[2].removed)
+        self.assertEqual(3, events[2].index)
+
+        for event in events[1:]:
+            self.assertEqual([], event.added)
+            del extensions[event.index : event.index + len(event.removed)]
+
+        self.assertEqual(extensions, self.registry.get_extensions("my.ep"))
+        self.assertEqual([a, c, d], self.registry.get_providers())
+
+        # Nothing is removed if any of the providers isn't in the registry.
+        with self.assertRaises(ValueError):
+            self.registry.remove_providers([c, b])
+
+        self.assertEqual([a, c, d], self.registry.get_providers())
+
     def test_add_provider(self):
         """add provider"""
 
@@ -10,13 +10,24 @@
 """Tests for the service registry."""
 
 # Standard library imports.
+import asyncio
+import concurrent.futures
 import sys
+import threading
+import time
 import unittest
 
-from traits.api import HasTraits, Int, Interface, provides
+from traits.api import HasTraits, Int, Interface, provides, Str
+from traits.observation.api import pop_exception_handler, push_exception_handler
 
 # Enthought library imports.
-from envisage.api import Application, NoSuchServiceError, ServiceRegistry
+from envisage.api import (
+    Application,
+    ImportManager,
+    NoSuchServiceError,
+    ServiceMetrics,
+    ServiceRegistry,
+)
 
 # This module's package.
 PKG = "envisage.tests"
@@ -297,6 +308,127 @@ class ServiceRegistryTestCase(unittest.TestCase):
         services = self.service_registry.get_services(IBar, "price <= 100")
         self.assertEqual([], services)
 
+    def test_get_services_preserves_registration_order(self):
+        class IFoo(Interface):
+            pass
+
+        class IBar(Interface):
+            pass
+
+        @provides(IFoo, IBar)
+        class Foo(HasTraits):
+            pass
+
+        foos = [Foo() for _ in range(5)]
+        service_ids = []
+        for foo in foos:
+            service_ids.append(self.service_registry.register_service(IFoo, foo))
+            self.service_registry.register_service(IBar, foo)
+
+        self.assertEqual(foos, self.service_registry.get_services(IFoo))
+
+        # Unregistering a service leaves the order of the others unchanged.
+        self.service_registry.unregister_service(service_ids[2])
+        del foos[2]
+        self.assertEqual(foos, self.service_registry.get_services(IFoo))
+
+        # Services registered against other protocols are unaffected.
+        self.assertEqual(5, len(self.service_registry.get_services(IBar)))
+
+        # Unregistering the last service for a protocol leaves nothing behind.
+        for service_id in service_ids[:2] + service_ids[3:]:
+            self.service_registry.unregister_service(service_id)
+        self.assertEqual([], self.service_registry.get_services(IFoo))
+
+    def test_factory_that_unregisters_a_service(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        foo = Foo()
+
+        def foo_factory(**properties):
+            self.service_registry.unregister_service(foo_id)
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory)
+        foo_id = self.service_registry.register_service(IFoo, foo)
+
+        services = self.service_registry.get_services(IFoo)
+        self.assertEqual(1, len(services))
+        self.assertIsNot(foo, services[0])
+
+    def test_get_services_with_callable_query(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        foo = Foo(price=100)
+        self.service_registry.register_service(IFoo, foo)
+
+        # Properties take precedence over the object's attributes.
+        goo = Foo(price=10)
+        self.service_registry.register_service(IFoo, goo, {"price": 200})
+
+        services = self.service_registry.get_services(
+            IFoo, lambda service: service["price"] <= 100
+        )
+        self.assertEqual([foo], services)
+
+        services = self.service_registry.get_services(
+            IFoo, lambda service: service["price"] >= 100
+        )
+        self.assertEqual([foo, goo], services)
+
+        # A query that fails to evaluate doesn't match.
+        services = self.service_registry.get_services(
+            IFoo, lambda service: service["color"] == "red"
+        )
+        self.assertEqual([], services)
+
+    def test_get_services_with_invalid_query(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        self.service_registry.register_service(IFoo, Foo())
+
+        services = self.service_registry.get_services(IFoo, "price <=")
+        self.assertEqual([], services)
+
+    def test_get_services_with_nested_scope_query(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        foo = Foo()
+        self.service_registry.register_service(
+            IFoo, foo, {"sizes": [1, 2, 3], "limit": 2}
+        )
+
+        # The generator expression refers to a name from the namespace.
+        services = self.service_registry.get_services(
+            IFoo, "any(size > limit for size in sizes)"
+        )
+        self.assertEqual([foo], services)
+
+        services = self.service_registry.get_services(
+            IFoo, "all(size > limit for size in sizes)"
+        )
+        self.assertEqual([], services)
+
     def test_get_service(self):
         """get service"""
 
@@ -470,6 +602,188 @@ class ServiceRegistryTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.service_registry.unregister_service(-1)
 
+    def test_cached_lookups(self):
+        self.service_registry.service_registry.cache_lookups = True
+
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        calls = []
+
+        def foo_factory(**properties):
+            calls.append(properties)
+            return Foo(**properties)
+
+        foo_id = self.service_registry.register_service(
+            IFoo, foo_factory, {"price": 100}
+        )
+        services = self.service_registry.get_services(IFoo, "price <= 100")
+        self.assertEqual(1, len(services))
+
+        # The result of the same lookup is cached...
+        self.assertEqual(
+            services, self.service_registry.get_services(IFoo, "price <= 100")
+        )
+        self.assertEqual(1, len(calls))
+
+        # ... and the caller gets its own copy of it.
+        services.clear()
+        self.assertEqual(
+            1, len(self.service_registry.get_services(IFoo, "price <= 100"))
+        )
+
+        # Registering a service discards the cached results.
+        goo = Foo(price=50)
+        goo_id = self.service_registry.register_service(IFoo, goo)
+        services = self.service_registry.get_services(IFoo, "price <= 100")
+        self.assertEqual(2, len(services))
+        self.assertIs(goo, services[1])
+
+        # So does setting the properties of a service.
+        self.service_registry.set_service_properties(goo_id, {"price": 500})
+        services = self.service_registry.get_services(IFoo, "price <= 100")
+        self.assertEqual(1, len(services))
+
+        # And so does unregistering one.
+        self.service_registry.unregister_service(foo_id)
+        services = self.service_registry.get_services(IFoo, "price <= 100")
+        self.assertEqual([], services)
+
+    def test_cached_lookups_are_per_protocol(self):
+        self.service_registry.service_registry.cache_lookups = True
+
+        class IFoo(Interface):
+            pass
+
+        class IBar(Interface):
+            pass
+
+        @provides(IFoo, IBar)
+        class Foo(HasTraits):
+            pass
+
+        foo = Foo()
+        self.service_registry.register_service(IFoo, foo)
+        self.assertEqual([foo], self.service_registry.get_services(IFoo))
+        self.assertEqual([], self.service_registry.get_services(IBar))
+
+        # Lookups with different arguments are cached separately.
+        self.assertEqual([], self.service_registry.get_services(IFoo, "False"))
+
+        bar = Foo()
+        self.service_registry.register_service(IBar, bar)
+        self.assertEqual([foo], self.service_registry.get_services(IFoo))
+        self.assertEqual([bar], self.service_registry.get_services(IBar))
+
+    def test_cached_lookups_at_construction(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+        service_registry = ServiceRegistry(cache_lookups=True)
+
+        self.assertEqual([], service_registry.get_services("acme.IFoo"))
+
+    def test_cached_lookups_with_asynchronous_factory(self):
+        self.service_registry.service_registry.cache_lookups = True
+
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        async def foo_factory(**properties):
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory)
+
+        # Synchronous lookups skip the service until it has been created...
+        self.assertEqual([], self.service_registry.get_services(IFoo))
+        foo = asyncio.run(self.service_registry.aget_service(IFoo))
+
+        # ... after which the results they cached are out of date.
+        self.assertEqual([foo], self.service_registry.get_services(IFoo))
+
+    def test_cached_lookups_with_callable_query(self):
+        service_registry = self.service_registry.service_registry
+        service_registry.cache_lookups = True
+
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        foo = Foo(price=100)
+        service_registry.register_service(IFoo, foo)
+
+        # Each lambda is a different query, so caching them would only fill
+        # up the cache.
+        for _ in range(10):
+            services = service_registry.get_services(
+                IFoo, lambda namespace: namespace["price"] <= 100
+            )
+            self.assertEqual([foo], services)
+
+        self.assertEqual({}, service_registry._lookup_cache)
+
+    def test_factory_called_once_by_concurrent_lookups(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def foo_factory(**properties):
+            calls.append(properties)
+            # Give the other threads every chance to call the factory too.
+            time.sleep(0.05)
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory)
+
+        def get_service():
+            barrier.wait()
+            return self.service_registry.get_service(IFoo)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(get_service) for _ in range(4)]
+            services = [future.result() for future in futures]
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(1, len(set(map(id, services))))
+        self.assertIsInstance(services[0], Foo)
+
+    def test_concurrent_registration(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        def register_services():
+            return [
+                self.service_registry.register_service(IFoo, Foo()) for _ in range(50)
+            ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(register_services) for _ in range(4)]
+            service_ids = [id for future in futures for id in future.result()]
+
+        self.assertEqual(200, len(set(service_ids)))
+        self.assertEqual(200, len(self.service_registry.get_services(IFoo)))
+
     def test_minimize_and_maximize(self):
         """minimize and maximize"""
 
@@ -499,3 +813,407 @@ class ServiceRegistryTestCase(unittest.TestCase):
         self.assertNotEqual(None, service)
         self.assertEqual(Foo, type(service))
         self.assertEqual(z, service)
+
+    def test_minimize_and_maximize_with_ties(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        foos = [Foo(price=price) for price in [10, 5, 100, 5, 100]]
+        for foo in foos:
+            self.service_registry.register_service(IFoo, foo)
+
+        # The first of the equally good services is returned, just as it is
+        # first in the full list of services.
+        service = self.service_registry.get_service(IFoo, minimize="price")
+        self.assertIs(foos[1], service)
+        services = self.service_registry.get_services(IFoo, minimize="price")
+        self.assertIs(foos[1], services[0])
+
+        service = self.service_registry.get_service(IFoo, maximize="price")
+        self.assertIs(foos[2], service)
+        services = self.service_registry.get_services(IFoo, maximize="price")
+        self.assertIs(foos[2], services[0])
+
+    def test_get_service_does_not_call_unneeded_factories(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        calls = []
+
+        def foo_factory(**properties):
+            calls.append(properties)
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory, {"n": 1})
+        self.service_registry.register_service(IFoo, foo_factory, {"n": 2})
+
+        # Only the first service is needed.
+        self.service_registry.get_service(IFoo)
+        self.assertEqual([{"n": 1}], calls)
+
+    def test_factory_ruled_out_by_properties_is_not_called(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        calls = []
+
+        def foo_factory(**properties):
+            calls.append(properties)
+            return Foo(**properties)
+
+        self.service_registry.register_service(IFoo, foo_factory, {"price": 10})
+        self.service_registry.register_service(IFoo, foo_factory, {"price": 200})
+
+        services = self.service_registry.get_services(IFoo, "price <= 100")
+        self.assertEqual(1, len(services))
+        self.assertEqual([{"price": 10}], calls)
+
+    def test_factory_is_called_if_query_uses_a_builtin_name(self):
+        class IFoo(Interface):
+            type = Str
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            type = Str
+
+        self.service_registry.register_service(IFoo, lambda **properties: Foo(type="a"))
+
+        # 'type' is an attribute of the service, not the builtin.
+        services = self.service_registry.get_services(IFoo, "type == 'a'")
+        self.assertEqual(1, len(services))
+
+    def test_factory_is_called_for_callable_query(self):
+        class IFoo(Interface):
+            type = Str
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            type = Str
+
+        for i in range(2):
+            self.service_registry.register_service(
+                IFoo, lambda **properties: Foo(type="a")
+            )
+
+        services = self.service_registry.get_services(
+            IFoo, lambda namespace: "type" in namespace
+        )
+        self.assertEqual(2, len(services))
+
+        services = self.service_registry.get_services(
+            IFoo, lambda namespace: namespace.get("type") == "a"
+        )
+        self.assertEqual(2, len(services))
+
+    def test_factory_is_called_if_query_needs_its_service(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        def foo_factory(**properties):
+            return Foo(price=properties["cost"] * 2)
+
+        self.service_registry.register_service(IFoo, foo_factory, {"cost": 40})
+
+        # The query refers to an attribute of the service, so the factory
+        # has to be called to evaluate it.
+        services = self.service_registry.get_services(IFoo, "cost <= 50 and price > 50")
+        self.assertEqual(1, len(services))
+        self.assertEqual(80, services[0].price)
+
+    def test_asynchronous_service_factory(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        calls = []
+
+        async def foo_factory(**properties):
+            calls.append(properties)
+            await asyncio.sleep(0.01)
+            return Foo(**properties)
+
+        self.service_registry.register_service(IFoo, foo_factory, {"price": 100})
+
+        # Synchronous lookups ignore the service until it has been created.
+        self.assertIsNone(self.service_registry.get_service(IFoo))
+
+        async def get_services_concurrently():
+            return await asyncio.gather(
+                self.service_registry.aget_service(IFoo),
+                self.service_registry.aget_service(IFoo, "price <= 100"),
+                self.service_registry.aget_services(IFoo),
+            )
+
+        foo, goo, services = asyncio.run(get_services_concurrently())
+
+        # The factory is only awaited once, and everybody gets its service.
+        self.assertEqual(1, len(calls))
+        self.assertIsInstance(foo, Foo)
+        self.assertIs(foo, goo)
+        self.assertEqual([foo], services)
+
+        # Once created, the service is found by synchronous lookups too.
+        self.assertIs(foo, self.service_registry.get_service(IFoo))
+
+    def test_asynchronous_lookup_with_synchronous_factory(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        foo = Foo()
+        self.service_registry.register_service(IFoo, foo)
+        self.service_registry.register_service(IFoo, lambda **properties: Foo())
+
+        services = asyncio.run(self.service_registry.aget_services(IFoo))
+        self.assertEqual(2, len(services))
+        self.assertIs(foo, services[0])
+        self.assertIsInstance(services[1], Foo)
+
+        service = asyncio.run(self.service_registry.aget_service(IFoo))
+        self.assertIs(foo, service)
+
+    def test_failing_asynchronous_service_factory(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        attempts = []
+
+        async def foo_factory(**properties):
+            attempts.append(properties)
+            if len(attempts) == 1:
+                raise RuntimeError("not yet")
+
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.service_registry.aget_service(IFoo))
+
+        # The factory is tried again by the next lookup.
+        service = asyncio.run(self.service_registry.aget_service(IFoo))
+        self.assertIsInstance(service, Foo)
+        self.assertEqual(2, len(attempts))
+
+    def test_transient_service_is_created_for_every_lookup(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        self.service_registry.register_service(IFoo, Foo, lifetime="transient")
+
+        service = self.service_registry.get_service(IFoo)
+        self.assertIsInstance(service, Foo)
+        self.assertIsNot(service, self.service_registry.get_service(IFoo))
+
+    def test_scoped_service_is_created_once_per_scope(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        disposed = []
+        self.service_registry.register_service(
+            IFoo, Foo, lifetime="scoped", dispose=disposed.append
+        )
+
+        # Outside of a scope the service is ignored.
+        self.assertIsNone(self.service_registry.get_service(IFoo))
+
+        with self.service_registry.create_scope():
+            foo = self.service_registry.get_service(IFoo)
+            self.assertIsInstance(foo, Foo)
+            self.assertIs(foo, self.service_registry.get_service(IFoo))
+
+            with self.service_registry.create_scope():
+                goo = self.service_registry.get_service(IFoo)
+                self.assertIsNot(foo, goo)
+
+            # Closing a scope disposes of its services only.
+            self.assertEqual([goo], disposed)
+
+        self.assertEqual([goo, foo], disposed)
+
+        # A closed scope can't create any more services.
+        scope = self.service_registry.create_scope()
+        scope.close()
+        with scope.activate():
+            with self.assertRaises(ValueError):
+                self.service_registry.get_service(IFoo)
+
+    def test_asynchronous_scoped_service(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        async def foo_factory(**properties):
+            return Foo()
+
+        self.service_registry.register_service(IFoo, foo_factory, lifetime="scoped")
+
+        async def get_services():
+            with self.service_registry.create_scope():
+                return await asyncio.gather(
+                    self.service_registry.aget_service(IFoo),
+                    self.service_registry.aget_service(IFoo),
+                )
+
+        foo, goo = asyncio.run(get_services())
+        self.assertIsInstance(foo, Foo)
+        self.assertIs(foo, goo)
+
+        self.assertIsNone(asyncio.run(self.service_registry.aget_service(IFoo)))
+
+    def test_singleton_service_is_disposed_when_unregistered(self):
+        class IFoo(Interface):
+            pass
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            pass
+
+        disposed = []
+        foo_id = self.service_registry.register_service(
+            IFoo, Foo, dispose=disposed.append
+        )
+        goo_id = self.service_registry.register_service(
+            IFoo, Foo, dispose=disposed.append
+        )
+
+        foo = self.service_registry.get_service(IFoo)
+        self.service_registry.unregister_service(foo_id)
+        self.assertEqual([foo], disposed)
+
+        # A service whose factory was never called has nothing to dispose of.
+        self.service_registry.unregister_service(goo_id)
+        self.assertEqual([foo], disposed)
+
+    def test_unknown_lifetime(self):
+        class IFoo(Interface):
+            pass
+
+        with self.assertRaises(ValueError):
+            self.service_registry.register_service(IFoo, object(), lifetime="eternal")
+
+    def test_resolve_service(self):
+        service_id = self.service_registry.register_service(
+            HasTraits, service_factory, {"price": 100}
+        )
+
+        # The factory is called by the first request for the service...
+        service = self.service_registry.resolve_service(service_id)
+        self.assertEqual(100, service.price)
+
+        # ... and not again.
+        self.assertIs(service, self.service_registry.resolve_service(service_id))
+        self.assertIs(service, self.service_registry.get_service(HasTraits))
+
+        self.service_registry.unregister_service(service_id)
+        with self.assertRaises(ValueError):
+            self.service_registry.resolve_service(service_id)
+
+    def test_metrics(self):
+        class IFoo(Interface):
+            price = Int
+
+        @provides(IFoo)
+        class Foo(HasTraits):
+            price = Int
+
+        metrics = ServiceMetrics()
+        self.service_registry.service_registry.metrics = metrics
+
+        self.service_registry.register_service(IFoo, Foo, {"price": 100})
+        self.service_registry.register_service(IFoo, Foo(price=200))
+
+        self.service_registry.get_services(IFoo, "price > 150")
+        self.service_registry.get_service(IFoo)
+
+        (timings,) = metrics.dump().values()
+        self.assertEqual(2, timings["lookups"]["count"])
+        self.assertEqual(1, timings["factories"]["count"])
+
+        # The factory's properties alone rule it out of the query, so the
+        # query is only evaluated over the other service.
+        self.assertEqual(1, timings["queries"]["count"])
+        self.assertEqual(
+            1, sum(count for bound, count in timings["queries"]["buckets"])
+        )
+
+        metrics.reset()
+        self.assertEqual({}, metrics.dump())
+
+    def test_imported_symbols_are_cached(self):
+        imported = []
+
+        class CountingImportManager(ImportManager):
+            def import_symbol(self, symbol_path):
+                imported.append(symbol_path)
+                return super().import_symbol(symbol_path)
+
+        service_registry = ServiceRegistry(import_manager=CountingImportManager())
+        factory = PKG + ".test_service_registry.service_factory"
+        service_ids = [
+            service_registry.register_service(
+                "traits.api.HasTraits", factory, {"price": price}
+            )
+            for price in [100, 200]
+        ]
+
+        for i in range(3):
+            services = service_registry.get_services("traits.api.HasTraits")
+            self.assertEqual([100, 200], [service.price for service in services])
+
+        # The protocol and the factory are each imported once.
+        self.assertEqual(["traits.api.HasTraits", factory], imported)
+
+        # Unregistering all of the services forgets the protocol.
+        for service_id in service_ids:
+            service_registry.unregister_service(service_id)
+
+        service_registry.register_service("traits.api.HasTraits", HasTraits())
+        service_registry.get_services("traits.api.HasTraits")
+        self.assertEqual(
+            ["traits.api.HasTraits", factory, "traits.api.HasTraits"], imported
+        )
+
+    def test_application_shares_its_import_manager(self):
+        application = Application()
+
+        self.assertIs(
+            application._import_manager, application.service_registry.import_manager
+        )
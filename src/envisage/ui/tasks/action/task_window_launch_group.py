@@ -42,12 +42,8 @@ class TaskWindowLaunchAction(TaskAction):
         """Name the action (unless a name has already been assigned)."""
         task = event.new
         if task and not self.name:
-            name = ""
-            for factory in task.window.application.task_factories:
-                if factory.id == self.task_id:
-                    name = factory.name
-                    break
-            self.name = name
+            factory = task.window.application._get_task_factory(self.task_id)
+            self.name = factory.name if factory is not None else ""
 
 
 class TaskWindowLaunchGroup(Group):
@@ -27,7 +27,7 @@ from traits.api import (
 from traits.etsconfig.api import ETSConfig
 
 # Enthought library imports.
-from envisage.api import Application, ExtensionPoint
+from envisage.api import Application, ExtensionPoint, get_extension_by_key
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -82,7 +82,7 @@ class TasksApplication(Application):
 
     #: Contributed task factories. This attribute is primarily for run-time
     #: inspection; to instantiate a task, use the 'create_task' method.
-    task_factories = ExtensionPoint(id=TASK_FACTORIES)
+    task_factories = ExtensionPoint(id=TASK_FACTORIES, key="id")
 
     #: Contributed task extensions.
     task_extensions = ExtensionPoint(id=TASK_EXTENSIONS)
@@ -346,10 +346,15 @@ class TasksApplication(Application):
 
     def _get_task_factory(self, id):
         """Returns the TaskFactory with the specified ID, or None."""
-        for factory in self.task_factories:
-            if factory.id == id:
-                return factory
-        return None
+        try:
+            return get_extension_by_key(self, "task_factories", id)
+
+        # A subclass may redeclare the extension point without a key.
+        except ValueError:
+            for factory in self.task_factories:
+                if factory.id == id:
+                    return factory
+            return None
 
     def _prepare_exit(self):
         """Called immediately before the extant windows are destroyed and the
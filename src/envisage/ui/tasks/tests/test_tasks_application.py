@@ -19,11 +19,11 @@ from importlib.resources import files
 # Enthought library imports.
 from pyface.gui import GUI
 from pyface.i_gui import IGUI
-from traits.api import Event, HasTraits, provides
+from traits.api import Event, HasTraits, List, provides
 
-from envisage.api import Plugin
+from envisage.api import ExtensionPoint, Plugin, TASKS
 from envisage.tests.support import requires_gui
-from envisage.ui.tasks.api import TasksApplication, TasksPlugin
+from envisage.ui.tasks.api import TaskFactory, TasksApplication, TasksPlugin
 from envisage.ui.tasks.tasks_application import DEFAULT_STATE_FILENAME
 
 
@@ -60,6 +60,21 @@ class LifecycleRecordingPlugin(Plugin):
         self.stopped = True
 
 
+class TaskFactoryPlugin(Plugin):
+    """
+    Plugin that contributes task factories.
+    """
+
+    #: Contributed task factories.
+    tasks = List(contributes_to=TASKS)
+
+    def _tasks_default(self):
+        return [
+            TaskFactory(id="a", name="A"),
+            TaskFactory(id="b", name="B"),
+        ]
+
+
 class LifecycleRecordingGUI(GUI):
     """
     GUI subclass that adds events for watching start and stop of event loop.
@@ -208,3 +223,19 @@ class TestTasksApplication(unittest.TestCase):
                 (app, "stopped"),
             ],
         )
+
+    def test_get_task_factory(self):
+        app = create_tasks_application(plugins=[TaskFactoryPlugin()])
+
+        self.assertEqual("B", app._get_task_factory("b").name)
+        self.assertIsNone(app._get_task_factory("c"))
+
+    def test_get_task_factory_without_key(self):
+        # Subclasses may redeclare the extension point without a key.
+        class MyTasksApplication(TasksApplication):
+            task_factories = ExtensionPoint(id=TASKS)
+
+        app = MyTasksApplication(plugins=[TasksPlugin(), TaskFactoryPlugin()])
+
+        self.assertEqual("B", app._get_task_factory("b").name)
+        self.assertIsNone(app._get_task_factory("c"))
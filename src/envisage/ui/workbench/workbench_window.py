@@ -173,6 +173,29 @@ class WorkbenchWindow(pyface.WorkbenchWindow):
     # 'IServiceRegistry' interface.
     ###########################################################################
 
+    async def aget_service(self, protocol, query="", minimize="", maximize=""):
+        """Return at most one service that matches the specified query."""
+
+        service = await self.service_registry.aget_service(
+            protocol, query, minimize, maximize
+        )
+
+        return service
+
+    async def aget_services(self, protocol, query="", minimize="", maximize=""):
+        """Return all services that match the specified query."""
+
+        services = await self.service_registry.aget_services(
+            protocol, query, minimize, maximize
+        )
+
+        return services
+
+    def create_scope(self):
+        """Create a scope for the services with a 'scoped' lifetime."""
+
+        return self.service_registry.create_scope()
+
     def get_service(self, protocol, query="", minimize="", maximize=""):
         """Return at most one service that matches the specified query."""
 
@@ -194,13 +217,22 @@ class WorkbenchWindow(pyface.WorkbenchWindow):
 
         return services
 
-    def register_service(self, protocol, obj, properties=None):
+    def register_service(
+        self, protocol, obj, properties=None, lifetime="singleton", dispose=None
+    ):
         """Register a service."""
 
-        service_id = self.service_registry.register_service(protocol, obj, properties)
+        service_id = self.service_registry.register_service(
+            protocol, obj, properties, lifetime, dispose
+        )
 
         return service_id
 
+    def resolve_service(self, service_id):
+        """Return the service with the specified id, creating it if need be."""
+
+        return self.service_registry.resolve_service(service_id)
+
     def set_service_properties(self, service_id, properties):
         """Set the dictionary of properties associated with a service."""
 
@@ -241,6 +273,8 @@ class WorkbenchWindow(pyface.WorkbenchWindow):
             protocol=service_offer.protocol,
             obj=service_offer.factory,
             properties=service_offer.properties,
+            lifetime=service_offer.lifetime,
+            dispose=service_offer.dispose,
         )
 
         return service_id